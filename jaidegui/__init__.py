@@ -1,3 +1,5 @@
-""" jgui init script. """
-from .gui import JaideGUI
-__all__ = ['JaideGUI']
+""" jgui init script.
+
+The GUI isn't imported here, so that the jaidegui-run batch runner never pays
+for importing Tkinter. Use 'from jaidegui.gui import JaideGUI' for the GUI.
+"""
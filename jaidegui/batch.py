@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+""" The headless batch runner for Jaide GUI templates.
+
+Purpose: This file provides the jaidegui-run command, which runs the job saved
+in a Jaide GUI template without opening the GUI, for use from cron jobs and
+CI. The template is turned into a job by jaidegui.job exactly as the GUI does
+it, and run by the same WorkerThread and ExecutionPool, on the template's
+engine, or the thread engine if it doesn't have one, so it can run against
+many devices at once. The output of each
+device is printed to stdout as it finishes (and written to file(s) if the
+template, or the command line, asks for it), messages go to stderr, and the
+exit status says whether every device succeeded, followed by how long the
+devices took. Tkinter is never imported.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import argparse
+import collections
+import getpass
+import os
+import sys
+import Queue
+
+from job import build_job, job_hosts, read_template, INPUT_OPTIONS
+from worker_thread import WorkerThread
+from device_result import DeviceResult
+from execution_pool import ExecutionPool
+from concurrency import parse_concurrency
+from watchdog import parse_deadline
+import result_store
+import checkpoint
+from run_stats import RunStats
+
+# Exit statuses.
+EXIT_OK = 0
+# At least one device failed, or couldn't be connected to.
+EXIT_FAILED = 1
+# The template or the command line was invalid.
+EXIT_USAGE = 2
+# Stopped with Ctrl-C.
+EXIT_STOPPED = 130
+# Environment variable the password can be passed in, rather than saving it
+# in the template or putting it on the command line.
+PASSWORD_VARIABLE = "JAIDEGUI_PASSWORD"
+
+
+def parse_args(argv):
+    """ Parse the command line arguments.
+
+    @param argv: The arguments, without the program name.
+    @type argv: list
+
+    @returns: The parsed arguments.
+    @rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        prog="jaidegui-run", description="Run the job saved in a Jaide GUI "
+        "template, without the GUI. Options given here override the ones in "
+        "the template. The password can also be given in the %s environment "
+        "variable." % PASSWORD_VARIABLE)
+    parser.add_argument("template", nargs="?", help="The template file to "
+                        "run.")
+    parser.add_argument("-i", "--ip", help="IP(s) or hostname(s), comma "
+                        "separated, or a file of them.")
+    parser.add_argument("-u", "--username")
+    parser.add_argument("-p", "--password")
+    parser.add_argument("--port", type=int, default=22)
+    parser.add_argument("--conn-timeout", type=int, default=5,
+                        help="Connection timeout in seconds.")
+    parser.add_argument("--timeout", type=int, help="Session timeout in "
+                        "seconds.")
+    parser.add_argument("-c", "--concurrency", help="Devices to run against "
+                        "at once: a number, 'auto' or 'auto:<max>'.")
+    parser.add_argument("-e", "--engine", choices=["process", "thread"],
+                        help="Run devices on a pool of threads or of "
+                        "processes. Defaults to the template's Engine, or "
+                        "threads if it has none.")
+    parser.add_argument("-w", "--write-to-file", help="Also write the output "
+                        "to this file.")
+    parser.add_argument("-s", "--style", choices=["single", "multiple"],
+                        help="Write a single file, or one file per device.")
+    parser.add_argument("--deadline", help="Seconds each device has before "
+                        "it is abandoned as timed out: a number, 'auto' or "
+                        "'off'.")
+    parser.add_argument("--preflight", action="store_true", help="Check "
+                        "each device accepts a connection on the port first, "
+                        "and skip the ones that don't.")
+    parser.add_argument("--timings", metavar="FILE", help="Write the "
+                        "timings of the run, and of each device, to this "
+                        "file as JSON.")
+    parser.add_argument("--trace", metavar="FILE", help="Write a timeline "
+                        "of the run to this file, in the Trace Event Format "
+                        "used by chrome://tracing and Perfetto.")
+    parser.add_argument("--checkpoint", metavar="FILE", help="Journal the "
+                        "outcome of each device to this file, so the run can "
+                        "be resumed with --resume if it is cut short.")
+    parser.add_argument("--resume", metavar="FILE", help="Resume the run "
+                        "journalled to this checkpoint, running only the "
+                        "devices that haven't finished or didn't succeed, "
+                        "instead of running a template.")
+    parser.add_argument("--delta", action="store_true", help="With the "
+                        "Interface Errors option, report only the error "
+                        "counters that went up since the last run.")
+    parser.add_argument("--no-record", action="store_true", help="Don't "
+                        "record the results in the result store.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Don't "
+                        "print the output of each device to stdout.")
+    args = parser.parse_args(argv)
+    if (args.template is None) == (args.resume is None):
+        parser.error("give either a template or --resume, but not both.")
+    if args.resume and (args.ip or args.checkpoint):
+        parser.error("--ip and --checkpoint can't be used with --resume.")
+    return args
+
+
+def load_options(args):
+    """ Read the template, and apply the command line overrides to it.
+
+    Purpose: When resuming, the options are read from the checkpoint instead,
+           | with the IP option set to the devices left to run.
+
+    @param args: The parsed command line arguments.
+    @type args: argparse.Namespace
+
+    @returns: The value of each template option.
+    @rtype: dict
+
+    @raises IOError: if the template couldn't be read.
+    @raises ValueError: if the template isn't valid.
+    """
+    if args.resume:
+        options, hosts, remaining = checkpoint.load(args.resume)
+        options["IP"] = ",".join(remaining)
+    else:
+        options = read_template(args.template)
+    overrides = {
+        "IP": args.ip,
+        "Username": args.username,
+        "Password": args.password or os.environ.get(PASSWORD_VARIABLE),
+        "Timeout": args.timeout,
+        "Concurrency": args.concurrency,
+        "Deadline": args.deadline,
+        "Engine": args.engine
+    }
+    for key, value in overrides.iteritems():
+        if value is not None:
+            options[key] = str(value)
+    if args.write_to_file:
+        options["WriteToFileBool"] = "1"
+        options["WriteToFileLoc"] = args.write_to_file
+    if args.preflight:
+        options["Preflight"] = "1"
+    if args.style:
+        options["SingleOrMultipleFiles"] = args.style[0]
+    if not options.get("Password") and sys.stdin.isatty():
+        options["Password"] = getpass.getpass()
+    return options
+
+
+def validate(options):
+    """ Check the options make a runnable job.
+
+    @param options: The value of each template option.
+    @type options: dict
+
+    @returns: A description of the first problem found, or None.
+    @rtype: str
+    """
+    if not options.get("IP"):
+        return "No IP address or IP address list file was given."
+    if not options.get("Username") or not options.get("Password"):
+        return "Both a username and a password are needed."
+    if (options.get("WriteToFileBool", "0") != "0" and
+            not options.get("WriteToFileLoc")):
+        return "When writing to a file, a filename must be specified."
+    if (options.get("Option") in INPUT_OPTIONS and
+            not options.get("FirstArgument") and
+            options.get("CommitBlank", "0") == "0"):
+        return ("The '%s' command needs extra input, which the template "
+                "doesn't have." % options.get("Option"))
+    if options.get("Engine", "thread").lower() not in ("process", "thread"):
+        return ("The engine must be 'process' or 'thread', not '%s'." %
+                options.get("Engine"))
+    try:
+        parse_concurrency(options.get("Concurrency", "auto"))
+        parse_deadline(options.get("Deadline", "auto"), 0,
+                       options.get("Timeout", 300))
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def main(argv=None):
+    """ Run a template, printing each device's output as it finishes.
+
+    @param argv: The command line arguments, defaults to sys.argv[1:].
+    @type argv: list
+
+    @returns: The exit status, see the EXIT_ constants.
+    @rtype: int
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        options = load_options(args)
+    except (IOError, ValueError, KeyError) as e:
+        sys.stderr.write("Could not open %s %s. Error:\n%s\n" %
+                         ("checkpoint" if args.resume else "template",
+                          args.resume or args.template, str(e)))
+        return EXIT_USAGE
+    if args.resume and not options["IP"]:
+        sys.stderr.write("Every device in %s has already succeeded.\n" %
+                         args.resume)
+        return EXIT_OK
+    problem = validate(options)
+    if problem is None:
+        try:
+            function, argsToPass = build_job(options)
+        except ImportError as e:
+            problem = "Could not load jaide. Error:\n" + str(e)
+        except (KeyError, ValueError) as e:
+            problem = "Invalid template option: " + str(e)
+    checkpoint_file = args.resume or args.checkpoint or ""
+    if problem is None and args.checkpoint:
+        try:
+            checkpoint.Checkpoint.create(args.checkpoint, options,
+                                         job_hosts(options["IP"]))
+        except IOError as e:
+            problem = ("Could not start the checkpoint %s. Error:\n%s" %
+                       (args.checkpoint, str(e)))
+    if problem is not None:
+        sys.stderr.write(problem + "\n")
+        return EXIT_USAGE
+
+    stdout = Queue.Queue()
+    engine = options.get("Engine", "thread").lower()
+    pool = ExecutionPool(engine=engine)
+    write_to_file = (options.get("WriteToFileLoc", "")
+                     if options.get("WriteToFileBool", "0") != "0" else "")
+    thread = WorkerThread(
+        argsToPass=argsToPass,
+        sess_timeout=int(options.get("Timeout", 300)),
+        conn_timeout=args.conn_timeout,
+        port=args.port,
+        command=function,
+        stdout=stdout,
+        ip=options["IP"],
+        username=options["Username"].strip(),
+        password=options["Password"].strip(),
+        write_to_file=write_to_file,
+        wtf_style=options.get("SingleOrMultipleFiles", "s"),
+        pool=pool,
+        concurrency=options.get("Concurrency", "auto"),
+        engine=engine,
+        # There is only the one run, so no session would ever be reused.
+        reuse_sessions=False,
+        preflight=options.get("Preflight", "0") != "0",
+        deadline=options.get("Deadline", "auto"),
+        checkpoint_file=checkpoint_file,
+        record=(not args.no_record and
+                options.get("RecordResults", "1") != "0"),
+        operation=options.get("Option", ""),
+        delta=args.delta or options.get("InterfaceDelta", "0") != "0",
+        trace_file=args.trace or (options.get("TraceLoc", "")
+                                  if options.get("TraceBool", "0") != "0"
+                                  else "")
+    )
+    thread.daemon = True
+    thread.start()
+    statuses = collections.Counter()
+    stats = RunStats()
+    try:
+        while thread.is_alive() or not stdout.empty():
+            try:
+                output = stdout.get(timeout=0.5)
+            except Queue.Empty:
+                continue
+            if isinstance(output, DeviceResult):
+                statuses[output.status] += 1
+                stats.add(output)
+                if not args.quiet:
+                    sys.stdout.write(output.output)
+                    sys.stdout.flush()
+            else:
+                sys.stderr.write(output + "\n")
+    except KeyboardInterrupt:
+        sys.stderr.write("Stopping Jaide...\n")
+        thread.kill_proc()
+        thread.join()
+        pool.shutdown()
+        result_store.store.flush()
+        return EXIT_STOPPED
+    thread.join()
+    pool.shutdown()
+    result_store.store.flush()
+    if result_store.store.error:
+        sys.stderr.write("Could not record the results. Error:\n%s\n" %
+                         result_store.store.error)
+    sys.stderr.write("%d device(s): %d succeeded, %d failed, %d couldn't be "
+                     "connected to, %d timed out.\n" %
+                     (sum(statuses.values()), statuses[DeviceResult.OK],
+                      statuses[DeviceResult.ERROR],
+                      statuses[DeviceResult.CONN_ERROR],
+                      statuses[DeviceResult.TIMEOUT]))
+    sys.stderr.write(stats.summary())
+    if args.timings:
+        try:
+            stats.export(args.timings)
+        except IOError as e:
+            sys.stderr.write("Could not write the timings to %s. Error:\n%s\n"
+                             % (args.timings, str(e)))
+    if (statuses[DeviceResult.ERROR] or statuses[DeviceResult.CONN_ERROR] or
+            statuses[DeviceResult.TIMEOUT]):
+        return EXIT_FAILED
+    return EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+""" Checkpoint Class.
+
+Purpose: This class keeps a journal of a run, so that a run cut short (by the
+GUI being closed, the script being stopped, or the machine going to sleep)
+can be resumed where it left off, instead of starting again from the first
+device. The journal is a small file of one JSON object per line. The first
+line holds the template options of the run (without the password) and the
+devices it runs against. The WorkerThread then appends a line with the status
+of each device as its result arrives, and flushes it straight away.
+
+Resuming a run runs it again against only the devices that haven't finished,
+or that didn't succeed, and appends to the same journal, so a run can be
+resumed as many times as it takes.
+
+The GUI journals every run to the checkpoints folder of jaidegui's data
+folder, keeping the most recent KEEP_CHECKPOINTS, and jaidegui-run journals
+to a file given on the command line.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+
+from device_result import DeviceResult
+
+# Journals kept in the checkpoints folder, oldest first to go.
+KEEP_CHECKPOINTS = 20
+
+
+class Checkpoint(object):
+
+    """ Append the outcome of each device of a run to its journal. """
+
+    def __init__(self, filepath):
+        """ Open an existing journal to append to.
+
+        @param filepath: The filepath of the journal.
+        @type filepath: str
+
+        @returns: None
+
+        @raises IOError: if the journal couldn't be opened.
+        """
+        self.filepath = filepath
+        # A run cut short may have left the last line half written, which
+        # must not run on into the next one.
+        with open(filepath, "rb") as journal:
+            journal.seek(0, os.SEEK_END)
+            partial = journal.tell() > 0
+            if partial:
+                journal.seek(-1, os.SEEK_END)
+                partial = journal.read(1) != "\n"
+        self._file = open(filepath, "ab")
+        if partial:
+            self._file.write("\n")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def create(filepath, options, hosts):
+        """ Start a new journal.
+
+        @param filepath: The filepath of the journal.
+        @type filepath: str
+        @param options: The template options of the run. The password is
+                      | left out.
+        @type options: dict
+        @param hosts: The IPs or hostnames the run is against.
+        @type hosts: list
+
+        @returns: None
+
+        @raises IOError: if the journal couldn't be written.
+        """
+        options = dict((key, value) for key, value in options.iteritems()
+                       if key != "Password")
+        with open(filepath, "wb") as journal:
+            json.dump({"options": options, "hosts": hosts,
+                       "started": time.time()}, journal)
+            journal.write("\n")
+
+    def record(self, result):
+        """ Append the outcome of a device.
+
+        @param result: The result of the device.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: None
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps({"host": result.host,
+                                         "status": result.status,
+                                         "time": result.finished}) + "\n")
+            self._file.flush()
+
+    def close(self):
+        """ Close the journal. """
+        with self._lock:
+            journal, self._file = self._file, None
+        if journal is not None:
+            journal.close()
+
+
+def load(filepath):
+    """ Read a journal.
+
+    @param filepath: The filepath of the journal.
+    @type filepath: str
+
+    @returns: The template options of the run, each as a string like those
+            | read from a template, the devices it runs against, and the
+            | hosts that haven't finished or didn't succeed, in the order
+            | they were given.
+    @rtype: tuple
+
+    @raises IOError: if the journal couldn't be read.
+    @raises ValueError: if it isn't a journal.
+    """
+    with open(filepath, "rb") as journal:
+        lines = journal.read().splitlines()
+    if not lines:
+        raise ValueError("%s is empty." % filepath)
+    header = json.loads(lines[0])
+    if "hosts" not in header:
+        raise ValueError("%s isn't a checkpoint journal." % filepath)
+    statuses = {}
+    for line in lines[1:]:
+        try:
+            outcome = json.loads(line)
+        except ValueError:
+            # The last line may be half written, if the run was cut short.
+            continue
+        statuses[outcome["host"]] = outcome["status"]
+    remaining = [host for host in header["hosts"]
+                 if statuses.get(host) != DeviceResult.OK]
+    # The GUI's checkboxes are saved as numbers.
+    options = dict((key, value if isinstance(value, basestring) else
+                    str(value))
+                   for key, value in header["options"].iteritems())
+    return options, header["hosts"], remaining
+
+
+def checkpoint_folder():
+    """ Return the folder the GUI keeps its journals in, creating it. """
+    from module_locator import data_path
+    return data_path("checkpoints")
+
+
+def new_checkpoint(options, hosts, folder=None):
+    """ Start a journal for a run in the checkpoints folder.
+
+    Purpose: Also removes the oldest journals, beyond KEEP_CHECKPOINTS.
+
+    @param options: The template options of the run.
+    @type options: dict
+    @param hosts: The IPs or hostnames the run is against.
+    @type hosts: list
+    @param folder: The folder to keep it in, defaults to checkpoint_folder().
+    @type folder: str
+
+    @returns: The filepath of the journal.
+    @rtype: str
+
+    @raises IOError: if the journal couldn't be written.
+    """
+    folder = folder or checkpoint_folder()
+    handle, filepath = tempfile.mkstemp(
+        prefix=time.strftime("%Y%m%d-%H%M%S-"), suffix=".jsonl", dir=folder)
+    os.close(handle)
+    Checkpoint.create(filepath, options, hosts)
+    for old in checkpoints(folder)[KEEP_CHECKPOINTS:]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+    return filepath
+
+
+def checkpoints(folder=None):
+    """ List the journals in the checkpoints folder, newest first. """
+    folder = folder or checkpoint_folder()
+    return sorted(glob.glob(os.path.join(folder, "*.jsonl")),
+                  key=os.path.getmtime, reverse=True)
+
+
+def latest_unfinished(folder=None, exclude=()):
+    """ Find the most recently used journal with devices still to run.
+
+    @param folder: The folder to look in, defaults to checkpoint_folder().
+    @type folder: str
+    @param exclude: The filepaths of journals to skip, such as those of runs
+                  | still going.
+    @type exclude: list
+
+    @returns: The filepath of the journal, its options and the hosts left to
+            | run, or None if every journal is finished.
+    @rtype: tuple
+    """
+    for filepath in checkpoints(folder):
+        if filepath in exclude:
+            continue
+        try:
+            options, hosts, remaining = load(filepath)
+        except (IOError, ValueError, KeyError):
+            continue
+        if remaining:
+            return filepath, options, remaining
+    return None
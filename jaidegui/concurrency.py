@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+""" ConcurrencyLimiter Class.
+
+Purpose: This class decides how many devices a WorkerThread has in flight at
+once. The work is almost entirely waiting on SSH/NETCONF round trips, so the
+limit is not tied to the number of cores. It can either be a fixed number, or
+'auto', in which case the limit grows while the device latency stays flat and
+backs off when connection or authentication failures spike.
+
+The concurrency setting is a string, so it can be stored in templates and the
+defaults.ini file. Valid values are:
+
+    auto        Adaptive, up to AUTO_MAX devices in flight (AUTO_MAX_THREADS
+                with the thread engine).
+    auto:<n>    Adaptive, up to <n> devices in flight.
+    <n>         Always <n> devices in flight.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import multiprocessing
+import threading
+
+# Upper bound for 'auto' when no explicit maximum is given. Threads are cheap
+# enough to allow many more sessions than processes.
+AUTO_MAX = 32
+AUTO_MAX_THREADS = 256
+# A window is judged once this many devices (or the current limit, if larger)
+# have finished.
+MIN_WINDOW = 8
+# Latency within this factor of the best window seen counts as 'flat'.
+LATENCY_TOLERANCE = 1.5
+# Back off when more than this fraction of a window failed to connect.
+ERROR_THRESHOLD = 0.1
+
+
+def parse_concurrency(value, engine="process"):
+    """ Parse a concurrency setting string.
+
+    @param value: The setting, one of 'auto', 'auto:<n>' or '<n>'.
+    @type value: str or int
+    @param engine: The execution engine the setting applies to, which decides
+                 | the maximum for a plain 'auto'.
+    @type engine: str
+
+    @returns: a tuple of whether the limit is adaptive, the starting limit,
+            | and the maximum limit.
+    @rtype: tuple
+
+    @raises ValueError: if the setting isn't valid.
+    """
+    value = str(value).strip().lower()
+    # 'auto' starts where the old hard coded pool size was, but never below
+    # a handful of devices, since the work is waiting on the network.
+    start = max(multiprocessing.cpu_count() * 2, MIN_WINDOW)
+    if value == "auto":
+        maximum = AUTO_MAX_THREADS if engine == "thread" else AUTO_MAX
+        return True, min(start, maximum), maximum
+    if value.startswith("auto:"):
+        maximum = int(value.split(":", 1)[1])
+        if maximum < 1:
+            raise ValueError("Concurrency maximum must be at least 1.")
+        return True, min(start, maximum), maximum
+    limit = int(value)
+    if limit < 1:
+        raise ValueError("Concurrency must be at least 1.")
+    return False, limit, limit
+
+
+class ConcurrencyLimiter(object):
+
+    """ Bound, and optionally adapt, the number of devices in flight. """
+
+    def __init__(self, setting, engine="process"):
+        """ Initialize the ConcurrencyLimiter object.
+
+        @param setting: The concurrency setting, see parse_concurrency().
+        @type setting: str
+        @param engine: The execution engine, see parse_concurrency().
+        @type engine: str
+
+        @returns: None
+        """
+        self.auto, self.limit, self.maximum = parse_concurrency(setting,
+                                                                engine)
+        self.minimum = min(self.limit, 2)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._cancelled = False
+        # Latencies and failures of the devices finished in the current
+        # window, and the best median latency of any window so far.
+        self._latencies = []
+        self._failures = 0
+        self._baseline = None
+
+    def acquire(self):
+        """ Block until another device can be dispatched.
+
+        @returns: False if the limiter was cancelled while waiting, otherwise
+                | True.
+        @rtype: bool
+        """
+        with self._cond:
+            while self.in_flight >= self.limit and not self._cancelled:
+                self._cond.wait(0.5)
+            if self._cancelled:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency, failed=False):
+        """ Record a finished device and let another one be dispatched.
+
+        @param latency: How long, in seconds, the device took.
+        @type latency: float
+        @param failed: Whether the device failed to connect or authenticate.
+        @type failed: bool
+
+        @returns: None
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if self.auto:
+                self._latencies.append(latency)
+                self._failures += 1 if failed else 0
+                if len(self._latencies) >= max(MIN_WINDOW, self.limit):
+                    self._adjust()
+            self._cond.notify_all()
+
+    def _adjust(self):
+        """ Resize the limit at the end of a window. Called holding _cond. """
+        window = sorted(self._latencies)
+        median = window[len(window) // 2]
+        error_rate = float(self._failures) / len(window)
+        if error_rate > ERROR_THRESHOLD:
+            # Multiplicative decrease when connect/auth errors spike.
+            self.limit = max(self.minimum, self.limit // 2)
+        elif self._baseline is None or median <= (self._baseline *
+                                                  LATENCY_TOLERANCE):
+            self.limit = min(self.maximum,
+                             self.limit + max(1, self.limit // 4))
+        if error_rate <= ERROR_THRESHOLD and (self._baseline is None or
+                                              median < self._baseline):
+            self._baseline = median
+        self._latencies = []
+        self._failures = 0
+
+    def cancel(self):
+        """ Wake up and fail any acquire() that is waiting. """
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
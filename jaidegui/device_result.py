@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+""" DeviceResult Class.
+
+Purpose: This class carries the outcome of running the jaide command against a
+single device from run_jaide() back to the WorkerThread. Rather than one big
+string, the host, the output, whether it succeeded and when it ran are kept as
+separate fields, so the rest of the pipeline (the output writers, the
+concurrency limiter and the GUI) never has to re-parse the output to find out
+which device it came from. It also carries how long each phase of running
+against the device took, for jaidegui.run_stats.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+
+class DeviceResult(object):
+
+    """ The outcome of running the jaide command against one device. """
+
+    # Possible values of status.
+    OK = "ok"
+    CONN_ERROR = "conn_error"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+
+    def __init__(self, host, output, status, started, finished, phases=None,
+                 worker=None):
+        """ Initialize the DeviceResult object.
+
+        @param host: The IP or hostname the command was run against.
+        @type host: str
+        @param output: The output of the command, including the jaide
+                     | 'Results from device' header, without ANSI color.
+        @type output: str
+        @param status: One of OK, CONN_ERROR when the device couldn't be
+                     | connected to or authenticated against, ERROR when
+                     | the command itself failed, or TIMEOUT when it was
+                     | abandoned for running past its deadline.
+        @type status: str
+        @param started: The time.time() the device was started at.
+        @type started: float
+        @param finished: The time.time() the device finished at.
+        @type finished: float
+        @param phases: The phases of running against the device, as a list of
+                     | (name, start, end) tuples of time.time()s, in order.
+        @type phases: list
+        @param worker: The (pid, thread id, thread name) of the worker that
+                     | ran against the device, if one did.
+        @type worker: tuple
+
+        @returns: None
+        """
+        self.host = host
+        self.output = output
+        self.status = status
+        self.started = started
+        self.finished = finished
+        self.phases = phases or []
+        self.worker = worker
+        # The id of the queued job the result belongs to, if any. Set by the
+        # WorkerThread, see jaidegui.job_scheduler.
+        self.job = None
+        # Whether the result came from jaidegui.result_cache, rather than
+        # from the device.
+        self.cached = False
+        # Records parsed from the output for a table, as a list of dicts, if
+        # any. Set by the WorkerThread, see jaidegui.interface_delta and
+        # jaidegui.fleet_records.
+        self.records = None
+
+    @property
+    def duration(self):
+        """ Return the seconds it took to run against the device. """
+        return self.finished - self.started
+
+    @property
+    def timings(self):
+        """ Return the seconds spent in each phase, keyed by phase name. """
+        return dict((name, end - start) for name, start, end in self.phases)
+
+    @property
+    def size(self):
+        """ Return the size of the output in bytes. """
+        return len(self.output)
@@ -0,0 +1,517 @@
+#!/usr/bin/env python
+""" ExecutionPool Class.
+
+Purpose: This class owns the long-lived pool that every WorkerThread submits
+its run_jaide() calls to. Spawning a pool of processes means each worker has
+to import jaide, ncclient, paramiko and lxml, which on spawn-based platforms
+(Windows, and the frozen builds) costs several seconds.
+The pool is created once, warmed up in the background, and reused by every
+run until it needs a different engine or has been terminated by a Stop. It
+starts with as many workers as a run starts with devices in flight, and grows
+as the concurrency limiters of the runs raise their limits, so a high maximum
+doesn't mean spawning hundreds of workers up front.
+Each submitted task is handed back as a Task, which can tell when it has
+really stopped running on its device, see Task.settled().
+
+A run claims a free worker before handing a device to the pool, so devices
+wait for a worker outside of the pool rather than in its queue, and are only
+handed over once they can start straight away. A device's deadline is then
+spent on the device, and not on waiting behind other runs' devices.
+
+The pool can either be made of processes, or of threads inside the GUI
+process. Since the work is waiting on SSH sessions rather than the CPU, the
+thread engine can keep hundreds of devices in flight for a fraction of the
+memory of a process each, and skips pickling every call and result. Both
+expose the same apply_async() and callback contract.
+
+The class also keeps a few counters about the spawns it has done and the runs
+that were able to reuse an already warm pool, so the time saved can be shown
+to the user.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import multiprocessing
+import multiprocessing.pool
+import threading
+import time
+import os
+
+# Most workers warmed up when a pool is spawned. Any more import the jaide
+# stack when they are first given a device.
+WARM_UP_MAX = multiprocessing.cpu_count() * 2
+
+
+class ExecutionPool(object):
+
+    """ Long-lived, lazily spawned pool shared by every WorkerThread. """
+
+    # The pool class used for each engine name.
+    engines = {
+        "process": multiprocessing.Pool,
+        "thread": multiprocessing.pool.ThreadPool
+    }
+
+    def __init__(self, size=None, engine="process"):
+        """ Initialize the ExecutionPool object.
+
+        Purpose: Nothing is spawned here. The pool is created either by
+               | warm_up() shortly after the GUI is shown, or lazily by the
+               | first acquire().
+
+        @param size: The number of workers in the pool. Defaults to
+                   | 2x the number of cores, which is what each WorkerThread
+                   | used to create for itself.
+        @type size: int
+        @param engine: Either 'process' or 'thread', the kind of workers.
+        @type engine: str
+
+        @returns: None
+        """
+        self.size = size or multiprocessing.cpu_count() * 2
+        self.engine = engine
+        self._pool = None
+        self._warmed = None
+        # Guards _pool, so a warm up in the background and an acquire() from
+        # a WorkerThread can't both spawn a pool.
+        self._lock = threading.Lock()
+        self._active = 0
+        # The runs holding a reservation, so cancel() can tell whether the
+        # run being stopped is the only one using the pool.
+        self._owners = set()
+        # Counts the workers of the current pool that have been claimed for
+        # a task that hasn't stopped, and each spawn or terminate starts a
+        # new generation. They have their own lock, as tasks free their
+        # workers from the pool's threads, which a terminate() holding _lock
+        # may be waiting on.
+        self._free = threading.Condition()
+        self._busy = 0
+        self._generation = 0
+        # Instrumentation counters, read by stats_summary().
+        self.spawns = 0
+        self.spawn_seconds = 0.0
+        self.last_spawn_seconds = 0.0
+        self.runs = 0
+        self.reused_runs = 0
+
+    def _spawn(self):
+        """ Create a new pool. Must be called holding _lock.
+
+        Purpose: The pool is warmed up by _warm_up() once _lock has been
+               | released, so a Stop isn't held up by the warm up.
+
+        @returns: The new pool.
+        @rtype: multiprocessing.pool.Pool
+        """
+        self._pool = self.engines[self.engine](self.size)
+        self._new_generation()
+        # Set once the new pool has been warmed up, with the error that
+        # stopped it if it couldn't be.
+        self._warmed = threading.Event()
+        self._warmed.error = None
+        return self._pool
+
+    def _warm_up(self, pool, warmed, start):
+        """ Warm up a pool made by _spawn(), without holding _lock.
+
+        Purpose: If the workers can't import the jaide stack, the pool is
+               | terminated, so the next run spawns a fresh one.
+
+        @param pool: The pool to warm up.
+        @type pool: multiprocessing.pool.Pool
+        @param warmed: The event to set once done, see _spawn().
+        @type warmed: threading.Event
+        @param start: The time.time() the pool started being spawned.
+        @type start: float
+
+        @returns: None
+
+        @raises Exception: whatever stopped the workers importing jaide.
+        """
+        # Hand one warm up task to each worker so they all import the jaide
+        # stack now, rather than on the first device they are given. Threads
+        # share the imports of the GUI process, so one is enough.
+        if isinstance(pool, multiprocessing.pool.ThreadPool):
+            count = 1
+        else:
+            count = min(self.size, WARM_UP_MAX)
+        result = pool.map_async(warm_up, range(count), chunksize=1)
+        try:
+            # A pool terminated by a Stop never finishes its warm up.
+            while (not result.ready() and
+                   pool._state == multiprocessing.pool.RUN):
+                result.wait(0.5)
+            if result.ready():
+                result.get()
+        except Exception as e:
+            warmed.error = e
+            with self._lock:
+                if self._pool is pool:
+                    self._terminate()
+            raise
+        finally:
+            warmed.set()
+        self.last_spawn_seconds = time.time() - start
+        self.spawn_seconds += self.last_spawn_seconds
+        self.spawns += 1
+
+    def warm_up(self):
+        """ Spawn the pool on a background thread if it isn't already up.
+
+        Purpose: Called by the GUI once the window has been drawn so the first
+               | run doesn't have to wait for the workers to start.
+
+        @returns: None
+        """
+        def spawn():
+            start = time.time()
+            with self._lock:
+                if self._pool is not None:
+                    return
+                pool = self._spawn()
+                warmed = self._warmed
+            try:
+                self._warm_up(pool, warmed, start)
+            except Exception:
+                pass  # The first run spawns again, and reports the error.
+        warm_thread = threading.Thread(target=spawn)
+        warm_thread.daemon = True
+        warm_thread.start()
+
+    def acquire(self, size=None, engine=None, owner=None):
+        """ Reserve the pool for a run, spawning or growing it as needed.
+
+        Purpose: A pool is only recycled when it has to be: when it has never
+               | been spawned, when it was terminated by a Stop, or when a
+               | different engine is requested and no other run is using it.
+               | A pool smaller than requested is grown, and a larger one is
+               | kept as it is. Either way, this waits for the pool to be
+               | warmed up.
+
+        @param size: The requested number of workers, or None to keep the
+                   | current size.
+        @type size: int
+        @param engine: The requested engine, or None to keep the current one.
+        @type engine: str
+        @param owner: The run making the reservation, which it passes to
+                    | release() and cancel().
+        @type owner: object
+
+        @returns: None
+
+        @raises Exception: if the pool couldn't be warmed up, see
+                         | _warm_up(). The reservation is made regardless.
+        """
+        start = time.time()
+        pool = None
+        with self._lock:
+            self.runs += 1
+            engine = engine or self.engine
+            if self._active == 0 and engine != self.engine:
+                self._terminate()
+                self.engine = engine
+            if self._pool is None:
+                self.size = size or self.size
+                pool = self._spawn()
+            else:
+                self.reused_runs += 1
+                self._grow(size)
+            warmed = self._warmed
+            self._active += 1
+            if owner is not None:
+                self._owners.add(owner)
+        if pool is not None:
+            self._warm_up(pool, warmed, start)
+        else:
+            # Spawned by an earlier run, or by warm_up(), which may still be
+            # warming it up.
+            warmed.wait()
+            if warmed.error is not None:
+                raise warmed.error
+
+    def grow(self, size):
+        """ Add workers to the pool, if it has fewer than size.
+
+        Purpose: Called as a run's concurrency limiter raises its limit, so
+               | the pool keeps up with the devices in flight.
+
+        @param size: The number of workers wanted.
+        @type size: int
+
+        @returns: None
+        """
+        with self._lock:
+            self._grow(size)
+
+    def _grow(self, size):
+        """ Add workers to the pool. Must be called holding _lock. """
+        if self._pool is None or not size or size <= self.size:
+            return
+        # multiprocessing has no public way to resize a pool, but its worker
+        # handler keeps _processes workers alive, so raising it and filling
+        # the pool back up adds the new ones.
+        self._pool._processes = size
+        self._pool._repopulate_pool()
+        self.size = size
+        with self._free:
+            self._free.notify_all()
+
+    def _new_generation(self):
+        """ Forget the claimed workers, as the pool was replaced. """
+        with self._free:
+            self._generation += 1
+            self._busy = 0
+            self._free.notify_all()
+
+    def claim(self, cancelled):
+        """ Wait for a worker that can start a task straight away.
+
+        Purpose: Each claim must be followed by an apply_async(), and the
+               | worker is freed once the task submitted has stopped.
+
+        @param cancelled: Stops the wait once set.
+        @type cancelled: threading.Event
+
+        @returns: False if cancelled was set, otherwise True.
+        @rtype: bool
+        """
+        with self._free:
+            while self._busy >= self.size and not cancelled.is_set():
+                self._free.wait(0.5)
+            if cancelled.is_set():
+                return False
+            self._busy += 1
+            return True
+
+    def _free_worker(self, task):
+        """ Free the worker claimed for a task, once it has stopped. """
+        with self._free:
+            if task.claimed and task.generation == self._generation:
+                self._busy -= 1
+                self._free.notify_all()
+            task.claimed = False
+
+    def abandon(self, task):
+        """ Add a worker in place of the one a stuck task is holding.
+
+        Purpose: An abandoned task keeps its worker busy until it gives up
+               | by itself, so the pool is grown by a worker to let the rest
+               | of the devices start without waiting for it. The pool stays
+               | at the larger size afterwards.
+
+        @param task: The task that was abandoned.
+        @type task: Task
+
+        @returns: None
+        """
+        with self._lock:
+            if task.claimed and task.generation == self._generation:
+                self._grow(self.size + 1)
+
+    def release(self, owner=None):
+        """ Release the reservation made by acquire(), if it made one. """
+        with self._lock:
+            if owner is not None and owner not in self._owners:
+                return
+            self._active = max(0, self._active - 1)
+            self._owners.discard(owner)
+
+    def apply_async(self, func, args, callback=None):
+        """ Submit a task to the pool, see multiprocessing.Pool.apply_async.
+
+        Purpose: Submits on the worker claimed by claim(). With the process
+               | engine the worker is freed as the result arrives, so func
+               | must return rather than raise, as run_jaide() does.
+
+        @returns: The submitted task, or None if the pool was terminated by a
+                | Stop.
+        @rtype: Task
+        """
+        with self._lock:
+            pool = self._pool
+            if pool is None:
+                return None
+            if isinstance(pool, multiprocessing.pool.ThreadPool):
+                task = Task(pool, self._generation, threading.Event(),
+                            threading.Event())
+                task.result = pool.apply_async(
+                    run_task, args=(task, self._free_worker, func) +
+                    tuple(args), callback=callback)
+            else:
+                task = Task(pool, self._generation)
+
+                def done(value):
+                    """ Free the task's worker, then hand on its result. """
+                    self._free_worker(task)
+                    if callback is not None:
+                        callback(value)
+                task.result = pool.apply_async(func, args=args,
+                                               callback=done)
+            return task
+
+    def terminate(self):
+        """ Terminate the pool, killing every task that is still running.
+
+        Purpose: Used by the Stop Script button. The next acquire() will spawn
+               | a fresh pool. Threads can't be killed, so with the thread
+               | engine any device still in progress is abandoned instead, and
+               | its result is dropped.
+
+        @returns: None
+        """
+        with self._lock:
+            self._terminate()
+
+    def _terminate(self):
+        """ Terminate the pool. Must be called holding _lock.
+
+        @returns: None
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            self._new_generation()
+
+    def cancel(self, owner):
+        """ Stop a run early, terminating the pool only if it is alone.
+
+        Purpose: Used when a single run is stopped. The pool is only
+               | terminated if the run holds the one reservation there is.
+               | Other runs may be using the pool at the same time, and a
+               | run stopped before it reserved the pool, such as during its
+               | preflight sweep, has no tasks on it, so in either case the
+               | pool is left running and the stopped run's tasks are left
+               | to finish on their own.
+
+        @param owner: The run being stopped, as passed to acquire().
+        @type owner: object
+
+        @returns: True if the pool was terminated.
+        @rtype: bool
+        """
+        with self._lock:
+            alone = owner in self._owners and self._active == 1
+            if alone:
+                self._terminate()
+        return alone
+
+    def shutdown(self):
+        """ Tear down the pool when the application is closing. """
+        self.terminate()
+
+    def stats_summary(self):
+        """ Describe how much spawn time the pool has saved.
+
+        @returns: A human readable summary of the pool instrumentation.
+        @rtype: str
+        """
+        if not self.spawns:
+            return ("Execution pool: not spawned yet (%d %s workers)." %
+                    (self.size, self.engine))
+        return ("Execution pool: %d %s workers, spawned %d time(s) taking "
+                "%.2fs in total (last spawn %.2fs).\nReused for %d of %d "
+                "run(s), avoiding ~%.2fs of worker start up." %
+                (self.size, self.engine, self.spawns, self.spawn_seconds,
+                 self.last_spawn_seconds, self.reused_runs, self.runs,
+                 self.reused_runs * self.last_spawn_seconds))
+
+
+class Task(object):
+
+    """ A task submitted to an ExecutionPool, see apply_async(). """
+
+    def __init__(self, pool, generation, started=None, finished=None):
+        """ Initialize the Task object, before it is submitted.
+
+        @param pool: The multiprocessing pool the task is submitted to.
+        @type pool: multiprocessing.pool.Pool
+        @param generation: The ExecutionPool generation of the pool.
+        @type generation: int
+        @param started: Set by run_task() once a thread has picked the task
+                      | up, with the thread engine.
+        @type started: threading.Event
+        @param finished: Set by run_task() once the task has returned, with
+                       | the thread engine.
+        @type finished: threading.Event
+
+        @returns: None
+        """
+        self.pool = pool
+        self.generation = generation
+        # Whether the task still holds the worker claimed for it.
+        self.claimed = True
+        # The AsyncResult of the task, once submitted.
+        self.result = None
+        self.started = started
+        self.finished = finished
+
+    def ready(self):
+        """ Check whether the task's result has arrived. """
+        return self.result.ready()
+
+    def wait(self, timeout=None):
+        """ Wait for the task's result, see AsyncResult.wait(). """
+        self.result.wait(timeout)
+
+    def settled(self):
+        """ Check whether the task has stopped running on its device.
+
+        Purpose: A task that was abandoned by the watchdog, or whose run
+               | was stopped, can still be talking to its device. Terminating
+               | a pool kills its processes, so a task of the process engine
+               | has stopped once its result has arrived or its pool has been
+               | terminated. Threads can't be killed, so a task of the thread
+               | engine has only stopped once it has returned, even if its
+               | result will never arrive, or if its pool was terminated
+               | before a thread picked it up.
+
+        @rtype: bool
+        """
+        terminated = self.pool._state != multiprocessing.pool.RUN
+        if self.finished is not None:
+            return self.finished.is_set() or (terminated and
+                                              not self.started.is_set())
+        return self.result.ready() or terminated
+
+
+def run_task(task, free_worker, func, *args):
+    """ Run a task of the thread engine, and flag once it has returned.
+
+    @param task: The task, whose started and finished events are set before
+               | and after func is called.
+    @type task: Task
+    @param free_worker: Called with the task once func has returned or
+                      | raised, to free its worker.
+    @type free_worker: function
+    @param func: The function to run, with the rest of the arguments.
+    @type func: function
+
+    @returns: What func returns.
+    """
+    task.started.set()
+    try:
+        return func(*args)
+    finally:
+        task.finished.set()
+        free_worker(task)
+
+
+def warm_up(index):
+    """ Import the jaide stack inside a pool worker.
+
+    Purpose: This function is created outside of the ExecutionPool class so
+           | that it can be pickled and sent to the worker processes. For the
+           | thread engine it simply imports jaide into the GUI process.
+
+    @param index: The index of the warm up task, unused.
+    @type index: int
+
+    @returns: The process id of the process that ran the task.
+    @rtype: int
+    """
+    from jaide import wrap  # noqa
+    return os.getpid()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+""" Fleet record functions.
+
+Purpose: This module reads a structured record out of the free-form text
+output of the Health Check and Device Info options, so the devices of a large
+run can be compared in the Fleet Summary table instead of by scrolling
+through their output. Device Info gives the hostname, model, Junos version,
+serial number and uptime of a device. Health Check gives its alarms, and from
+'show chassis routing-engine' its uptime and the busiest CPU, highest memory
+use and hottest temperature of its routing engines. Both records have the
+device's host, so the table merges them into one row per device.
+
+The WorkerThread parses each successful result of these options with
+parse(), and puts the record on the result for the GUI. A value that can't
+be found in the output is left out of the record, rather than guessed.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import re
+
+# The columns of a fleet record, in the order shown.
+COLUMNS = ["host", "hostname", "model", "version", "serial", "uptime_days",
+           "cpu", "memory", "temperature", "alarms", "major_alarms"]
+# The heading of each column.
+HEADINGS = ["Host", "Hostname", "Model", "Version", "Serial", "Uptime (days)",
+            "CPU %", "Memory %", "Temp (C)", "Alarms", "Major Alarms"]
+# Device Info lines, mapped to the column they fill.
+DEVICE_INFO_FIELDS = {
+    "Hostname": "hostname",
+    "Model": "model",
+    "Junos Version": "version",
+    "Chassis Serial Number": "serial",
+    "Uptime": "uptime"
+}
+FIELD_LINE = re.compile(r"^([A-Za-z ]+?):\s*(.*?)\s*$")
+SERIAL_NUMBER = re.compile(r"Serial #:\s*(\S+?)\s*(?=Routing Engine|$)")
+ALARM_LINE = re.compile(r"^\s*(Major|Minor)\s+Alarm\b", re.I)
+IDLE_LINE = re.compile(r"^\s*Idle\s+(\d+)\s+percent", re.I)
+MEMORY_LINE = re.compile(r"^\s*Memory utilization\s+(\d+)\s+percent", re.I)
+TEMPERATURE_LINE = re.compile(r"^\s*(?:CPU )?Temperature\s+(\d+)\s+degrees C",
+                              re.I)
+UPTIME_LINE = re.compile(r"^\s*Uptime\s+(.+?)\s*$")
+# Seconds in each unit of an uptime.
+UPTIME_UNITS = {"week": 604800, "day": 86400, "hour": 3600, "minute": 60,
+                "second": 1}
+
+
+def uptime_days(text):
+    """ Convert a Junos uptime to days.
+
+    @param text: The uptime, such as '52 days, 3 hours, 2 minutes, 10
+               | seconds' or '52 days, 03:02'.
+    @type text: str
+
+    @returns: The uptime in days, to one decimal place, or None if it
+            | couldn't be read.
+    @rtype: float
+    """
+    seconds = 0
+    found = False
+    for count, unit in re.findall(r"(\d+)\s*(week|day|hour|minute|second)s?",
+                                  text, re.I):
+        seconds += int(count) * UPTIME_UNITS[unit.lower()]
+        found = True
+    clock = re.search(r"\b(\d+):(\d\d)(?::(\d\d))?\b", text)
+    if clock:
+        hours, minutes, secs = clock.groups()
+        seconds += int(hours) * 3600 + int(minutes) * 60 + int(secs or 0)
+        found = True
+    if not found:
+        return None
+    return round(seconds / 86400.0, 1)
+
+
+def parse_device_info(output):
+    """ Read a fleet record out of the output of Device Info.
+
+    @param output: The output of jaide.wrap.device_info.
+    @type output: str
+
+    @returns: The columns found.
+    @rtype: dict
+    """
+    record = {}
+    for line in output.splitlines():
+        match = FIELD_LINE.match(line)
+        if not match or match.group(1) not in DEVICE_INFO_FIELDS:
+            # EX virtual chassis list the serial of each routing engine, all
+            # on the one line.
+            serials = SERIAL_NUMBER.findall(line)
+            if serials:
+                record["serial"] = ", ".join(serials)
+            continue
+        column = DEVICE_INFO_FIELDS[match.group(1)]
+        value = match.group(2)
+        if column == "uptime":
+            days = uptime_days(value)
+            if days is not None:
+                record["uptime_days"] = days
+        elif value and not value.startswith("Unknown"):
+            record[column] = value
+    return record
+
+
+def parse_health_check(output):
+    """ Read a fleet record out of the output of Health Check.
+
+    Purpose: With more than one routing engine, the busiest CPU, the
+           | highest memory use and the hottest temperature are kept, as
+           | they are the ones to look into.
+
+    @param output: The output of jaide.wrap.health_check.
+    @type output: str
+
+    @returns: The columns found.
+    @rtype: dict
+    """
+    record = {"alarms": 0, "major_alarms": 0}
+    for line in output.splitlines():
+        alarm = ALARM_LINE.match(line)
+        if alarm:
+            record["alarms"] += 1
+            if alarm.group(1).lower() == "major":
+                record["major_alarms"] += 1
+            continue
+        for column, pattern in (("cpu", IDLE_LINE),
+                                ("memory", MEMORY_LINE),
+                                ("temperature", TEMPERATURE_LINE)):
+            match = pattern.match(line)
+            if match:
+                value = int(match.group(1))
+                if column == "cpu":
+                    value = 100 - value
+                record[column] = max(value, record.get(column, value))
+        uptime = UPTIME_LINE.match(line)
+        if uptime and "uptime_days" not in record:
+            days = uptime_days(uptime.group(1))
+            if days is not None:
+                record["uptime_days"] = days
+    return record
+
+
+def parse(function_name, host, output):
+    """ Read the fleet record of a device out of its output.
+
+    @param function_name: The name of the jaide.wrap function run.
+    @type function_name: str
+    @param host: The IP or hostname of the device.
+    @type host: str
+    @param output: The output of the function.
+    @type output: str
+
+    @returns: A list of the record, or None if the function doesn't have
+            | fleet records.
+    @rtype: list
+    """
+    if function_name == "device_info":
+        record = parse_device_info(output)
+    elif function_name == "health_check":
+        record = parse_health_check(output)
+    else:
+        return None
+    record["host"] = host
+    return [record]
@@ -15,6 +15,11 @@ For more information on the underlying jaide utility, visit:
 
     https://github.com/NetworkAutomation/jaide
 """
+import time
+# Taken before anything else is imported, Tkinter and jaidegui's own modules
+# included, so the startup benchmark measures what importing them costs.
+STARTED = time.time()
+
 # Standard Imports
 import Queue
 # In terms of JGUI, we use multiprocessing to enable freeze_support.
@@ -23,8 +28,6 @@ import webbrowser as webb
 import re
 import os
 import sys
-import base64
-import time
 # Tkinter related imports.
 import Tkinter as tk  # Tkinter is the underlying gui framework.
 import tkFileDialog
@@ -32,18 +35,69 @@ import tkMessageBox
 import ttk  # Used for separators between frames of the UI.
 # Intra-jaidegui imports
 from jgui_widgets import JaideEntry, JaideCheckbox
-from jgui_widgets import AutoScrollbar, JaideRadiobutton
-from worker_thread import WorkerThread
+from jgui_widgets import JaideRadiobutton, OutputViewer, HostList
+from jgui_widgets import SearchBar, JaideOptionMenu, JobQueueWindow
+from jgui_widgets import ResultHistoryWindow, RecordTableWindow
+from log_store import LogStore
+from output_search import OutputSearch
+from job_scheduler import JobScheduler
+from device_result import DeviceResult
+from output_queue import OutputQueue
+from progress import ProgressTracker
+from execution_pool import ExecutionPool
+from concurrency import parse_concurrency
+from watchdog import parse_deadline
+import session_cache
+import result_cache
+import interface_delta
+import fleet_records
+from record_set import RecordSet
 from module_locator import module_path
-# The rest are Non-standard imports
-from jaide import wrap
-from jaide.utils import clean_lines
-# Pmw is the extended menuwidget option giving us the ability
-# to call a function when a option is chosen from the menu.
-from Pmw import OptionMenu as OM
-
+# jaide, and the networking stack under it, is imported in the background
+# once the window is up, by the loader.
+from jaide_loader import loader
+from job import build_job, job_hosts, read_template, write_template
+from job import WRITE_OPTIONS, OPTION_FUNCTIONS
+import result_store
+from checkpoint import new_checkpoint, latest_unfinished
+
+# Seconds get_output() may spend pulling output off the queue in one tick,
+# so a flood of results can't freeze the GUI.
+DRAIN_BUDGET = 0.05
+# Bounds, in milliseconds, of the fallback poll for output and for the
+# WorkerThread finishing. It backs off while nothing is arriving.
+POLL_MIN = 50
+POLL_MAX = 500
+# Milliseconds between updates of the progress bar and counters.
+PROGRESS_INTERVAL = 200
+# Seconds to wait for the GUI to be ready before giving up on timing it.
+STARTUP_LIMIT = 120
+# Widgets with their own bindings for editing keys, such as Ctrl-H and
+# Ctrl-T.
+EDITING_WIDGETS = (tk.Entry, tk.Text, ttk.Entry)
+
+
+def unless_editing(command):
+    """ Wrap a keyboard shortcut, so it doesn't take over an editing key.
+
+    Purpose: Ctrl-H deletes a character in Entry and Text widgets, and
+           | Ctrl-T swaps the two characters before the cursor. Bound on
+           | the main window, the shortcut still sees the key after the
+           | widget has, so it is ignored while one of them has the focus.
+
+    @param command: Called with the event, when the shortcut applies.
+    @type command: function
+
+    @returns: The function to bind the shortcut to.
+    @rtype: function
+    """
+    def shortcut(event):
+        if isinstance(event.widget, EDITING_WIDGETS):
+            return None
+        command(event)
+        return "break"
+    return shortcut
 
-# TODO: make Script output non-editable, but still selectable for copying.  - Doesn't seem feasible without completely re-writing textArea widget.
 # TODO: add headers to the sections of the GUI / add coloring or styling.  - Attempted, couldn't get menuoption to work, or checkboxes on mac.
 # TODO: make entry fields fill their given space on the x-axis to give more space for filepaths?
 # TODO: check and make sure writing to multiple files works on windows and compiled versions.
@@ -56,7 +110,7 @@ class JaideGUI(tk.Tk):
     representation seen by the user. Some functionality is enhanced with the
     use of other classes that are imported and used, including WorkerThread
     (for running the jaide CLI tool and handling output gathering) and
-    AutoScrollbar (for putting scrollbars on the output_area text entry widget)
+    OutputViewer (for showing the output, which is kept in a LogStore)
     """
 
     def __init__(self, parent):
@@ -82,18 +136,6 @@ class JaideGUI(tk.Tk):
                              "Show | Compare", "------", "Device Info",
                              "Health Check", "Interface Errors"]
 
-        # Maps optionMenu choice to jaide_cli function.
-        self.option_conversion = {
-            "Diff Config": wrap.diff_config,
-            "Device Info": wrap.device_info,
-            "Health Check": wrap.health_check,
-            "Interface Errors": wrap.interface_errors,
-            "Operational Command(s)": wrap.command,
-            "SCP Files": wrap.push,
-            "Set Command(s)": wrap.commit,
-            "Shell Command(s)": wrap.shell,
-            "Show | Compare": wrap.compare
-        }
         # Maps optionMenu choice to help text.
         self.help_conversion = {
             "Show | Compare": "Quick Help: Run a 'show | compare' in Junos against a given list of set commands. " +
@@ -122,9 +164,41 @@ class JaideGUI(tk.Tk):
         }
 
         # stdout_queue is where the WorkerThread class will dump output to.
-        self.stdout_queue = Queue.Queue()
-        # thread will be the WorkerThread instantiation.
-        self.thread = ""
+        self.stdout_queue = OutputQueue()
+        # Whether get_output() is watching running jobs, the id of its next
+        # scheduled poll, and the current poll interval.
+        self.running = False
+        self.poll_id = None
+        self.poll_interval = POLL_MIN
+        # The pool of worker processes is shared by every run, so the
+        # workers only have to be spawned and import jaide once.
+        self.exec_pool = ExecutionPool()
+        # Each run is queued as a job, each with its own WorkerThread, and
+        # the ones that don't conflict run at the same time on exec_pool.
+        # Progress events go on their own queue, so the progress bar can be
+        # kept up to date without waiting on the output.
+        self.progress_queue = Queue.Queue()
+        self.progress = ProgressTracker()
+        self.progress_id = None
+        self.scheduler = JobScheduler(self.stdout_queue, self.exec_pool,
+                                      self.progress_queue)
+        self.job_window = None
+        self.history_window = None
+        # The records parsed from the results of each command option that
+        # has them, as the (title, records, headings) of its table, and the
+        # window of each table that has been opened, keyed by title. Device
+        # Info and Health Check fill in the same rows.
+        fleet_table = ("Fleet Summary",
+                       RecordSet(fleet_records.COLUMNS, key="host"),
+                       fleet_records.HEADINGS)
+        self.record_tables = {
+            "Device Info": fleet_table,
+            "Health Check": fleet_table,
+            "Interface Errors": ("Interface Error Deltas",
+                                 RecordSet(interface_delta.COLUMNS),
+                                 interface_delta.HEADINGS)
+        }
+        self.table_windows = {}
         # boolean for tracking if the upper options of the GUI are shown.
         self.frames_shown = True
 
@@ -158,6 +232,23 @@ class JaideGUI(tk.Tk):
         self.menu_file.add_command(label="Run Script", accelerator='Ctrl-R',
                                    command=lambda: self.go(None))
         self.bind_all("<Control-r>", self.go)
+        self.menu_file.add_command(label="Job Queue", accelerator='Ctrl-J',
+                                   command=lambda: self.show_jobs(None))
+        self.bind_all("<Control-j>", self.show_jobs)
+        self.menu_file.add_command(label="Resume Last Run",
+                                   command=self.resume_run)
+        self.menu_file.add_command(label="Result History",
+                                   accelerator='Ctrl-H',
+                                   command=lambda: self.show_history(None))
+        self.bind("<Control-h>", unless_editing(self.show_history))
+        self.menu_file.add_command(label="Fleet Summary", accelerator='Ctrl-T',
+                                   command=lambda: self.show_table(
+                                       "Device Info"))
+        self.bind("<Control-t>", unless_editing(
+            lambda event: self.show_table("Device Info")))
+        self.menu_file.add_command(label="Interface Error Deltas",
+                                   command=lambda: self.show_table(
+                                       "Interface Errors"))
         self.menu_file.add_separator()
         self.menu_file.add_command(label="Quit", accelerator='Ctrl-Q',
                                    command=lambda: self.quit(None))
@@ -166,6 +257,8 @@ class JaideGUI(tk.Tk):
         # Create the Help menu
         self.menu_help.add_command(label="About", command=self.show_about)
         self.menu_help.add_command(label="Go to Docs", command=self.show_help)
+        self.menu_help.add_command(label="Performance Stats",
+                                   command=self.show_stats)
 
         # Add the menubar in.
         self.config(menu=self.menubar)
@@ -182,6 +275,8 @@ class JaideGUI(tk.Tk):
         self.creds_frame = tk.Frame(self.ip_cred_frame)
         # write to file frame
         self.wtf_frame = tk.Frame(self)
+        # options for how the script is executed
+        self.perf_frame = tk.Frame(self)
         self.options_frame = tk.Frame(self)
         # Set Commands frames for the additional commit options
         self.set_frame = tk.Frame(self.options_frame)
@@ -208,6 +303,17 @@ class JaideGUI(tk.Tk):
                                            text="Connection Timeout:")
         self.conn_timeout_entry = JaideEntry(self.ip_frame, instance_type=int,
                                              contents=5)
+        # Whether devices are run on a pool of processes or of threads.
+        self.engine_label = tk.Label(self.ip_frame, text="Engine:")
+        self.engine_value = tk.StringVar()
+        self.engine_value.set("Process")
+        self.engine_menu = tk.OptionMenu(self.ip_frame, self.engine_value,
+                                         "Process", "Thread",
+                                         command=self.check_engine)
+        self.engine_menu.config(takefocus=0)
+        # How long each device has before it is abandoned as timed out.
+        self.deadline_label = tk.Label(self.ip_frame, text="Device Deadline:")
+        self.deadline_entry = JaideEntry(self.ip_frame, contents="auto")
 
         # #### Authentication
         self.username_label = tk.Label(self.creds_frame, text="Username: ")
@@ -218,6 +324,10 @@ class JaideGUI(tk.Tk):
         self.port_label = tk.Label(self.creds_frame, text="Port: ")
         self.port_entry = JaideEntry(self.creds_frame, instance_type=int,
                                      contents=22)
+        # How many devices to run against at once, a number or 'auto'.
+        self.concurrency_label = tk.Label(self.creds_frame,
+                                          text="Concurrency: ")
+        self.concurrency_entry = JaideEntry(self.creds_frame, contents="auto")
 
         # ## WRITE TO FILE
         self.wtf_entry = JaideEntry(self.wtf_frame)
@@ -230,23 +340,50 @@ class JaideGUI(tk.Tk):
                                                   "Multiple Files"],
                                                  ["s", "m"], takefocus=0)
 
+        # ## EXECUTION OPTIONS
+        self.reuse_sessions_box = JaideCheckbox(self.perf_frame,
+                                                text="Reuse sessions",
+                                                takefocus=0)
+        # Sweep the devices for the port being open before running on them.
+        self.preflight_box = JaideCheckbox(self.perf_frame,
+                                           text="Pre-flight check",
+                                           takefocus=0)
+        # Record every result in the result store, for the Result History.
+        self.record_box = JaideCheckbox(self.perf_frame,
+                                        text="Record results", takefocus=0)
+        self.record_box.select()
+        # Answer read only commands from the recent results, if any.
+        self.cache_box = JaideCheckbox(self.perf_frame, text="Use cache",
+                                       takefocus=0)
+        self.refresh_box = JaideCheckbox(self.perf_frame,
+                                         text="Force refresh", takefocus=0)
+        # Record a timeline of each run, to view in a trace viewer.
+        self.trace_box = JaideCheckbox(self.perf_frame, text="Record trace",
+                                       command=self.check_trace, takefocus=0)
+        self.trace_entry = JaideEntry(self.perf_frame)
+        self.trace_button = tk.Button(self.perf_frame, text="Select File",
+                                      command=self.open_trace, takefocus=0)
+
         # ## OPTIONS
         # stores which option from options_list is selected
         self.option_value = tk.StringVar()
         # sets defaulted option to first one
         self.option_value.set(self.options_list[0])
-        # Actual dropdown list widget. Uses Pmw's option menu because tk base
-        # doesn't allow an action to be bound to an option_menu.
-        self.option_menu = OM(self.options_frame,
-                              command=self.opt_select,
-                              menubutton_textvariable=self.option_value,
-                              items=self.options_list)
-        # Prevents option_menu from taking focus while tabbing
-        self.option_menu.component('menubutton').config(takefocus=0)
+        # Actual dropdown list widget, calling opt_select when an option is
+        # chosen.
+        self.option_menu = JaideOptionMenu(self.options_frame,
+                                           self.options_list,
+                                           command=self.opt_select,
+                                           variable=self.option_value,
+                                           takefocus=0)
         self.option_entry = JaideEntry(self.options_frame)
         # format checkbox for operational commands
         self.format_box = JaideCheckbox(self.options_frame,
                                         text="Request XML Format", takefocus=0)
+        # Only report the interface error counters that went up.
+        self.delta_box = JaideCheckbox(self.options_frame,
+                                       text="Only new errors (delta mode)",
+                                       takefocus=0)
 
         # ## SCP OPTIONS
         self.scp_direction_value = tk.StringVar()
@@ -343,18 +480,26 @@ class JaideGUI(tk.Tk):
                                               command=self.toggle_frames,
                                               text="Toggle Options",
                                               takefocus=0)
+        # Progress of the running jobs.
+        self.progress_bar = ttk.Progressbar(self.buttons_frame, length=150,
+                                            mode="determinate")
+        self.progress_value = tk.StringVar()
+        self.progress_label = tk.Label(self.buttons_frame,
+                                       textvariable=self.progress_value)
 
         # ## SCRIPT OUTPUT AREA
-        self.output_area = tk.Text(self.output_frame, wrap=tk.NONE)
-        self.xscrollbar = AutoScrollbar(self.output_frame,
-                                        command=self.output_area.xview,
-                                        orient=tk.HORIZONTAL, takefocus=0)
-        self.yscrollbar = AutoScrollbar(self.output_frame,
-                                        command=self.output_area.yview,
-                                        takefocus=0)
-        self.output_area.config(yscrollcommand=self.yscrollbar.set,
-                                xscrollcommand=self.xscrollbar.set,
-                                takefocus=0)
+        # The output is kept on disk in the log_store, and the output_area
+        # only renders the part of it being looked at.
+        self.log_store = LogStore()
+        self.output_area = OutputViewer(self.output_frame, self.log_store)
+        # Lists the hosts in the output, to jump to or collapse their output.
+        self.host_list = HostList(self.output_frame, self.log_store,
+                                  self.output_area)
+        # Searches the output of each host on its own thread.
+        self.output_search = OutputSearch(self.log_store)
+        self.output_search.start()
+        self.search_bar = SearchBar(self.output_frame, self.output_search,
+                                    self.output_area, self.host_list)
 
         # Separators
         self.sep1 = ttk.Separator(self.ip_cred_frame)
@@ -369,7 +514,7 @@ class JaideGUI(tk.Tk):
         #############################################
         # ## INITIALIZE THE LAYOUT
         self.show_frames()
-        self.rowconfigure(9, weight=1)
+        self.rowconfigure(10, weight=1)
         self.columnconfigure(0, weight=1)
         self.output_frame.rowconfigure(0, weight=1)
         self.output_frame.columnconfigure(0, weight=1)
@@ -384,6 +529,10 @@ class JaideGUI(tk.Tk):
         self.timeout_entry.grid(column=1, row=1, sticky="NW")
         self.conn_timeout_label.grid(column=0, row=2, sticky="NW")
         self.conn_timeout_entry.grid(column=1, row=2, sticky="NW")
+        self.engine_label.grid(column=0, row=3, sticky="NW")
+        self.engine_menu.grid(column=1, row=3, sticky="NW")
+        self.deadline_label.grid(column=0, row=4, sticky="NW")
+        self.deadline_entry.grid(column=1, row=4, sticky="NW")
         self.sep1.grid(column=1, row=0, sticky="NS", padx=(18, 18))
 
         # Section 1 - Authentication - creds_frame
@@ -394,6 +543,8 @@ class JaideGUI(tk.Tk):
         self.password_entry.grid(column=1, row=1, sticky="NW")
         self.port_label.grid(column=0, row=2, sticky="NW")
         self.port_entry.grid(column=1, row=2, sticky="NW")
+        self.concurrency_label.grid(column=0, row=3, sticky="NW")
+        self.concurrency_entry.grid(column=1, row=3, sticky="NW")
 
         # This is the help label in the frame below the options frame.
         self.help_label.grid(column=0, row=0, sticky="NWES")
@@ -401,6 +552,14 @@ class JaideGUI(tk.Tk):
         # Section 2 - Write to File - wtf_frame
         self.wtf_checkbox.grid(column=0, row=0, sticky="NSW")
 
+        # Section 2b - Execution Options - perf_frame
+        self.reuse_sessions_box.grid(column=0, row=0, sticky="NSW")
+        self.preflight_box.grid(column=1, row=0, sticky="NSW")
+        self.trace_box.grid(column=2, row=0, sticky="NSW")
+        self.record_box.grid(column=0, row=1, sticky="NSW")
+        self.cache_box.grid(column=1, row=1, sticky="NSW")
+        self.refresh_box.grid(column=2, row=1, sticky="NSW")
+
         # Section 3 - Command Options - options_frame
         self.option_menu.grid(column=0, row=0, sticky="EW")
         self.spacer_label.grid(column=0, row=1, sticky="NW")
@@ -411,12 +570,13 @@ class JaideGUI(tk.Tk):
         self.clear_button.grid(column=2, row=0, sticky="NW", padx=2)
         self.save_button.grid(column=3, row=0, sticky="NW", padx=2)
         self.toggle_frames_button.grid(column=4, row=0, sticky="NW", padx=2)
+        self.progress_bar.grid(column=5, row=0, sticky="W", padx=(10, 2))
+        self.progress_label.grid(column=6, row=0, sticky="W", padx=2)
 
         # Section 5 - Output Area - output_frame
         self.output_area.grid(column=0, row=0, sticky="SWNE")
-        self.output_area.columnconfigure(0, weight=100)
-        self.xscrollbar.grid(column=0, row=1, sticky="SWNE")
-        self.yscrollbar.grid(column=1, row=0, sticky="SWNE")
+        self.host_list.grid(column=1, row=0, sticky="SWNE")
+        self.search_bar.grid(column=0, columnspan=2, row=1, sticky="EW")
 
         # Tie the commit options to the set_frame and set_frame_2
         self.commit_check_button.grid(column=0, row=0, sticky="NW")
@@ -436,6 +596,7 @@ class JaideGUI(tk.Tk):
         self.ip_frame.lift()
         self.creds_frame.lift()
         self.wtf_frame.lift()
+        self.perf_frame.lift()
         self.options_frame.lift()
 
         # Run the opt_select method to ensure the proper fields are shown.
@@ -445,8 +606,17 @@ class JaideGUI(tk.Tk):
         self.template_opts = {
             "IP": self.ip_entry,
             "Timeout": self.timeout_entry,
+            "Concurrency": self.concurrency_entry,
+            "Deadline": self.deadline_entry,
+            "Engine": self.engine_value,
             "Username": self.username_entry,
             "Password": self.password_entry,
+            "ReuseSessions": self.reuse_sessions_box,
+            "Preflight": self.preflight_box,
+            "RecordResults": self.record_box,
+            "UseCache": self.cache_box,
+            "TraceBool": self.trace_box,
+            "TraceLoc": self.trace_entry,
             "WriteToFileBool": self.wtf_checkbox,
             "WriteToFileLoc": self.wtf_entry,
             "SingleOrMultipleFiles": self.wtf_radiobuttons,
@@ -464,6 +634,7 @@ class JaideGUI(tk.Tk):
             "CommitCommentValue": self.commit_comment_entry,
             "CommitSynch": self.commit_synch,
             "Format": self.format_box,
+            "InterfaceDelta": self.delta_box,
             "DiffMode": self.diff_config_mode
         }
 
@@ -471,7 +642,37 @@ class JaideGUI(tk.Tk):
         if os.path.isfile(self.defaults_file):
             self.open_template(self.defaults_file, "defaults")
 
-    def go(self, event):
+        # Have the WorkerThread wake us up as soon as it queues output. This
+        # goes through the Tk event queue, which is only safe to do from other
+        # threads if Tcl was built with thread support. Otherwise we rely on
+        # the poll in get_output().
+        self.bind("<<JaideOutput>>", self.output_ready)
+        if self.tk.call('info', 'exists', 'tcl_platform(threaded)'):
+            self.stdout_queue.set_wakeup(self.wake_output)
+
+        self.check_engine()
+
+        # Start the worker processes once the window is up, so they are warm
+        # by the time the user runs the first script. They are sized for the
+        # devices the concurrency setting starts with in flight, up to the
+        # default size, and grow during a run if it needs more.
+        self.exec_pool.engine = self.engine_value.get().lower()
+        try:
+            self.exec_pool.size = min(self.exec_pool.size, parse_concurrency(
+                self.concurrency_entry.get(), self.exec_pool.engine)[1])
+        except ValueError:
+            pass
+        self.after_idle(self.exec_pool.warm_up)
+        # Likewise import jaide in the background, after the first paint.
+        self.after_idle(loader.start)
+
+        # Startup timings, in seconds since STARTED, for the startup benchmark
+        # and Help > Performance Stats.
+        self.first_paint = None
+        self.ready = None
+        self.after_idle(self.check_startup)
+
+    def go(self, event, checkpoint_file=None):
         """ Execute the jaide_cli script with the user specified options.
 
         Purpose: This function is called when the user clicks on the 'Run
@@ -484,119 +685,233 @@ class JaideGUI(tk.Tk):
                     | will receive the event parameter. It is a description of
                     | the keyboard shortcut that generated the event.
         @type event: Tkinter.event object
+        @param checkpoint_file: The journal of the run being resumed, if
+                              | any. Otherwise a new journal is started, so
+                              | the run can be resumed later.
+        @type checkpoint_file: str
 
         @returns: None
         """
         # Ensure the input is valid.
         if self.input_validation():
-            # puts cursor at end of text field
-            self.output_area.mark_set(tk.INSERT, tk.END)
-            self.write_to_output_area("****** Starting Jaide ******\n")
-
+            # Looks up the selected option, and the options that go with it,
+            # to get the right Jaide function to call and its arguments. This
+            # imports jaide, if it hasn't been imported in the background yet.
+            try:
+                function, argsToPass = build_job(self.template_values())
+            except ImportError as e:
+                self.write_to_output_area("Could not load jaide. Error:\n" +
+                                          str(e))
+                return
             # Gets username/ip from appropriate StringVars
             username = self.username_entry.get().strip()
             timeout = self.timeout_entry.get()
 
-            # if they are requesting xml.
-            out_fmt = 'xml' if self.format_box.get() else 'text'
-
-            # some functions need to know if we're running against >1 device
-            multi = True if (len([ip for ip in
-                             clean_lines(self.ip_entry.get())]) > 1) else False
-
-            # Looks up the selected option from dropdown against the conversion
-            # dictionary to get the right Jaide function to call
-            function = self.option_conversion[self.option_value.get()]
-
-            if (self.scp_direction_value.get() == "Pull" and
-                    function == wrap.push):
-                function = wrap.pull
-
-            # Need to set commit options only if their boxes are checked.
-            at_time = self.commit_at_entry.get() if self.commit_at.get() else None
-            confirmed = int(self.commit_confirmed_min_entry.get()) * 60 if self.commit_confirmed_button.get() else None
-            comment = self.commit_comment_entry.get() if self.commit_comment.get() else None
-            # build the args translation array
-            args_translation = {
-                "Operational Command(s)": [self.option_entry.get().strip(),
-                                           out_fmt, False],
-                "Device Info": [],
-                "Diff Config": [self.option_entry.get().strip(),
-                                self.diff_config_mode.get().lower()],
-                "Health Check": [],
-                "Interface Errors": [],
-                "Set Command(s)": [self.option_entry.get().strip(),
-                                   self.commit_check_button.get(),
-                                   self.commit_synch.get(),
-                                   comment,
-                                   confirmed,
-                                   at_time,
-                                   self.commit_blank.get()],
-                "SCP Files": [self.option_entry.get().strip(),
-                              self.scp_dest_entry.get(), False, multi],
-                "Shell Command(s)": [self.option_entry.get().strip()],
-                "Show | Compare": [self.option_entry.get().strip()]
-            }
-
-            # set the args to pass to the final function based on their choice.
-            argsToPass = args_translation[self.option_value.get()]
-
             # only pass the value of the write_to_file entry if wtf is checked.
             write_to_file = self.wtf_entry.get() if self.wtf_checkbox.get() else ""
-            # Create the WorkerThread class to run the Jaide functions.
-            self.thread = WorkerThread(
-                argsToPass=argsToPass,
-                sess_timeout=timeout,
-                conn_timeout=self.conn_timeout_entry.get(),
-                port=self.port_entry.get(),
-                command=function,
-                stdout=self.stdout_queue,
-                ip=self.ip_entry.get(),
-                username=username,
-                password=self.password_entry.get().strip(),
-                write_to_file=write_to_file,
-                wtf_style=self.wtf_radiobuttons.get(),
+            hosts = job_hosts(self.ip_entry.get())
+            # Journal the outcome of each device, so the run can be resumed.
+            if checkpoint_file is None:
+                try:
+                    checkpoint_file = new_checkpoint(self.template_values(),
+                                                     hosts)
+                except (IOError, OSError) as e:
+                    self.write_to_output_area("Could not start a checkpoint, "
+                                              "the run can't be resumed. "
+                                              "Error:\n" + str(e))
+                    checkpoint_file = ""
+            # Queue a job to run the Jaide functions. Its WorkerThread is
+            # created once it is able to start.
+            job = self.scheduler.submit(
+                name=self.option_value.get(),
+                hosts=hosts,
+                writes=self.option_value.get() in WRITE_OPTIONS,
+                thread_args=dict(
+                    argsToPass=argsToPass,
+                    sess_timeout=timeout,
+                    conn_timeout=self.conn_timeout_entry.get(),
+                    port=self.port_entry.get(),
+                    command=function,
+                    ip=self.ip_entry.get(),
+                    username=username,
+                    password=self.password_entry.get().strip(),
+                    write_to_file=write_to_file,
+                    wtf_style=self.wtf_radiobuttons.get(),
+                    concurrency=self.concurrency_entry.get(),
+                    deadline=self.deadline_entry.get(),
+                    engine=self.engine_value.get().lower(),
+                    reuse_sessions=self.reuse_sessions_box.get(),
+                    preflight=self.preflight_box.get(),
+                    trace_file=(self.trace_entry.get()
+                                if self.trace_box.get() else ""),
+                    checkpoint_file=checkpoint_file,
+                    record=self.record_box.get(),
+                    operation=self.option_value.get(),
+                    use_cache=self.cache_box.get(),
+                    refresh=self.refresh_box.get(),
+                    delta=self.delta_box.get()
+                )
             )
-            self.thread.daemon = True
-            self.thread.start()
+            # Runs against a fleet of devices fill in a table as they go.
+            option = self.option_value.get()
+            if (option in self.record_tables and len(hosts) > 1 and
+                    (option != "Interface Errors" or self.delta_box.get())):
+                self.show_table(option, clear=(option == "Interface Errors"
+                                               and not self.running))
+            self.write_to_output_area("****** Queued Jaide job %d: %s on %d "
+                                      "device(s) ******\n" %
+                                      (job.id, job.name, job.total))
 
             # Change the state of the buttons now that the script is running,
-            # so the user can save the output, kill the script, etc.
-            self.go_button.configure(state="disabled")
+            # so the user can kill the script, etc. More runs can still be
+            # queued while it does.
             self.clear_button.configure(state="disabled")
             self.stop_button.configure(state="normal")
             self.save_button.configure(state="disabled")
+            # The progress counts from when nothing was running.
+            if not self.running:
+                self.progress.reset()
+            self.running = True
+            self.poll_interval = POLL_MIN
             self.get_output()
+            if self.progress_id is None:
+                self.update_progress()
 
     def get_output(self):
         """ Listen to WorkerThread and retrieve stdout from the Jaide script.
 
-        Purpose: This function listens to the sub process generated by the
-               | 'Run Script' button, and dumps the output to the output_area
-               | using the function write_to_output_area. If the process is no
-               | longer alive, it changes the activation of buttons, and lets
-               | the user know that the script is done.
+        Purpose: This function listens to the jobs queued by the 'Run
+               | Script' button, and dumps the output to the output_area
+               | using the function write_to_output_area. It lets the user
+               | know as each job finishes, starts the queued jobs that can
+               | now run, and once there are none left it changes the
+               | activation of buttons.
 
         @returns: None
         """
-        try:  # pull from the stdout_queue, and write it to the output_area
-            self.write_to_output_area(self.stdout_queue.get_nowait())
-        # Nothing in the queue, but the thread could be alive.
-        except Queue.Empty:
-            pass
-        # The WorkerThread subprocess has completed, and we need to wrap up.
-        if not self.thread.isAlive():
-            while not self.stdout_queue.empty():
-                self.write_to_output_area(self.stdout_queue.get_nowait())
-            self.go_button.configure(state="normal")
+        if self.poll_id is not None:
+            self.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.stdout_queue.woken()
+        finished = self.scheduler.reap()
+        # pull what's in the stdout_queue, and write it to the output_area.
+        # A finished job's output is all queued, so it's drained completely
+        # before saying the job is done.
+        wrote = self.drain_output(None if finished else DRAIN_BUDGET)
+        for job in finished:
+            self.write_to_output_area("****** Jaide job %d %s ******\n" %
+                                      (job.id, "Completed" if job.state ==
+                                       job.DONE else "Stopped"))
+            if job.stats.devices:
+                self.write_to_output_area(job.stats.summary())
+        for job in self.scheduler.start_ready():
+            self.write_to_output_area("****** Starting Jaide job %d ******\n"
+                                      % job.id)
+        if self.job_window is not None and self.job_window.winfo_exists():
+            self.job_window.refresh()
+        # Every job has completed, and we need to wrap up.
+        if not self.scheduler.active():
+            self.drain_output()
+            self.running = False
             self.clear_button.configure(state="normal")
             self.stop_button.configure(state="disabled")
             self.save_button.configure(state="normal")
             self.write_to_output_area("****** Jaide Command Completed ******\n")
-            self.thread.join()
+            if self.progress_id is not None:
+                self.after_cancel(self.progress_id)
+            self.update_progress()
             return
-        # recursively call this function every 100ms, writing any new output.
-        self.after(100, self.get_output)
+        # New output normally wakes us through output_ready(), so this poll
+        # backs off while nothing arrives. It still notices jobs ending.
+        if wrote:
+            self.poll_interval = POLL_MIN
+        else:
+            self.poll_interval = min(self.poll_interval * 2, POLL_MAX)
+        self.poll_id = self.after(self.poll_interval, self.get_output)
+
+    def update_progress(self):
+        """ Update the progress bar and counters from the progress events.
+
+        Purpose: Runs every PROGRESS_INTERVAL while any job is running, and
+               | once more after, so the counters end up matching the output.
+               | It only reads the progress_queue, never the output.
+
+        @returns: None
+        """
+        events = []
+        while True:
+            try:
+                events.append(self.progress_queue.get_nowait())
+            except Queue.Empty:
+                break
+        self.progress.update(events)
+        self.progress_bar.configure(maximum=max(self.progress.total, 1),
+                                    value=self.progress.finished)
+        self.progress_value.set(self.progress.describe())
+        if self.running:
+            self.progress_id = self.after(PROGRESS_INTERVAL,
+                                          self.update_progress)
+        else:
+            self.progress_id = None
+
+    def wake_output(self):
+        """ Ask the Tk main loop to call output_ready(), from any thread. """
+        self.event_generate("<<JaideOutput>>", when="tail")
+
+    def output_ready(self, event):
+        """ Handle the wakeup sent when output is put on stdout_queue.
+
+        @param event: The <<JaideOutput>> virtual event.
+        @type event: Tkinter.event object
+
+        @returns: None
+        """
+        if self.running:
+            self.get_output()
+        else:
+            self.stdout_queue.woken()
+            self.drain_output()
+
+    def drain_output(self, budget=None):
+        """ Move everything waiting in stdout_queue into the output_area.
+
+        Purpose: Rather than one result per tick, this pulls as many as are
+               | available within the time budget, and writes them all with
+               | a single insert and scroll, so the display keeps up with the
+               | workers no matter how many devices there are. The output of
+               | each device is indexed under its host in the log_store, and
+               | added to the host_list.
+
+        @param budget: The most seconds to spend pulling from the queue, or
+                     | None to empty it completely.
+        @type budget: float
+
+        @returns: True if any output was written.
+        @rtype: bool
+        """
+        outputs = []
+        deadline = time.time() + budget if budget is not None else None
+        while deadline is None or time.time() < deadline:
+            try:
+                output = self.stdout_queue.get_nowait()
+            except Queue.Empty:
+                break
+            if isinstance(output, DeviceResult):
+                self.scheduler.record(output)
+                if output.records:
+                    self.add_records(output)
+                outputs.append((output.output, output.host, output.status))
+            elif isinstance(output, basestring):
+                outputs.append((output, None, None))
+        outputs = [(output if output.endswith("\n") else output + "\n", host,
+                    status) for output, host, status in outputs]
+        if outputs:
+            self.output_area.extend(outputs)
+            for output, host, status in outputs:
+                if host is not None:
+                    self.host_list.add(host)
+                    self.output_search.add(host, output)
+        return bool(outputs)
 
     def input_validation(self):
         """ Validate the inputs the user has entered.
@@ -619,6 +934,9 @@ class JaideGUI(tk.Tk):
         elif self.wtf_entry.get() == "" and self.wtf_checkbox.get():
             tkMessageBox.showinfo("Write to File", "When writing to a file, a "
                                   "filename must be specified.")
+        elif self.trace_entry.get() == "" and self.trace_box.get():
+            tkMessageBox.showinfo("Record Trace", "When recording a trace, a "
+                                  "filename must be specified.")
         # Ensure that if an option is chosen that requires extra input that
         # they have something in the entry widget.
         elif (self.option_value.get() in self.yes_options and
@@ -648,6 +966,16 @@ class JaideGUI(tk.Tk):
             tkMessageBox.showinfo("Commit Comment", "If commenting on the "
                                   "commit, you must specify a string, and "
                                   "it cannot contain double-quotes (\").")
+        elif not self.valid_concurrency():
+            tkMessageBox.showinfo("Concurrency", "Concurrency must be a number"
+                                  " of devices to run against at once, 'auto'"
+                                  ", or 'auto:<max>' to adapt up to a maximum"
+                                  " number of devices.")
+        elif not self.valid_deadline():
+            tkMessageBox.showinfo("Device Deadline", "The device deadline must"
+                                  " be a number of seconds, 'auto' to allow "
+                                  "the connection timeout plus twice the "
+                                  "session timeout, or 'off'.")
         else:
             try:
                 if (self.option_value.get() == 'Set Command(s)' and
@@ -669,6 +997,30 @@ class JaideGUI(tk.Tk):
                     return True
         return False
 
+    def valid_concurrency(self):
+        """ Check the concurrency setting can be parsed.
+
+        @returns: True if the concurrency entry holds a valid setting.
+        @rtype: bool
+        """
+        try:
+            parse_concurrency(self.concurrency_entry.get())
+        except ValueError:
+            return False
+        return True
+
+    def valid_deadline(self):
+        """ Check the device deadline setting can be parsed.
+
+        @returns: True if the deadline entry holds a valid setting.
+        @rtype: bool
+        """
+        try:
+            parse_deadline(self.deadline_entry.get(), 0, 0)
+        except ValueError:
+            return False
+        return True
+
     def show_about(self):
         """ Show the about text for the application. """
         aboutInfo = tk.Toplevel()
@@ -687,6 +1039,124 @@ class JaideGUI(tk.Tk):
                                   "jaidegui/releases/latest")
         aboutInfoLabel.pack()
 
+    def check_startup(self):
+        """ Record the startup timings, once the GUI is drawn and ready.
+
+        Purpose: First called once the window has been drawn, which is the
+               | time to first paint, and then polls until jaide has been
+               | imported and the execution pool has been warmed up, which is
+               | the time to ready. Run with --startup-benchmark to print
+               | the timings and exit once ready.
+
+        @returns: None
+        """
+        if self.first_paint is None:
+            self.update_idletasks()
+            self.first_paint = time.time() - STARTED
+        if loader.done.is_set() and self.exec_pool.spawns:
+            self.ready = time.time() - STARTED
+        elif time.time() - STARTED < STARTUP_LIMIT:
+            self.after(50, self.check_startup)
+            return
+        if "--startup-benchmark" in sys.argv:
+            print self.startup_summary()
+            self.exec_pool.shutdown()
+            self.destroy()
+
+    def startup_summary(self):
+        """ Describe how long the GUI took to start.
+
+        @returns: A human readable summary of the startup timings.
+        @rtype: str
+        """
+        return ("Startup: first paint %s, ready %s (jaide import %s)." %
+                tuple("%.2fs" % seconds if seconds is not None else "n/a"
+                      for seconds in (self.first_paint, self.ready,
+                                      loader.seconds)))
+
+    def show_jobs(self, event):
+        """ Show the Job Queue window, opening it if it isn't already.
+
+        @param event: Any command that tkinter binds a keyboard shortcut to
+                    | will receive the event parameter. It is a description of
+                    | the keyboard shortcut that generated the event.
+        @type event: Tkinter.event object
+
+        @returns: None
+        """
+        if self.job_window is None or not self.job_window.winfo_exists():
+            self.job_window = JobQueueWindow(self, self.scheduler)
+        self.job_window.lift()
+
+    def show_history(self, event):
+        """ Show the Result History window, opening it if it isn't already.
+
+        @param event: Any command that tkinter binds a keyboard shortcut to
+                    | will receive the event parameter. It is a description of
+                    | the keyboard shortcut that generated the event.
+        @type event: Tkinter.event object
+
+        @returns: None
+        """
+        if (self.history_window is None or
+                not self.history_window.winfo_exists()):
+            self.history_window = ResultHistoryWindow(
+                self, result_store.store, sorted(OPTION_FUNCTIONS))
+        self.history_window.lift()
+
+    def show_table(self, option, clear=False):
+        """ Show the table of records of a command option, opening it if it
+            isn't already.
+
+        @param option: The command option, a key of record_tables.
+        @type option: str
+        @param clear: Whether to remove the rows of earlier runs.
+        @type clear: bool
+
+        @returns: None
+        """
+        title, records, headings = self.record_tables[option]
+        if clear:
+            records.clear()
+        window = self.table_windows.get(title)
+        if window is None or not window.winfo_exists():
+            window = RecordTableWindow(self, title, records, headings)
+            self.table_windows[title] = window
+        else:
+            window.draw()
+        window.lift()
+
+    def add_records(self, result):
+        """ Add the records of a result to the table of its command option.
+
+        Purpose: The records are kept whether or not the table is open, and
+               | an open table is redrawn shortly after, so results arriving
+               | quickly only redraw it a few times a second.
+
+        @param result: The result, with its records.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: None
+        """
+        job = self.scheduler.jobs.get(result.job)
+        if job is None or job.name not in self.record_tables:
+            return
+        title, records, headings = self.record_tables[job.name]
+        records.add(result.records)
+        window = self.table_windows.get(title)
+        if window is not None and window.winfo_exists():
+            window.refresh()
+
+    def show_stats(self):
+        """ Show the instrumentation gathered about script execution. """
+        stats_info = tk.Toplevel()
+        stats_label = tk.Label(stats_info, padx=50, pady=50, justify="left",
+                               text=self.exec_pool.stats_summary() + "\n" +
+                               session_cache.cache.stats_summary() + "\n" +
+                               result_cache.cache.stats_summary() + "\n" +
+                               self.startup_summary())
+        stats_label.pack()
+
     def show_help(self):
         """ Show the help file or webpage.
 
@@ -699,7 +1169,7 @@ class JaideGUI(tk.Tk):
             pass
 
     def write_to_output_area(self, output):
-        """ Append string to output_area, and scroll to the bottom.
+        """ Append string to output_area, scrolling to it if at the bottom.
 
         @param output: String of the output to dump to the output_area
         @type output: str or unicode
@@ -709,8 +1179,7 @@ class JaideGUI(tk.Tk):
         if isinstance(output, basestring):
             if output[-1:] is not "\n":
                 output += "\n"
-            self.output_area.insert(tk.END, output)
-            self.output_area.see(tk.END)
+            self.output_area.append(output)
 
     def ask_template_save(self, event):
         """ Prompt to save a template.
@@ -748,20 +1217,11 @@ class JaideGUI(tk.Tk):
         @returns: None
         """
         try:
-            output_file = open(filepath, 'wb')
+            write_template(filepath, self.template_values())
         except IOError as e:
             self.write_to_output_area("Couldn't open file to save the %s file."
                                       " Attempted location: %s\nError:\n%s" %
-                                      (filetype, output_file, str(e)))
-        else:
-            # Write each template option in the dictionary to the template.
-            for key, value in self.template_opts.iteritems():
-                if key == "Password":  # passwords need to be encoded.
-                    output_file.write(key + ":~:" +
-                                      base64.b64encode(value.get()) + "\n")
-                else:
-                    output_file.write(key + ":~:" + str(value.get()) + "\n")
-            output_file.close()
+                                      (filetype, filepath, str(e)))
 
     def ask_template_open(self, event):
         """ Prompt for a filepath to open a template.
@@ -799,33 +1259,85 @@ class JaideGUI(tk.Tk):
             @returns: None
         """
         try:
-            input_file = open(filepath, "rb")
+            options = read_template(filepath)
         except IOError as e:
             self.write_to_output_area("Couldn't open " + filetype + " file to "
                                       "import values. Attempted file: " +
                                       filepath + " Error: \n" + str(e))
         else:
             try:
-                # TODO: change templates to be in JSON format.
-                # Read the template file and set the fields accordingly.
-                for line in input_file.readlines():
-                    line = line.split(':~:')
-                    if line[0] == "SingleOrMultipleFiles":
-                        self.template_opts[line[0]].set("key",
-                                                        line[1].rstrip())
-                    elif line[0] == "Password":
-                        self.password_entry.set(base64.b64decode(line[1].rstrip()))
-                    else:
-                        self.template_opts[line[0]].set(line[1].rstrip())
-                # check the option menu, wtf, commit check, and commit
-                # confirmed to update the visible options.
-                self.opt_select(self.option_value.get())
-                self.check_wtf()
+                self.set_fields(options)
             except Exception as e:
                 self.write_to_output_area("Could not open template. Error:\n"
                                           + str(e))
-            finally:
-                input_file.close()
+
+    def set_fields(self, options):
+        """ Set the fields to the options of a template.
+
+        @param options: The value of each option, keyed by template key.
+        @type options: dict
+
+        @returns: None
+        """
+        for key, value in options.iteritems():
+            if key == "SingleOrMultipleFiles":
+                self.template_opts[key].set("key", value)
+            else:
+                self.template_opts[key].set(value)
+        # check the option menu, wtf, commit check, and commit
+        # confirmed to update the visible options.
+        self.opt_select(self.option_value.get())
+        self.check_wtf()
+        self.check_trace()
+        self.check_engine()
+
+    def resume_run(self):
+        """ Resume the most recent run that didn't finish.
+
+        Purpose: Finds the newest checkpoint journal with devices left to
+               | run, other than those of the jobs still running, sets the
+               | fields to the options it was run with, and runs it again
+               | against only the devices that haven't finished or didn't
+               | succeed. The password isn't journalled, so the one in the
+               | password field is used.
+
+        @returns: None
+        """
+        running = [job.thread_args.get("checkpoint_file")
+                   for job in self.scheduler.jobs.values()
+                   if job.state in (job.QUEUED, job.RUNNING) or
+                   job.thread is not None]
+        try:
+            found = latest_unfinished(exclude=running)
+        except (IOError, OSError) as e:
+            self.write_to_output_area("Could not read the checkpoints. "
+                                      "Error:\n" + str(e))
+            return
+        if found is None:
+            tkMessageBox.showinfo("Resume Last Run", "There is no unfinished"
+                                  " run to resume.")
+            return
+        filepath, options, remaining = found
+        try:
+            self.set_fields(options)
+        except Exception as e:
+            self.write_to_output_area("Could not resume from %s. Error:\n%s"
+                                      % (filepath, str(e)))
+            return
+        self.ip_entry.set(",".join(remaining))
+        self.write_to_output_area("****** Resuming the run in %s, %d device(s)"
+                                  " left ******\n" % (filepath,
+                                                       len(remaining)))
+        self.go(None, checkpoint_file=filepath)
+
+    def template_values(self):
+        """ Gather the value of each option saved in templates.
+
+        @returns: The value of each widget in template_opts, keyed the same.
+        @rtype: dict
+        """
+        return dict((key, value.get())
+                    for key, value in self.template_opts.iteritems())
 
     def stop_script(self):
         """ Kill the active running script.
@@ -837,7 +1349,7 @@ class JaideGUI(tk.Tk):
             @returns: None
         """
         self.write_to_output_area("****** Attempting to Stop Jaide ******")
-        self.thread.kill_proc()
+        self.scheduler.stop_all()
 
     def opt_select(self, opt):
         """ Show and hide options fields when a drop down item is selected.
@@ -845,12 +1357,12 @@ class JaideGUI(tk.Tk):
         Purpose: This method looks at what option they have chosen from the
                | drop down menu, and show the appropriate fields for the user
                | to fill out for that option. This is the callback function for
-               | the Pmw.optionMenu, and this is the reason we use PMW, so that
-               | we can point the drop down menu at this callback function.
+               | the JaideOptionMenu, so that we can point the drop down menu
+               | at this callback function.
 
-        @param opt: The name of the option chosen by the user. The PMWmenu
-                  | object passes this automatically when the opt_select
-                  | function is called by choosing an option.
+        @param opt: The name of the option chosen by the user. The
+                  | JaideOptionMenu object passes this automatically when the
+                  | opt_select function is called by choosing an option.
         @type opt: str
 
         @returns: None
@@ -858,6 +1370,7 @@ class JaideGUI(tk.Tk):
         # First thing we do is forget all placement and deselect options,
         # then we'll update according to what they chose afterwards.
         self.format_box.grid_forget()
+        self.delta_box.grid_forget()
         self.set_frame.grid_forget()
         self.set_frame_2.grid_forget()
         self.option_entry.grid_forget()
@@ -917,6 +1430,8 @@ class JaideGUI(tk.Tk):
         else:
             # No option
             self.spacer_label.grid(column=1, columnspan=2, row=1, sticky="NW")
+            if opt == "Interface Errors":
+                self.delta_box.grid(column=0, row=1, sticky="NW")
 
         # Update the help text for the new command
         self.help_value.set(self.help_conversion[opt])
@@ -980,6 +1495,45 @@ class JaideGUI(tk.Tk):
             self.wtf_radiobuttons.grid_forget("index", 0)
             self.wtf_radiobuttons.grid_forget("index", 1)
 
+    def open_trace(self):
+        """ Ask for and insert a filepath into the trace_entry object. """
+        return_file = tkFileDialog.asksaveasfilename(defaultextension=".json")
+        if return_file:
+            self.trace_entry.delete(0, tk.END)
+            self.trace_entry.insert(0, return_file)
+
+    def check_trace(self):
+        """ Show or hide the trace file options, like check_wtf(). """
+        if self.trace_box.get() == 1:
+            self.trace_entry.grid(column=3, row=0)
+            self.trace_button.grid(column=4, row=0, sticky="NW", padx=2)
+        else:
+            self.trace_entry.grid_forget()
+            self.trace_button.grid_forget()
+
+    def check_engine(self, engine=None):
+        """ Only allow Reuse sessions with the Thread engine.
+
+        Purpose: Sessions are cached in the process that opened them. With
+               | the Process engine every worker process would have a cache
+               | of its own, and a device is rarely given to the same worker
+               | twice, so the checkbox is unchecked and disabled, and says
+               | why.
+
+        @param engine: The engine picked, passed by the option menu. The
+                     | current engine is used either way.
+        @type engine: str
+
+        @returns: None
+        """
+        if self.engine_value.get() == "Thread":
+            self.reuse_sessions_box.configure(state="normal",
+                                              text="Reuse sessions")
+        else:
+            self.reuse_sessions_box.deselect()
+            self.reuse_sessions_box.configure(
+                state="disabled", text="Reuse sessions (Thread engine only)")
+
     def commit_option_update(self, check_type):
         """ Update the commit options.
 
@@ -1028,7 +1582,9 @@ class JaideGUI(tk.Tk):
 
         @returns: None
         """
-        self.output_area.delete(1.0, tk.END)
+        self.output_area.clear()
+        self.host_list.clear()
+        self.output_search.clear()
 
     def save_output(self):
         """ Save the text in the output area to a file. """
@@ -1036,13 +1592,10 @@ class JaideGUI(tk.Tk):
         # If no file is chosen, do not try to open it.
         if return_file:
             try:
-                outFile = open(return_file, 'w+b')
+                self.log_store.save(return_file)
             except IOError:
                 tkMessageBox.showinfo("Couldn't open file.", "The file you"
                                       " specified could not be opened.")
-            else:
-                outFile.write(self.output_area.get(1.0, tk.END))
-                outFile.close()
 
     def quit(self, event):
         """ Quit the application, called on selecting File > Quit.
@@ -1054,6 +1607,9 @@ class JaideGUI(tk.Tk):
 
         @returns: None
         """
+        self.exec_pool.shutdown()
+        session_cache.cache.clear()
+        result_store.store.flush()
         sys.exit(0)
 
     def clear_fields(self, event):
@@ -1069,10 +1625,23 @@ class JaideGUI(tk.Tk):
         self.ip_entry.delete(0, tk.END)
         self.timeout_entry.delete(0, tk.END)
         self.timeout_entry.insert(0, '300')
+        self.concurrency_entry.set('auto')
+        self.deadline_entry.set('auto')
+        self.engine_value.set('Process')
         self.username_entry.delete(0, tk.END)
         self.password_entry.delete(0, tk.END)
         self.wtf_entry.delete(0, tk.END)
         self.wtf_checkbox.deselect()
+        self.reuse_sessions_box.deselect()
+        self.preflight_box.deselect()
+        self.record_box.select()
+        self.cache_box.deselect()
+        self.refresh_box.deselect()
+        self.delta_box.deselect()
+        self.trace_entry.delete(0, tk.END)
+        self.trace_box.deselect()
+        self.check_trace()
+        self.check_engine()
         self.option_entry.delete(0, tk.END)
         self.option_entry.delete(0, tk.END)
         self.scp_dest_entry.delete(0, tk.END)
@@ -1092,17 +1661,18 @@ class JaideGUI(tk.Tk):
         self.sep2.grid(row=1, column=0, sticky="WE", pady=12, padx=12)
 
         self.wtf_frame.grid(row=2, column=0, sticky="NW", padx=(25, 0))
-        self.sep3.grid(row=3, column=0, sticky="WE", pady=12, padx=12)
+        self.perf_frame.grid(row=3, column=0, sticky="NW", padx=(25, 0))
+        self.sep3.grid(row=4, column=0, sticky="WE", pady=12, padx=12)
 
-        self.options_frame.grid(row=4, column=0, sticky="NEW", padx=(25, 0))
-        self.sep4.grid(row=5, column=0, sticky="WE", pady=12, padx=12)
+        self.options_frame.grid(row=5, column=0, sticky="NEW", padx=(25, 0))
+        self.sep4.grid(row=6, column=0, sticky="WE", pady=12, padx=12)
 
-        self.help_frame.grid(row=6, column=0, sticky="NW", padx=(25, 0))
-        self.sep5.grid(row=7, column=0, sticky="WE", pady=12, padx=12)
+        self.help_frame.grid(row=7, column=0, sticky="NW", padx=(25, 0))
+        self.sep5.grid(row=8, column=0, sticky="WE", pady=12, padx=12)
 
-        self.buttons_frame.grid(row=8, column=0, sticky="NW",
+        self.buttons_frame.grid(row=9, column=0, sticky="NW",
                                 padx=(25, 25), pady=(0, 10))
-        self.output_frame.grid(row=9, column=0, sticky="SWNE",
+        self.output_frame.grid(row=10, column=0, sticky="SWNE",
                                padx=(25, 25), pady=(0, 25))
 
         self.update()
@@ -1112,6 +1682,7 @@ class JaideGUI(tk.Tk):
         if self.frames_shown:
             self.ip_cred_frame.grid_forget()
             self.wtf_frame.grid_forget()
+            self.perf_frame.grid_forget()
             self.help_frame.grid_forget()
 
             self.sep2.grid_forget()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+""" CounterBaselines Class.
+
+Purpose: This class turns the Interface Errors option into a report of only
+the errors that are new. jaide.wrap.interface_errors reports the absolute
+value of every non-zero error counter, so the same errors from years ago
+show up on every run. With delta mode on, the counters in the output of each
+device are compared with the ones it had on its previous run, its baseline,
+and only the counters that went up are reported, with how much they went up
+by per minute. The counters are then stored as the device's new baseline.
+
+A counter that went down was cleared (or the device restarted) since the
+baseline, so all of its current value is counted as new. jaide only reports
+flapping interfaces as having more than 50 flaps, without a count, so those
+are left out of the comparison.
+
+The baselines are kept in interface_baselines.db in jaidegui's data folder,
+as one row per device holding its counters as compressed JSON. The module
+level 'baselines' object is shared by the whole process.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+# A counter line of the jaide interface_errors output, such as
+# 'ge-0/0/0 (up/up) has 12 of input-crc-errors.'
+COUNTER_LINE = re.compile(r"^(\S+) \(([^)]*)\) has (\d+) of (\S+)\.$")
+# The line jaide outputs when no counter is above zero.
+NO_ERRORS = "No interface errors were detected"
+# The columns of each row of a delta report, in the order shown.
+COLUMNS = ["host", "interface", "status", "counter", "previous", "current",
+           "increase", "per_minute"]
+# The heading of each column.
+HEADINGS = ["Host", "Interface", "Status", "Counter", "Previous", "Current",
+            "Increase", "Per Minute"]
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS baselines (
+    host TEXT PRIMARY KEY,
+    taken REAL,
+    counters BLOB
+);
+"""
+
+
+def parse_counters(output):
+    """ Read the error counters out of the interface_errors output.
+
+    @param output: The output of jaide.wrap.interface_errors, with or without
+                 | the 'Results from device' header.
+    @type output: str
+
+    @returns: Maps each interface to its admin/oper status and a dict of its
+            | non-zero counters, or None if the output isn't interface_errors
+            | output, such as an error message.
+    @rtype: dict
+    """
+    interfaces = {}
+    parsed = False
+    for line in output.splitlines():
+        match = COUNTER_LINE.match(line.strip())
+        if match:
+            name, status, value, counter = match.groups()
+            interfaces.setdefault(name, (status, {}))[1][counter] = int(value)
+            parsed = True
+        elif line.startswith(NO_ERRORS):
+            parsed = True
+    return interfaces if parsed else None
+
+
+def split_header(output):
+    """ Split the 'Results from device' header from the rest of the output.
+
+    @returns: The header, up to and including the line naming the device, and
+            | the rest of the output.
+    @rtype: tuple
+    """
+    index = output.find("Results from device:")
+    if index == -1:
+        return "", output
+    end = output.find("\n", index) + 1 or len(output)
+    return output[:end], output[end:]
+
+
+class CounterBaselines(object):
+
+    """ Keep the interface error counters of each device, to compare with. """
+
+    def __init__(self, filepath=None):
+        """ Initialize the CounterBaselines object, opening nothing yet.
+
+        @param filepath: The database file, defaults to
+                       | interface_baselines.db in jaidegui's data folder.
+        @type filepath: str
+
+        @returns: None
+        """
+        self.filepath = filepath
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """ Return the connection to the database, opening it if needed.
+
+        @rtype: sqlite3.Connection
+        """
+        if self._connection is None:
+            if self.filepath is None:
+                from module_locator import data_path
+                self.filepath = os.path.join(data_path(),
+                                             "interface_baselines.db")
+            # Results arrive on the pool's callback thread, and the watchdog's.
+            self._connection = sqlite3.connect(self.filepath, timeout=30,
+                                               check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def compare(self, host, interfaces, now=None):
+        """ Compare a device's counters with its baseline, and make them its
+            new baseline.
+
+        @param host: The IP or hostname of the device.
+        @type host: str
+        @param interfaces: The device's counters, from parse_counters().
+        @type interfaces: dict
+        @param now: The time.time() the counters were read at.
+        @type now: float
+
+        @returns: The time.time() of the baseline, or None if the device
+                | didn't have one, and a dict of COLUMNS for each counter
+                | that went up, in interface and counter order.
+        @rtype: tuple
+
+        @raises sqlite3.Error: if the baselines couldn't be read or written.
+        """
+        now = time.time() if now is None else now
+        current = dict((name, counters) for name, (status, counters)
+                       in interfaces.iteritems())
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT taken, counters FROM baselines "
+                                     "WHERE host = ?", (host,)).fetchone()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO baselines (host, taken, counters) "
+                    "VALUES (?, ?, ?)", (host, now, sqlite3.Binary(
+                        zlib.compress(json.dumps(current)))))
+        if row is None:
+            return None, []
+        taken = row[0]
+        previous = json.loads(zlib.decompress(str(row[1])))
+        minutes = max(now - taken, 1.0) / 60
+        rows = []
+        for name in sorted(interfaces):
+            status, counters = interfaces[name]
+            for counter in sorted(counters):
+                value = counters[counter]
+                before = previous.get(name, {}).get(counter, 0)
+                # A counter that went down was cleared since the baseline.
+                increase = value - before if value >= before else value
+                if increase > 0:
+                    rows.append({"host": host, "interface": name,
+                                 "status": status, "counter": counter,
+                                 "previous": before, "current": value,
+                                 "increase": increase,
+                                 "per_minute": round(increase / minutes, 2)})
+        return taken, rows
+
+
+def delta_report(interfaces, taken, rows, now=None):
+    """ Describe the counters that went up since the baseline.
+
+    @param interfaces: The device's counters, from parse_counters().
+    @type interfaces: dict
+    @param taken: The time.time() of the baseline, or None if there wasn't
+                | one.
+    @type taken: float
+    @param rows: The counters that went up, from CounterBaselines.compare().
+    @type rows: list
+    @param now: The time.time() the counters were read at.
+    @type now: float
+
+    @returns: The report, to show in place of the interface_errors output.
+    @rtype: str
+    """
+    if taken is None:
+        return ("No baseline yet, so the %d error counter(s) below were "
+                "recorded as one. Run again to see the counters that go up.\n"
+                %
+                sum(len(counters) for status, counters in
+                    interfaces.itervalues()))
+    now = time.time() if now is None else now
+    since = "since %s (%.1f minutes ago)" % (
+        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(taken)),
+        (now - taken) / 60)
+    if not rows:
+        return "No interface error counters went up %s.\n" % since
+    lines = ["%d interface error counter(s) went up %s:" % (len(rows), since)]
+    for row in rows:
+        lines.append("%(interface)s (%(status)s) %(counter)s: %(previous)d -> "
+                     "%(current)d, +%(increase)d (%(per_minute).2f/min)" % row)
+    return "\n".join(lines) + "\n"
+
+
+# The interface counter baselines for this process.
+baselines = CounterBaselines()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+""" JaideLoader Class.
+
+Purpose: This class imports the jaide package, and with it ncclient, paramiko,
+lxml and Crypto, on a background thread once the GUI window is up, instead of
+at module import time. Those imports take several seconds in the frozen
+builds, and nothing on screen needs them, so deferring them lets the window
+draw straight away. Anything that does need jaide calls load(), which returns
+immediately once the background import is done, or waits for it (or does the
+import itself) if it isn't.
+
+The module level 'loader' object is shared by the whole GUI process.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import threading
+import time
+
+
+class JaideLoader(object):
+
+    """ Import the jaide stack once, in the background or on first use. """
+
+    def __init__(self):
+        """ Initialize the JaideLoader object, importing nothing yet. """
+        self._lock = threading.Lock()
+        self.done = threading.Event()
+        self.wrap = None
+        # Seconds the import took, for the startup benchmark.
+        self.seconds = None
+
+    def start(self):
+        """ Begin importing on a background thread, if not already done.
+
+        @returns: None
+        """
+        load_thread = threading.Thread(target=self._load_quietly)
+        load_thread.daemon = True
+        load_thread.start()
+
+    def load(self):
+        """ Import the jaide stack, or wait for the import in progress.
+
+        @returns: The jaide.wrap module.
+        @rtype: module
+
+        @raises ImportError: if jaide or one of its dependencies couldn't be
+                           | imported.
+        """
+        with self._lock:
+            if not self.done.is_set():
+                start = time.time()
+                from jaide import wrap
+                # Also import the modules used by the WorkerThread.
+                import jaide.utils
+                import jaide.color_utils
+                self.wrap = wrap
+                self.seconds = time.time() - start
+                self.done.set()
+        return self.wrap
+
+    def _load_quietly(self):
+        """ Run load(), leaving any error to be raised by the next load(). """
+        try:
+            self.load()
+        except ImportError:
+            pass
+
+
+# The loader for this process.
+loader = JaideLoader()
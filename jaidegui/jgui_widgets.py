@@ -12,9 +12,27 @@ JaideEntry class documented here below is an example of doing that by using
 the self.contents variable to track the value of the text within the entry
 widget. The JaideCheckbox class does this same with self.contents acting as
 a Tkinter.IntVar to store the boolean integer of whether or not the
-checkbox is checked.
+checkbox is checked. The JaideOptionMenu class does the same for the chosen
+item of a drop down menu, and calls a function whenever one is chosen.
+
+The OutputViewer class is the output area of the GUI. It shows a window onto
+a jaidegui.log_store.LogStore, rather than holding all of the output itself,
+and the HostList class lists the hosts in the store to jump between them. The
+SearchBar class searches the output of each host in the background, and the
+JobQueueWindow class shows the jobs queued to run. The ResultHistoryWindow
+class looks up the results recorded by earlier runs, and the
+RecordTableWindow class shows the records parsed from the results, kept in a
+jaidegui.record_set.RecordSet, in a table.
 """
 import Tkinter as tk
+import tkFileDialog
+import tkMessageBox
+import ttk
+import Queue
+import time
+
+from output_search import compile_pattern
+from result_store import parse_time, QUERY_LIMIT
 
 
 class JaideEntry(tk.Entry):
@@ -147,6 +165,46 @@ class JaideRadiobutton():
             self.Radiobuttons[self.values.index(index)].select()
 
 
+class JaideOptionMenu(tk.OptionMenu):
+
+    """ Drop down menu that calls a function when an item is chosen.
+
+    The JaideOptionMenu class inherits and extends the Tkinter.OptionMenu
+    class so that, like the JaideEntry, the chosen value is kept in
+    self.contents, and a command can be given that is called with the chosen
+    item each time one is chosen from the menu.
+    """
+
+    def __init__(self, parent, items, command=None, variable=None, **kw):
+        """ Initialize the option menu with the first item chosen.
+
+        @param items: The items in the menu, in order.
+        @type items: list of strings
+        @param command: Function called with the chosen item whenever one is
+                      | chosen from the menu. Not called by set().
+        @type command: function
+        @param variable: Variable to keep the chosen item in, defaults to a
+                       | new Tkinter.StringVar.
+        @type variable: Tkinter.StringVar
+        @param **kw: Other options for the menubutton, such as takefocus.
+        """
+        self.contents = variable if variable is not None else tk.StringVar()
+        if self.contents.get() not in items:
+            self.contents.set(items[0])
+        tk.OptionMenu.__init__(self, parent, self.contents, *items,
+                               command=command)
+        if kw:
+            self.config(**kw)
+
+    def get(self):
+        """ Getter for the chosen item. """
+        return self.contents.get()
+
+    def set(self, value):
+        """ Setter for the chosen item. """
+        self.contents.set(value)
+
+
 class AutoScrollbar(tk.Scrollbar):
 
     """ A scrollbar that hides itself if it's not needed.
@@ -164,3 +222,840 @@ class AutoScrollbar(tk.Scrollbar):
         else:
             self.grid()
         tk.Scrollbar.set(self, lo, hi)
+
+
+class OutputViewer(tk.Frame):
+
+    """ Scrollable, read-only view onto a LogStore.
+
+    Only a window of at most ring_size lines of the store is ever held in the
+    Text widget. Scrolling to either edge of the window pages the next lines
+    in from the store, and the vertical scrollbar is mapped onto the whole
+    store rather than the window, so the output can grow without bound while
+    the widget stays small and fast. Line numbers here are the store's view
+    lines, which skip collapsed sections.
+    """
+
+    def __init__(self, parent, store, ring_size=2000, **kw):
+        """ Create the Text widget and its scrollbars.
+
+        @param store: The store of lines to view.
+        @type store: jaidegui.log_store.LogStore
+        @param ring_size: The most lines to hold in the Text widget at once.
+        @type ring_size: int
+        """
+        tk.Frame.__init__(self, parent, kw)
+        self.store = store
+        self.ring_size = ring_size
+        # View index of the first line in the widget, and the number of view
+        # lines in the widget.
+        self.first = 0
+        self.count = 0
+        self.paging = False
+        # Compiled pattern to highlight the matches of, if any.
+        self.pattern = None
+        self.text = tk.Text(self, wrap=tk.NONE, state="disabled", takefocus=0)
+        self.text.tag_config("match", background="yellow")
+        self.xscrollbar = AutoScrollbar(self, command=self.text.xview,
+                                        orient=tk.HORIZONTAL, takefocus=0)
+        self.yscrollbar = AutoScrollbar(self, command=self.yview, takefocus=0)
+        self.text.config(yscrollcommand=self.text_scrolled,
+                         xscrollcommand=self.xscrollbar.set)
+        self.text.grid(column=0, row=0, sticky="SWNE")
+        self.xscrollbar.grid(column=0, row=1, sticky="SWNE")
+        self.yscrollbar.grid(column=1, row=0, sticky="SWNE")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    def append(self, output, host=None, status=None):
+        """ Add output to the store, and show it if we're following the end.
+
+        @param output: The text to add.
+        @type output: str or unicode
+        @param host: The host the output came from, see LogStore.append().
+        @type host: str
+        @param status: The status of the host's result.
+        @type status: str
+        """
+        self.extend([(output, host, status)])
+
+    def extend(self, outputs):
+        """ Add several outputs to the store, then show them all at once.
+
+        @param outputs: A list of (output, host, status) tuples, see append().
+        @type outputs: list
+        """
+        following = (self.first + self.count >= self.store.view_len() and
+                     float(self.text.yview()[1]) >= 1.0)
+        first_line = None
+        for output, host, status in outputs:
+            line = self.store.append(output, host, status)
+            first_line = line if first_line is None else first_line
+        if first_line is None:
+            return
+        if not following:
+            self.text_scrolled(*self.text.yview())
+            return
+        self.text.config(state="normal")
+        if self.store.view_index(first_line) < self.first + self.count:
+            # The last line wasn't finished, so it is re-read in full.
+            self.text.delete("end - 1 lines linestart", tk.END)
+            self.count -= 1
+        total = self.store.view_len()
+        self.text.insert(tk.END, self.store.view_lines(self.first + self.count,
+                                                       total))
+        self.count = total - self.first
+        if self.count > self.ring_size:
+            excess = self.count - self.ring_size
+            self.text.delete("1.0", "%d.0" % (excess + 1))
+            self.first += excess
+            self.count -= excess
+        self.text.config(state="disabled")
+        self.text.see(tk.END)
+
+    def load(self, start, top=None):
+        """ Fill the widget with ring_size lines of the store.
+
+        @param start: The view index of the first line to load.
+        @type start: int
+        @param top: The view index of the line to scroll to the top of the
+                  | view, defaults to start.
+        @type top: int
+        """
+        total = self.store.view_len()
+        start = max(0, min(start, total - self.ring_size))
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, self.store.view_lines(start,
+                                                       start + self.ring_size))
+        self.text.config(state="disabled")
+        self.first = start
+        self.count = min(self.ring_size, total - start)
+        top = start if top is None else top
+        self.text.yview(tk.MOVETO, float(top - start) / max(self.count, 1))
+        self.highlight_window()
+
+    def highlight(self, pattern):
+        """ Highlight the matches of a pattern, or stop if it is None.
+
+        Purpose: Only the lines loaded in the widget are ever highlighted,
+               | so this costs the same however large the output is. The
+               | highlighting is redone each time other lines are loaded.
+
+        @param pattern: The compiled pattern to highlight.
+        @type pattern: re.RegexObject
+        """
+        self.pattern = pattern
+        self.highlight_window()
+
+    def highlight_window(self):
+        """ Highlight the matches of pattern in the lines loaded. """
+        self.text.tag_remove("match", "1.0", tk.END)
+        if self.pattern is None:
+            return
+        for match in self.pattern.finditer(self.text.get("1.0", tk.END)):
+            if match.end() > match.start():
+                self.text.tag_add("match", "1.0 + %d chars" % match.start(),
+                                  "1.0 + %d chars" % match.end())
+
+    def show_line(self, line):
+        """ Scroll so that a line of the store is at the top of the view.
+
+        @param line: The index of the line in the store.
+        @type line: int
+        """
+        line = self.store.view_index(line)
+        self.load(line - self.ring_size // 2, line)
+
+    def refresh(self):
+        """ Reload the window, keeping the top line, after a collapse. """
+        top = self.first + int(float(self.text.yview()[0]) *
+                               max(self.count, 1))
+        self.load(top - self.ring_size // 2, min(top,
+                                                  self.store.view_len() - 1))
+
+    def clear(self):
+        """ Empty both the store and the widget. """
+        self.store.clear()
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.config(state="disabled")
+        self.first = 0
+        self.count = 0
+
+    def yview(self, *args):
+        """ Scroll the view, the command of the vertical scrollbar.
+
+        Purpose: 'moveto' positions are a fraction of the whole store, so
+               | a position outside the window loads the lines around it.
+               | Scrolling by units or pages scrolls the widget, and
+               | text_scrolled() pages in more lines at its edges.
+        """
+        if args and args[0] == tk.MOVETO:
+            target = int(float(args[1]) * self.store.view_len())
+            visible = self.visible_lines()
+            if (target < self.first or
+                    target + visible > self.first + self.count):
+                self.load(target - self.ring_size // 2, target)
+            else:
+                self.text.yview(tk.MOVETO, float(target - self.first) /
+                                max(self.count, 1))
+        else:
+            self.text.yview(*args)
+
+    def visible_lines(self):
+        """ Return roughly how many lines fit in the widget. """
+        top = int(self.text.index("@0,0").split(".")[0])
+        bottom = int(self.text.index("@0,%d" % self.text.winfo_height())
+                     .split(".")[0])
+        return bottom - top + 1
+
+    def text_scrolled(self, lo, hi):
+        """ Update the scrollbar, and page lines in at the window's edges.
+
+        Purpose: The yscrollcommand of the Text widget. It converts the
+               | position within the window to a position within the store
+               | for the scrollbar, and loads more of the store when the
+               | view reaches the top or bottom of the window.
+        """
+        total = self.store.view_len()
+        count = max(self.count, 1)
+        self.yscrollbar.set((self.first + float(lo) * count) / max(total, 1),
+                            (self.first + float(hi) * count) / max(total, 1))
+        if self.paging:
+            return
+        top = self.first + int(float(lo) * count)
+        if float(lo) <= 0.0 and self.first > 0:
+            start = self.first - self.ring_size // 2
+        elif float(hi) >= 1.0 and self.first + self.count < total:
+            start = self.first + self.ring_size // 2
+        else:
+            return
+        # Page after Tk has finished updating the view.
+        self.paging = True
+        self.after_idle(self.page, start, top)
+
+    def page(self, start, top):
+        """ Load the window starting at start, keeping top in view. """
+        self.load(start, top)
+        self.paging = False
+
+
+class HostList(tk.Frame):
+
+    """ List of the hosts in a LogStore, to jump to and collapse their output.
+
+    Each row shows a host along with the status and size of its output.
+    Double clicking a row scrolls the OutputViewer to that host's output, and
+    the buttons collapse or expand the output of the selected hosts, or of
+    all of them. Looking a host up goes through the store's index of sections,
+    never through the text itself.
+    """
+
+    def __init__(self, parent, store, viewer, **kw):
+        """ Create the listbox and its buttons.
+
+        @param store: The store holding the output of the hosts.
+        @type store: jaidegui.log_store.LogStore
+        @param viewer: The viewer to scroll when a host is picked.
+        @type viewer: OutputViewer
+        """
+        tk.Frame.__init__(self, parent, kw)
+        self.store = store
+        self.viewer = viewer
+        # The host in each row, and the row of each host.
+        self.hosts = []
+        self.rows = {}
+        self.listbox = tk.Listbox(self, width=28, selectmode=tk.EXTENDED,
+                                  takefocus=0)
+        self.scrollbar = AutoScrollbar(self, command=self.listbox.yview,
+                                       takefocus=0)
+        self.listbox.config(yscrollcommand=self.scrollbar.set)
+        self.buttons = tk.Frame(self)
+        self.toggle_button = tk.Button(self.buttons, text="Collapse/Expand",
+                                       command=self.toggle_selected,
+                                       takefocus=0)
+        self.collapse_button = tk.Button(self.buttons, text="Collapse All",
+                                         command=lambda: self.set_all(True),
+                                         takefocus=0)
+        self.expand_button = tk.Button(self.buttons, text="Expand All",
+                                       command=lambda: self.set_all(False),
+                                       takefocus=0)
+        self.listbox.grid(column=0, row=0, sticky="SWNE")
+        self.scrollbar.grid(column=1, row=0, sticky="SWNE")
+        self.buttons.grid(column=0, columnspan=2, row=1, sticky="NW")
+        self.toggle_button.grid(column=0, row=0, columnspan=2, sticky="EW")
+        self.collapse_button.grid(column=0, row=1, sticky="EW")
+        self.expand_button.grid(column=1, row=1, sticky="EW")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.listbox.bind("<Double-Button-1>", self.jump)
+
+    def add(self, host):
+        """ Add a row for a host, or update its row if it already has one.
+
+        @param host: The host to show.
+        @type host: str
+        """
+        row = self.rows.get(host)
+        if row is None:
+            self.rows[host] = len(self.hosts)
+            self.hosts.append(host)
+            self.listbox.insert(tk.END, self.describe(host))
+        else:
+            self.listbox.delete(row)
+            self.listbox.insert(row, self.describe(host))
+
+    def describe(self, host):
+        """ Build the text of the row for a host. """
+        section = self.store.section(host)
+        return "%s %s (%s, %.1f KB)" % ("+" if section.collapsed else "-",
+                                        host, section.status,
+                                        section.size / 1024.0)
+
+    def jump(self, event=None):
+        """ Scroll the viewer to the output of the selected host. """
+        selection = self.listbox.curselection()
+        if selection:
+            section = self.store.section(self.hosts[int(selection[0])])
+            self.viewer.show_line(section.start)
+
+    def toggle_selected(self):
+        """ Collapse or expand the output of each selected host. """
+        for row in self.listbox.curselection():
+            host = self.hosts[int(row)]
+            self.store.set_collapsed(host,
+                                     not self.store.section(host).collapsed)
+            self.add(host)
+            self.listbox.selection_set(row)
+        self.viewer.refresh()
+
+    def set_all(self, collapsed):
+        """ Collapse or expand the output of every host. """
+        for host in self.hosts:
+            self.store.set_collapsed(host, collapsed)
+            self.add(host)
+        self.viewer.refresh()
+
+    def select(self, hosts):
+        """ Select the rows of the hosts given, and scroll to the first.
+
+        @param hosts: The hosts to select.
+        @type hosts: list
+        """
+        self.listbox.selection_clear(0, tk.END)
+        for host in hosts:
+            if host in self.rows:
+                self.listbox.selection_set(self.rows[host])
+        if hosts and hosts[0] in self.rows:
+            self.listbox.see(self.rows[hosts[0]])
+
+    def clear(self):
+        """ Remove every row. """
+        self.listbox.delete(0, tk.END)
+        self.hosts = []
+        self.rows = {}
+
+
+class SearchBar(tk.Frame):
+
+    """ Search the output of each host, and select or filter the matches.
+
+    The search itself runs on a jaidegui.output_search.OutputSearch thread,
+    and is polled for its result with after(), so the GUI never waits on it.
+    The hosts that matched are selected in the HostList, the matches loaded in
+    the OutputViewer are highlighted, and with 'Matches only' checked, the
+    output of every other host is collapsed.
+    """
+
+    def __init__(self, parent, searcher, viewer, host_list, **kw):
+        """ Create the search entry, its options and the status label.
+
+        @param searcher: The thread that runs the searches.
+        @type searcher: jaidegui.output_search.OutputSearch
+        @param viewer: The viewer to highlight the matches in.
+        @type viewer: OutputViewer
+        @param host_list: The list to select the matching hosts in.
+        @type host_list: HostList
+        """
+        tk.Frame.__init__(self, parent, kw)
+        self.searcher = searcher
+        self.viewer = viewer
+        self.host_list = host_list
+        # The generation of the search being waited on, if any, and the
+        # pattern and regex flag it was started with.
+        self.waiting = None
+        self.pattern = None
+        self.poll_id = None
+        self.search_label = tk.Label(self, text="Search:")
+        self.search_entry = JaideEntry(self)
+        self.regex_box = JaideCheckbox(self, text="Regex", takefocus=0)
+        self.filter_box = JaideCheckbox(self, text="Matches only",
+                                        takefocus=0)
+        self.search_button = tk.Button(self, text="Search", takefocus=0,
+                                       command=self.search)
+        self.status_label = tk.Label(self, text="")
+        self.search_label.grid(column=0, row=0, sticky="W")
+        self.search_entry.grid(column=1, row=0, sticky="EW")
+        self.regex_box.grid(column=2, row=0, sticky="W")
+        self.filter_box.grid(column=3, row=0, sticky="W")
+        self.search_button.grid(column=4, row=0, sticky="W")
+        self.status_label.grid(column=5, row=0, sticky="W")
+        self.columnconfigure(1, weight=1)
+        self.search_entry.bind("<Return>", self.search)
+
+    def search(self, event=None):
+        """ Start a search for what is in the entry, or clear the last one. """
+        pattern = self.search_entry.get()
+        if not pattern:
+            self.waiting = None
+            self.status_label.config(text="")
+            self.viewer.highlight(None)
+            self.host_list.select([])
+            return
+        self.pattern = (pattern, self.regex_box.get())
+        self.waiting = self.searcher.search(*self.pattern)
+        self.status_label.config(text="Searching...")
+        if self.poll_id is None:
+            self.poll()
+
+    def poll(self):
+        """ Pick up the result of the search being waited on, if it's done. """
+        self.poll_id = None
+        while True:
+            try:
+                generation, hosts, error = self.searcher.results.get_nowait()
+            except Queue.Empty:
+                break
+            if generation == self.waiting:
+                self.waiting = None
+                self.show(hosts, error)
+        if self.waiting is not None:
+            self.poll_id = self.after(100, self.poll)
+
+    def show(self, hosts, error):
+        """ Show the hosts that matched the search. """
+        if error:
+            self.status_label.config(text=error)
+            return
+        self.status_label.config(text="%d hosts matched" % len(hosts))
+        if self.filter_box.get():
+            matched = set(hosts)
+            for host in self.host_list.hosts:
+                self.viewer.store.set_collapsed(host, host not in matched)
+                self.host_list.add(host)
+            self.viewer.refresh()
+        self.host_list.select(hosts)
+        self.viewer.highlight(compile_pattern(*self.pattern))
+
+
+class JobQueueWindow(tk.Toplevel):
+
+    """ Window listing the queued jobs, with their progress and output.
+
+    Each job of a jaidegui.job_scheduler.JobScheduler gets a row showing what
+    it runs, on how many devices, how far along it is and its state. The
+    selected jobs can be stopped, removed once finished, have their own
+    output shown in a separate window, or have their timings exported.
+    refresh() must be called to update the rows.
+    """
+
+    def __init__(self, parent, scheduler, **kw):
+        """ Create the list of jobs and its buttons.
+
+        @param scheduler: The scheduler running the jobs.
+        @type scheduler: jaidegui.job_scheduler.JobScheduler
+        """
+        tk.Toplevel.__init__(self, parent, kw)
+        self.wm_title("Job Queue")
+        self.scheduler = scheduler
+        self.tree = ttk.Treeview(self, columns=("command", "devices",
+                                                "progress", "state"))
+        self.tree.heading("#0", text="Job")
+        self.tree.heading("command", text="Command")
+        self.tree.heading("devices", text="Devices")
+        self.tree.heading("progress", text="Progress")
+        self.tree.heading("state", text="State")
+        self.tree.column("#0", width=50)
+        self.tree.column("devices", width=70)
+        self.scrollbar = AutoScrollbar(self, command=self.tree.yview)
+        self.tree.config(yscrollcommand=self.scrollbar.set)
+        self.buttons = tk.Frame(self)
+        self.output_button = tk.Button(self.buttons, text="Show Output",
+                                       command=self.show_output)
+        self.stop_button = tk.Button(self.buttons, text="Stop Job",
+                                     command=self.stop_selected)
+        self.remove_button = tk.Button(self.buttons, text="Remove",
+                                       command=self.remove_selected)
+        self.export_button = tk.Button(self.buttons, text="Export Timings",
+                                       command=self.export_timings)
+        self.tree.grid(column=0, row=0, sticky="SWNE")
+        self.scrollbar.grid(column=1, row=0, sticky="SWNE")
+        self.buttons.grid(column=0, columnspan=2, row=1, sticky="W")
+        self.output_button.grid(column=0, row=0, padx=2)
+        self.stop_button.grid(column=1, row=0, padx=2)
+        self.remove_button.grid(column=2, row=0, padx=2)
+        self.export_button.grid(column=3, row=0, padx=2)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.tree.bind("<Double-Button-1>", lambda event: self.show_output())
+        self.refresh()
+
+    def refresh(self):
+        """ Update the row of each job, adding and removing rows as needed. """
+        rows = set(self.tree.get_children())
+        for job in self.scheduler.jobs.values():
+            values = (job.name, job.total, job.describe(), job.state)
+            if str(job.id) in rows:
+                self.tree.item(str(job.id), values=values)
+                rows.discard(str(job.id))
+            else:
+                self.tree.insert("", tk.END, str(job.id), text=str(job.id),
+                                 values=values)
+        if rows:
+            self.tree.delete(*rows)
+
+    def selected(self):
+        """ Return the jobs selected in the list. """
+        return [self.scheduler.jobs[int(row)] for row in self.tree.selection()
+                if int(row) in self.scheduler.jobs]
+
+    def stop_selected(self):
+        """ Stop the selected jobs. """
+        for job in self.selected():
+            self.scheduler.stop(job)
+        self.refresh()
+
+    def remove_selected(self):
+        """ Remove the selected jobs that have finished from the list. """
+        for job in self.selected():
+            self.scheduler.remove(job)
+        self.refresh()
+
+    def export_timings(self):
+        """ Save the timings of each selected job to a JSON file. """
+        for job in self.selected():
+            filepath = tkFileDialog.asksaveasfilename(
+                parent=self, title="Export Timings of Job %d" % job.id,
+                defaultextension=".json",
+                initialfile="jaide-job-%d-timings.json" % job.id)
+            if not filepath:
+                continue
+            try:
+                job.stats.export(filepath)
+            except IOError as e:
+                tkMessageBox.showinfo("Export Timings", "Could not write "
+                                      "the timings to %s. Error:\n%s" %
+                                      (filepath, str(e)), parent=self)
+
+    def show_output(self):
+        """ Open a window showing the output of each selected job. """
+        for job in self.selected():
+            if job.viewer is not None:
+                job.viewer.winfo_toplevel().lift()
+                continue
+            # Not a child of this window, so it can outlive it.
+            window = tk.Toplevel(self.master)
+            window.wm_title("Job %d - %s" % (job.id, job.name))
+            viewer = OutputViewer(window, job.store)
+            viewer.pack(fill=tk.BOTH, expand=True)
+            viewer.load(job.store.view_len())
+            viewer.text.see(tk.END)
+            # New output goes through the viewer while it is open.
+            job.viewer = viewer
+            window.protocol("WM_DELETE_WINDOW",
+                            lambda job=job, window=window:
+                            self.close_output(job, window))
+
+    def close_output(self, job, window):
+        """ Close the output window of a job. """
+        job.viewer = None
+        window.destroy()
+
+
+class ResultHistoryWindow(tk.Toplevel):
+
+    """ Window for looking up the results recorded in a ResultStore.
+
+    The results can be filtered by host (a list of IPs, hostnames or * and ?
+    patterns), operation, status and the time they ran, and are listed
+    newest first. Selecting one shows its output below the list.
+    """
+
+    # Statuses that can be filtered on, as shown in the menu.
+    statuses = ["Any", "ok", "error", "conn_error", "timeout"]
+
+    def __init__(self, parent, store, operations, **kw):
+        """ Create the filters, the list of results and the output pane.
+
+        @param store: The store the results are recorded in.
+        @type store: jaidegui.result_store.ResultStore
+        @param operations: The operations that can be filtered on.
+        @type operations: list
+        """
+        tk.Toplevel.__init__(self, parent, kw)
+        self.wm_title("Result History")
+        self.store = store
+        self.filters = tk.Frame(self)
+        self.hosts_entry = JaideEntry(self.filters, width=30)
+        self.operation_menu = JaideOptionMenu(self.filters,
+                                              ["Any"] + list(operations))
+        self.status_menu = JaideOptionMenu(self.filters, self.statuses)
+        self.since_entry = JaideEntry(self.filters, width=16)
+        self.until_entry = JaideEntry(self.filters, width=16)
+        self.search_button = tk.Button(self.filters, text="Search",
+                                       command=self.search)
+        for column, (label, widget) in enumerate([
+                ("Host(s):", self.hosts_entry),
+                ("Operation:", self.operation_menu),
+                ("Status:", self.status_menu),
+                ("Since:", self.since_entry),
+                ("Until:", self.until_entry)]):
+            tk.Label(self.filters, text=label).grid(column=column * 2, row=0,
+                                                    sticky="W")
+            widget.grid(column=column * 2 + 1, row=0, sticky="W", padx=2)
+        self.search_button.grid(column=10, row=0, padx=2)
+        self.hosts_entry.bind("<Return>", lambda event: self.search())
+
+        self.tree = ttk.Treeview(self, columns=("host", "operation", "status",
+                                                "duration", "size"))
+        self.tree.heading("#0", text="Time")
+        self.tree.heading("host", text="Host")
+        self.tree.heading("operation", text="Operation")
+        self.tree.heading("status", text="Status")
+        self.tree.heading("duration", text="Seconds")
+        self.tree.heading("size", text="Bytes")
+        self.tree.column("#0", width=150)
+        self.tree.column("status", width=80)
+        self.tree.column("duration", width=70)
+        self.tree.column("size", width=70)
+        self.tree_scrollbar = AutoScrollbar(self, command=self.tree.yview)
+        self.tree.config(yscrollcommand=self.tree_scrollbar.set)
+        self.tree.bind("<<TreeviewSelect>>", lambda event: self.show_output())
+        self.status_label = tk.Label(self, text="", anchor="w")
+        self.output = tk.Text(self, wrap=tk.NONE, height=15, state="disabled")
+        self.output_scrollbar = AutoScrollbar(self,
+                                              command=self.output.yview)
+        self.output.config(yscrollcommand=self.output_scrollbar.set)
+
+        self.filters.grid(column=0, columnspan=2, row=0, sticky="W")
+        self.tree.grid(column=0, row=1, sticky="SWNE")
+        self.tree_scrollbar.grid(column=1, row=1, sticky="SWNE")
+        self.status_label.grid(column=0, columnspan=2, row=2, sticky="EW")
+        self.output.grid(column=0, row=3, sticky="SWNE")
+        self.output_scrollbar.grid(column=1, row=3, sticky="SWNE")
+        self.rowconfigure(1, weight=1)
+        self.rowconfigure(3, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    def search(self):
+        """ List the results matching the filters. """
+        hosts = self.hosts_entry.get().replace(",", " ").split()
+        try:
+            since = parse_time(self.since_entry.get())
+            until = parse_time(self.until_entry.get())
+        except ValueError as e:
+            self.status_label.config(text=str(e))
+            return
+        try:
+            results = self.store.query(
+                hosts=hosts,
+                operation=(None if self.operation_menu.get() == "Any" else
+                           self.operation_menu.get()),
+                status=(None if self.status_menu.get() == "Any" else
+                        self.status_menu.get()),
+                since=since, until=until)
+        except Exception as e:
+            self.status_label.config(text="Could not read the results: %s"
+                                     % str(e))
+            return
+        self.tree.delete(*self.tree.get_children())
+        for result in results:
+            self.tree.insert("", tk.END, str(result["id"]),
+                             text=time.strftime("%Y-%m-%d %H:%M:%S",
+                                                time.localtime(
+                                                    result["started"])),
+                             values=(result["host"], result["operation"],
+                                     result["status"], "%.2f" %
+                                     (result["finished"] - result["started"]),
+                                     result["size"]))
+        self.status_label.config(text="%d result(s)%s" % (
+            len(results), ", showing the newest" if len(results) ==
+            QUERY_LIMIT else ""))
+
+    def show_output(self):
+        """ Show the output of the selected result. """
+        selection = self.tree.selection()
+        if not selection:
+            return
+        try:
+            output = self.store.output(int(selection[0]))
+        except Exception as e:
+            output = "Could not read the output: %s" % str(e)
+        self.output.config(state="normal")
+        self.output.delete(1.0, tk.END)
+        self.output.insert(tk.END, output or "")
+        self.output.config(state="disabled")
+
+
+class RecordTableWindow(tk.Toplevel):
+
+    """ Window showing a jaidegui.record_set.RecordSet as a table.
+
+    The table is virtual: the Treeview only ever holds the rows that fit in
+    the window, which are filled in from the record set as it is scrolled,
+    and the scrollbar is mapped onto all of the rows. So it is as quick with
+    tens of thousands of rows as with ten. refresh() must be called as
+    records are added, and redraws the table at most once every
+    REFRESH_INTERVAL. Clicking a column heading sorts the rows by that
+    column, and clicking it again reverses them. The filter takes the terms
+    described in jaidegui.record_set, and the rows shown can be exported to
+    CSV or JSON.
+    """
+
+    # Milliseconds between redraws while records are arriving.
+    REFRESH_INTERVAL = 250
+    # Pixel height of each row, so the rows that fit can be worked out.
+    ROW_HEIGHT = 20
+
+    def __init__(self, parent, title, records, headings, **kw):
+        """ Create the filter, the table and its buttons.
+
+        @param title: The title of the window.
+        @type title: str
+        @param records: The records to show.
+        @type records: jaidegui.record_set.RecordSet
+        @param headings: The heading of each column of the records.
+        @type headings: list
+        """
+        tk.Toplevel.__init__(self, parent, kw)
+        self.wm_title(title)
+        self.records = records
+        self.headings = headings
+        # View index of the top row shown, and the id of the pending redraw.
+        self.first = 0
+        self.refresh_id = None
+        self.filters = tk.Frame(self)
+        self.filter_entry = JaideEntry(self.filters, width=40)
+        self.filter_entry.bind("<KeyRelease>",
+                               lambda event: self.apply_filter())
+        self.export_button = tk.Button(self.filters, text="Export",
+                                       command=self.export)
+        self.clear_button = tk.Button(self.filters, text="Clear",
+                                      command=self.clear)
+        tk.Label(self.filters, text="Filter:").grid(column=0, row=0)
+        self.filter_entry.grid(column=1, row=0, padx=2)
+        self.export_button.grid(column=2, row=0, padx=2)
+        self.clear_button.grid(column=3, row=0, padx=2)
+        ttk.Style().configure("Records.Treeview", rowheight=self.ROW_HEIGHT)
+        self.tree = ttk.Treeview(self, columns=records.columns,
+                                 show="headings", style="Records.Treeview")
+        for column in records.columns:
+            self.tree.heading(column, command=lambda column=column:
+                              self.sort(column))
+            self.tree.column(column, width=90)
+        self.scrollbar = tk.Scrollbar(self, command=self.yview)
+        self.status_label = tk.Label(self, text="", anchor="w")
+        self.filters.grid(column=0, columnspan=2, row=0, sticky="W")
+        self.tree.grid(column=0, row=1, sticky="SWNE")
+        self.scrollbar.grid(column=1, row=1, sticky="SWNE")
+        self.status_label.grid(column=0, columnspan=2, row=2, sticky="EW")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.tree.bind("<Configure>", lambda event: self.draw())
+        self.tree.bind("<MouseWheel>", self.wheel)
+        self.tree.bind("<Button-4>", self.wheel)
+        self.tree.bind("<Button-5>", self.wheel)
+        self.draw()
+
+    def page_size(self):
+        """ Return how many rows fit in the table, below the headings. """
+        return max(self.tree.winfo_height() // self.ROW_HEIGHT - 2, 1)
+
+    def draw(self):
+        """ Fill the table with the rows from first that fit in it. """
+        self.refresh_id = None
+        view = self.records.view()
+        size = self.page_size()
+        self.first = max(min(self.first, len(view) - size), 0)
+        rows = view[self.first:self.first + size]
+        # The Treeview's rows are reused, rather than recreated, each time.
+        items = self.tree.get_children()
+        for index, row in enumerate(rows):
+            if index < len(items):
+                self.tree.item(items[index], values=self.records.cells(row))
+            else:
+                self.tree.insert("", tk.END,
+                                 values=self.records.cells(row))
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        total = max(len(view), 1)
+        self.scrollbar.set(float(self.first) / total,
+                           float(self.first + len(rows)) / total)
+        for column, heading in zip(self.records.columns, self.headings):
+            if column == self.records.sort_column:
+                heading += (u" \u25bc" if self.records.descending else
+                            u" \u25b2")
+            self.tree.heading(column, text=heading)
+        self.status_label.config(text="%d of %d row(s)" %
+                                 (len(view), len(self.records)))
+
+    def refresh(self):
+        """ Redraw the table soon, as records have been added. """
+        if self.refresh_id is None:
+            self.refresh_id = self.after(self.REFRESH_INTERVAL, self.draw)
+
+    def yview(self, *args):
+        """ Scroll the table, the command of the scrollbar. """
+        if args and args[0] == tk.MOVETO:
+            self.first = int(float(args[1]) * len(self.records.view()))
+        elif args and args[0] == tk.SCROLL:
+            step = self.page_size() if args[2] == tk.PAGES else 1
+            self.first += int(args[1]) * step
+        self.draw()
+
+    def wheel(self, event):
+        """ Scroll the table with the mouse wheel. """
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.yview(tk.SCROLL, -3 if up else 3, tk.UNITS)
+        return "break"
+
+    def sort(self, column):
+        """ Sort the rows by a column, reversing them if already sorted by it.
+
+        @param column: The column to sort by.
+        @type column: str
+        """
+        self.records.sort(column)
+        self.first = 0
+        self.draw()
+
+    def apply_filter(self):
+        """ Only show the rows matching the filter entered. """
+        self.records.set_filter(self.filter_entry.get())
+        self.first = 0
+        self.draw()
+
+    def export(self):
+        """ Save the rows shown to a CSV or JSON file. """
+        filepath = tkFileDialog.asksaveasfilename(
+            parent=self, title="Export %s" % self.title(),
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON", "*.json")])
+        if not filepath:
+            return
+        try:
+            count = self.records.export(filepath)
+        except IOError as e:
+            tkMessageBox.showinfo("Export", "Could not write the rows to %s."
+                                  " Error:\n%s" % (filepath, str(e)),
+                                  parent=self)
+            return
+        self.status_label.config(text="Exported %d row(s) to %s" %
+                                 (count, filepath))
+
+    def clear(self):
+        """ Remove every row from the table. """
+        self.records.clear()
+        self.first = 0
+        self.draw()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+""" Job functions.
+
+Purpose: This module turns the options of a Jaide GUI template into the
+jaide.wrap function to run and the arguments to run it with. It is shared by
+the GUI, which builds its options from its widgets, and by the jaidegui-run
+batch runner, which reads them straight from a template file, so the same
+template always runs exactly the same job either way. Nothing here imports
+Tkinter, and jaide is only imported once a job is actually built.
+
+Templates are either the original format of one 'Key:~:Value' line per
+option, or a JSON object of the same keys and values. The password is base64
+encoded in both.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import base64
+import json
+
+from jaide_loader import loader
+
+# Maps each command option to the name of the jaide.wrap function it runs.
+OPTION_FUNCTIONS = {
+    "Diff Config": "diff_config",
+    "Device Info": "device_info",
+    "Health Check": "health_check",
+    "Interface Errors": "interface_errors",
+    "Operational Command(s)": "command",
+    "SCP Files": "push",
+    "Set Command(s)": "commit",
+    "Shell Command(s)": "shell",
+    "Show | Compare": "compare"
+}
+# Command options that need the FirstArgument option filled in.
+INPUT_OPTIONS = ["Operational Command(s)", "Set Command(s)",
+                 "Shell Command(s)", "SCP Files", "Diff Config",
+                 "Show | Compare"]
+# Command options that can change a device, so two jobs running them against
+# the same device must never run at once.
+WRITE_OPTIONS = ["Set Command(s)", "SCP Files", "Shell Command(s)"]
+
+
+def read_template(filepath):
+    """ Read the options saved in a template file.
+
+    @param filepath: The filepath of the template.
+    @type filepath: str
+
+    @returns: The value of each option in the template, as a string, with the
+            | password decoded.
+    @rtype: dict
+
+    @raises IOError: if the file couldn't be read.
+    @raises ValueError: if the file isn't a valid template.
+    """
+    with open(filepath, "rb") as input_file:
+        contents = input_file.read()
+    if contents.lstrip().startswith("{"):
+        options = dict((key, value if isinstance(value, basestring) else
+                        str(value))
+                       for key, value in json.loads(contents).iteritems())
+    else:
+        options = {}
+        for line in contents.splitlines():
+            if ":~:" in line:
+                key, value = line.split(":~:", 1)
+                options[key] = value.rstrip()
+    if options.get("Password"):
+        try:
+            options["Password"] = base64.b64decode(options["Password"])
+        except TypeError as e:
+            raise ValueError("Invalid password encoding: %s" % e)
+    return options
+
+
+def write_template(filepath, options):
+    """ Save options to a template file, in the 'Key:~:Value' format.
+
+    @param filepath: The filepath of the template.
+    @type filepath: str
+    @param options: The value of each option to save.
+    @type options: dict
+
+    @returns: None
+
+    @raises IOError: if the file couldn't be written.
+    """
+    with open(filepath, "wb") as output_file:
+        for key, value in options.iteritems():
+            if key == "Password":  # passwords need to be encoded.
+                value = base64.b64encode(value)
+            output_file.write(key + ":~:" + str(value) + "\n")
+
+
+def job_hosts(ip):
+    """ List the devices a job will run against.
+
+    @param ip: The IP option, a single IP or hostname, a comma separated list
+             | of them, or the filepath of a file of them.
+    @type ip: str
+
+    @returns: The IPs or hostnames.
+    @rtype: list
+
+    @raises ImportError: if jaide couldn't be imported.
+    """
+    loader.load()
+    from jaide.utils import clean_lines
+    return [host.strip() for host in clean_lines(ip)]
+
+
+def _flag(value):
+    """ Convert a checkbox option, from a widget or a template, to 0 or 1. """
+    return int(value or 0)
+
+
+def build_job(options):
+    """ Work out what to run for a set of template options.
+
+    @param options: The value of each option, keyed by template key, either
+                  | as strings read from a template or as the values of the
+                  | GUI's widgets.
+    @type options: dict
+
+    @returns: The jaide.wrap function to run, and the arguments to run it
+            | with after the connection.
+    @rtype: tuple
+
+    @raises ImportError: if jaide couldn't be imported.
+    @raises KeyError: if the command option isn't a known one.
+    @raises ValueError: if the commit confirmed minutes aren't a number.
+    """
+    wrap = loader.load()
+    option = options.get("Option", "")
+    first_arg = options.get("FirstArgument", "").strip()
+    # if they are requesting xml.
+    out_fmt = 'xml' if _flag(options.get("Format")) else 'text'
+    # some functions need to know if we're running against >1 device
+    multi = len(job_hosts(options.get("IP", ""))) > 1
+
+    function = OPTION_FUNCTIONS[option]
+    if options.get("SCPDirection") == "Pull" and function == "push":
+        function = "pull"
+
+    # Need to set commit options only if their boxes are checked.
+    at_time = (options.get("CommitAtTime")
+               if _flag(options.get("CommitAt")) else None)
+    confirmed = (int(options.get("CommitConfirmedMin")) * 60
+                 if _flag(options.get("CommitConfirmed")) else None)
+    comment = (options.get("CommitCommentValue")
+               if _flag(options.get("CommitComment")) else None)
+    # build the args translation array
+    args_translation = {
+        "Operational Command(s)": [first_arg, out_fmt, False],
+        "Device Info": [],
+        "Diff Config": [first_arg, options.get("DiffMode", "Set").lower()],
+        "Health Check": [],
+        "Interface Errors": [],
+        "Set Command(s)": [first_arg,
+                           _flag(options.get("CommitCheck")),
+                           _flag(options.get("CommitSynch")),
+                           comment,
+                           confirmed,
+                           at_time,
+                           _flag(options.get("CommitBlank"))],
+        "SCP Files": [first_arg, options.get("SCPDest", ""), False, multi],
+        "Shell Command(s)": [first_arg],
+        "Show | Compare": [first_arg]
+    }
+    return getattr(wrap, function), args_translation[option]
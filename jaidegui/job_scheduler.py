@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+""" JobScheduler Class.
+
+Purpose: This class lets the user queue up several runs rather than waiting
+for each one to finish before starting the next. Every queued Job gets its own
+WorkerThread, and they all submit their devices to the one shared
+ExecutionPool, so jobs that don't get in each other's way run at the same
+time on the same budget of workers. Two jobs conflict when they share a device
+and either of them can change it (such as two commits), in which case the
+later one waits until the earlier one has finished. A job has only finished
+once every task it handed to the pool has stopped, as a job that was stopped,
+or whose devices were abandoned by the watchdog, can leave tasks running on
+its devices after its WorkerThread has ended. Jobs start in the order they
+were queued, and a job never jumps ahead of an earlier one it conflicts with.
+
+Each Job also keeps its own LogStore of the output of its devices, and counts
+how many have finished and how long they took, so its progress, output and
+timings can be shown on their own.
+
+The scheduler has no thread of its own; the GUI calls reap() and start_ready()
+from its output poll.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import time
+
+from worker_thread import WorkerThread
+from device_result import DeviceResult
+from log_store import LogStore
+from run_stats import RunStats
+
+
+class Job(object):
+
+    """ One queued run, its devices, state and output. """
+
+    # Possible values of state.
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    STOPPED = "stopped"
+
+    def __init__(self, job_id, name, hosts, writes, thread_args):
+        """ Initialize the Job object.
+
+        @param job_id: The id of the job, unique within the scheduler.
+        @type job_id: int
+        @param name: What the job runs, shown to the user.
+        @type name: str
+        @param hosts: The IPs or hostnames the job runs against.
+        @type hosts: list
+        @param writes: Whether the job can change the devices.
+        @type writes: bool
+        @param thread_args: The keyword arguments to create the job's
+                          | WorkerThread with, apart from stdout, pool and
+                          | progress.
+        @type thread_args: dict
+
+        @returns: None
+        """
+        self.id = job_id
+        self.name = name
+        self.hosts = frozenset(hosts)
+        self.writes = writes
+        self.thread_args = thread_args
+        self.state = Job.QUEUED
+        self.thread = None
+        # The tasks the job's WorkerThread handed to the pool.
+        self.tasks = []
+        self.queued = time.time()
+        self.started = None
+        self.finished = None
+        # The output of the job's devices, and an OutputViewer showing it
+        # while one is open. Either one is appended to, never both.
+        self.store = LogStore()
+        self.viewer = None
+        self.total = len(hosts)
+        self.statuses = collections.Counter()
+        self.stats = RunStats()
+
+    @property
+    def done(self):
+        """ Return how many of the job's devices have finished. """
+        return sum(self.statuses.values())
+
+    def busy(self):
+        """ Check whether the job's thread, or any of its tasks, is running.
+
+        @rtype: bool
+        """
+        if self.thread is not None:
+            return True
+        self.tasks = [task for task in self.tasks if not task.settled()]
+        return bool(self.tasks)
+
+    def conflicts(self, other):
+        """ Check whether this job can't run at the same time as another.
+
+        @param other: The other job.
+        @type other: Job
+
+        @returns: True if they share a device and either can change it.
+        @rtype: bool
+        """
+        return ((self.writes or other.writes) and
+                not self.hosts.isdisjoint(other.hosts))
+
+    def record(self, result):
+        """ Count a device's result, and add its output to the job's output.
+
+        @param result: The result of one of the job's devices.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: None
+        """
+        self.statuses[result.status] += 1
+        self.stats.add(result)
+        (self.viewer or self.store).append(result.output, result.host,
+                                           result.status)
+
+    def describe(self):
+        """ Describe the job's progress, such as '12/40 done, 1 failed'. """
+        failed = (self.statuses[DeviceResult.ERROR] +
+                  self.statuses[DeviceResult.CONN_ERROR] +
+                  self.statuses[DeviceResult.TIMEOUT])
+        return "%d/%d done, %d failed" % (self.done, self.total, failed)
+
+
+class JobScheduler(object):
+
+    """ Run queued jobs, overlapping the ones that don't conflict. """
+
+    def __init__(self, stdout, pool, progress=None):
+        """ Initialize the JobScheduler object.
+
+        @param stdout: The queue every job's WorkerThread puts output on.
+        @type stdout: Queue.Queue()
+        @param progress: The queue every job's WorkerThread puts progress
+                       | events on, if any. See jaidegui.progress.
+        @type progress: Queue.Queue()
+        @param pool: The pool shared by every job.
+        @type pool: jaidegui.execution_pool.ExecutionPool
+
+        @returns: None
+        """
+        self.stdout = stdout
+        self.pool = pool
+        self.progress = progress
+        # Every job not yet removed, in the order they were queued.
+        self.jobs = collections.OrderedDict()
+        self._next_id = 1
+
+    def submit(self, name, hosts, writes, thread_args):
+        """ Queue a job. It starts on the next call to start_ready().
+
+        @returns: The queued job.
+        @rtype: Job
+        """
+        job = Job(self._next_id, name, hosts, writes, thread_args)
+        self._next_id += 1
+        self.jobs[job.id] = job
+        return job
+
+    def start_ready(self):
+        """ Start every queued job that doesn't conflict with an earlier one.
+
+        @returns: The jobs started.
+        @rtype: list
+        """
+        started = []
+        waiting = []
+        for job in self.jobs.values():
+            if job.state == Job.QUEUED:
+                if not any(job.conflicts(other) for other in waiting):
+                    self._start(job)
+                    started.append(job)
+                waiting.append(job)
+            elif job.busy():
+                # Running, or stopped or done but not yet wound down.
+                waiting.append(job)
+        return started
+
+    def _start(self, job):
+        """ Create and start the WorkerThread of a job. """
+        job.thread = WorkerThread(stdout=self.stdout, pool=self.pool,
+                                  job_id=job.id, progress=self.progress,
+                                  **job.thread_args)
+        job.tasks = job.thread.tasks
+        job.thread.daemon = True
+        job.thread.start()
+        job.state = Job.RUNNING
+        job.started = time.time()
+
+    def reap(self):
+        """ Find the running jobs whose WorkerThread has finished.
+
+        @returns: The jobs that finished.
+        @rtype: list
+        """
+        finished = []
+        for job in self.jobs.values():
+            if job.thread is not None and not job.thread.isAlive():
+                job.thread.join()
+                job.thread = None
+                if job.state == Job.RUNNING:
+                    job.state = Job.DONE
+                job.finished = time.time()
+                finished.append(job)
+        return finished
+
+    def record(self, result):
+        """ Hand a device's result to the job it belongs to, if any.
+
+        @param result: The result of a device.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: The job the result belongs to, or None.
+        @rtype: Job
+        """
+        job = self.jobs.get(result.job)
+        if job is not None:
+            job.record(result)
+        return job
+
+    def stop(self, job, cancel_pool=True):
+        """ Stop a running job, or take a queued one off the queue.
+
+        @param job: The job to stop.
+        @type job: Job
+        @param cancel_pool: Whether to terminate the pool if the job is the
+                          | only one using it, see ExecutionPool.cancel().
+        @type cancel_pool: bool
+
+        @returns: None
+        """
+        if job.state == Job.QUEUED:
+            job.state = Job.STOPPED
+            job.finished = time.time()
+        elif job.state == Job.RUNNING:
+            job.state = Job.STOPPED
+            job.thread.kill_proc(cancel_pool)
+
+    def stop_all(self):
+        """ Stop every running and queued job, and terminate the pool.
+
+        Purpose: Each job keeps its reservation of the pool until its
+               | thread has ended, so no job would be alone on it. Once all
+               | of them are stopped, the pool is terminated here instead,
+               | which kills the devices still in flight.
+
+        @returns: None
+        """
+        running = False
+        for job in self.jobs.values():
+            running = running or job.thread is not None
+            self.stop(job, cancel_pool=False)
+        if running:
+            self.pool.terminate()
+
+    def remove(self, job):
+        """ Forget a job that isn't running any more.
+
+        @returns: True if it was removed, False if it is still running.
+        @rtype: bool
+        """
+        if job.busy():
+            return False
+        del self.jobs[job.id]
+        return True
+
+    def active(self):
+        """ Check whether any job is running or queued. """
+        return any(job.state in (Job.QUEUED, Job.RUNNING) or
+                   job.thread is not None for job in self.jobs.values())
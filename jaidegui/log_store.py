@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+""" LogStore Class.
+
+Purpose: This class holds all of the script output shown in the output area.
+The text itself is spooled to a temporary file on disk, and only the offset
+of the start of each line is kept in memory, so any range of lines can be read
+back in constant time no matter how large the output grows. The output area
+only ever renders a window of these lines, and saving the output copies it
+straight from the file.
+
+Output that came from a device is also indexed by host, recording the lines it
+spans, its status and its size, so the section for any host can be found
+without searching the text. Sections can be collapsed down to their header
+lines. The output area works in 'view' lines, which are the lines of the
+store that aren't hidden inside a collapsed section; the view_* methods
+translate between the two.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import array
+import bisect
+import collections
+import shutil
+import tempfile
+import threading
+
+# Lines at the top of each device's output left showing when it is collapsed,
+# the separator and the 'Results from device' header.
+HEADER_LINES = 2
+
+
+class Section(object):
+
+    """ The span of lines holding the output of one host. """
+
+    def __init__(self, host, start, stop, status, size):
+        """ Initialize the Section object.
+
+        @param host: The IP or hostname the output came from.
+        @type host: str
+        @param start: The index of the first line of the output.
+        @type start: int
+        @param stop: The index after the last line of the output.
+        @type stop: int
+        @param status: The status of the device's result.
+        @type status: str
+        @param size: The size of the output in bytes.
+        @type size: int
+        """
+        self.host = host
+        self.start = start
+        self.stop = stop
+        self.status = status
+        self.size = size
+        self.collapsed = False
+
+
+class LogStore(object):
+
+    """ Append-only, disk backed store of output lines. """
+
+    def __init__(self):
+        """ Initialize the LogStore object with an empty temporary file. """
+        self._file = tempfile.TemporaryFile()
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self):
+        """ Return the number of lines in the store. """
+        return len(self._offsets)
+
+    def append(self, text, host=None, status=None):
+        """ Add text to the end of the store.
+
+        @param text: The text to add. It continues the last line if that
+                   | wasn't ended with a newline.
+        @type text: str or unicode
+        @param host: The host the text is the output of, if any, to index it
+                   | under.
+        @type host: str
+        @param status: The status of the host's result.
+        @type status: str
+
+        @returns: The index of the first line the text was written to.
+        @rtype: int
+        """
+        if isinstance(text, unicode):
+            text = text.encode('utf-8')
+        with self._lock:
+            first = len(self._offsets) - 1 if self._open else len(
+                self._offsets)
+            if not text:
+                return first
+            self._file.seek(self._end)
+            self._file.write(text)
+            if not self._open:
+                self._offsets.append(self._end)
+            index = text.find("\n")
+            while index != -1 and index + 1 < len(text):
+                self._offsets.append(self._end + index + 1)
+                index = text.find("\n", index + 1)
+            self._end += len(text)
+            self._open = not text.endswith("\n")
+            if host is not None:
+                old = self.sections.pop(host, None)
+                if old is not None and old.collapsed:
+                    self._set_collapsed(old, False)
+                self.sections[host] = Section(host, first, len(self._offsets),
+                                              status, len(text))
+            return first
+
+    def lines(self, start, stop):
+        """ Read a range of lines back out of the store.
+
+        @param start: The index of the first line to read.
+        @type start: int
+        @param stop: The index after the last line to read.
+        @type stop: int
+
+        @returns: The text of the lines, including their newlines.
+        @rtype: unicode
+        """
+        with self._lock:
+            return self._read(start, stop).decode('utf-8', 'replace')
+
+    def _read(self, start, stop):
+        """ Read a range of lines as bytes. Must be called holding _lock. """
+        start = max(0, start)
+        stop = min(stop, len(self._offsets))
+        if start >= stop:
+            return ""
+        end = (self._offsets[stop] if stop < len(self._offsets) else
+               self._end)
+        self._file.seek(self._offsets[start])
+        return self._file.read(end - self._offsets[start])
+
+    def section(self, host):
+        """ Look up the section holding a host's output.
+
+        @returns: The host's most recent section, or None.
+        @rtype: Section
+        """
+        return self.sections.get(host)
+
+    def set_collapsed(self, host, collapsed):
+        """ Collapse or expand the section of a host.
+
+        @param host: The host whose section to change.
+        @type host: str
+        @param collapsed: True to collapse it, False to expand it.
+        @type collapsed: bool
+
+        @returns: None
+        """
+        with self._lock:
+            section = self.sections.get(host)
+            if section is not None and section.collapsed != collapsed:
+                self._set_collapsed(section, collapsed)
+
+    def _set_collapsed(self, section, collapsed):
+        """ Update the hidden ranges for a section. Called holding _lock. """
+        start = section.start + HEADER_LINES
+        length = section.stop - start
+        if length <= 0:
+            return
+        section.collapsed = collapsed
+        index = bisect.bisect_left(self._hidden_starts, start)
+        if collapsed:
+            self._hidden_starts.insert(index, start)
+            self._hidden_lengths.insert(index, length)
+        else:
+            del self._hidden_starts[index]
+            del self._hidden_lengths[index]
+        # Rebuild the running totals the view mapping bisects over.
+        self._hidden_before = [0]
+        self._view_starts = []
+        for start, length in zip(self._hidden_starts, self._hidden_lengths):
+            self._view_starts.append(start - self._hidden_before[-1])
+            self._hidden_before.append(self._hidden_before[-1] + length)
+
+    def view_len(self):
+        """ Return the number of lines not hidden by a collapsed section. """
+        return len(self._offsets) - self._hidden_before[-1]
+
+    def view_index(self, line):
+        """ Convert the index of a line in the store to its view index.
+
+        @param line: The index of the line in the store.
+        @type line: int
+
+        @returns: The index of the line in the view. A hidden line maps to
+                | the last header line of its section.
+        @rtype: int
+        """
+        ranges = bisect.bisect_right(self._hidden_starts, line)
+        if ranges and line < (self._hidden_starts[ranges - 1] +
+                              self._hidden_lengths[ranges - 1]):
+            return self._view_starts[ranges - 1] - 1
+        return line - self._hidden_before[ranges]
+
+    def view_lines(self, start, stop):
+        """ Read a range of view lines, skipping collapsed sections.
+
+        @param start: The view index of the first line to read.
+        @type start: int
+        @param stop: The view index after the last line to read.
+        @type stop: int
+
+        @returns: The text of the lines, including their newlines.
+        @rtype: unicode
+        """
+        with self._lock:
+            chunks = []
+            ranges = bisect.bisect_right(self._view_starts, start)
+            line = start + self._hidden_before[ranges]
+            remaining = stop - start
+            while remaining > 0 and line < len(self._offsets):
+                if ranges < len(self._hidden_starts):
+                    run = min(remaining, self._hidden_starts[ranges] - line)
+                else:
+                    run = remaining
+                chunks.append(self._read(line, line + run))
+                remaining -= run
+                if ranges < len(self._hidden_starts):
+                    line = (self._hidden_starts[ranges] +
+                            self._hidden_lengths[ranges])
+                    ranges += 1
+                else:
+                    break
+            return "".join(chunks).decode('utf-8', 'replace')
+
+    def save(self, filepath):
+        """ Copy the whole store to a file.
+
+        @param filepath: The filepath to write the output to.
+        @type filepath: str
+
+        @returns: None
+
+        @raises IOError: if the file couldn't be written.
+        """
+        with self._lock:
+            self._file.seek(0)
+            with open(filepath, 'w+b') as out_file:
+                shutil.copyfileobj(self._file, out_file)
+
+    def clear(self):
+        """ Remove every line and section from the store. """
+        with self._lock:
+            self._file.seek(0)
+            self._file.truncate()
+            # Byte offset of the start of each line in _file.
+            self._offsets = array.array('L')
+            self._end = 0
+            # Whether the last line hasn't been ended with a newline yet.
+            self._open = False
+            # Maps each host to its Section, in the order they arrived.
+            self.sections = collections.OrderedDict()
+            # Hidden line ranges of collapsed sections, sorted by start, with
+            # the view index each range sits at and the number of lines
+            # hidden before each one, for bisecting.
+            self._hidden_starts = []
+            self._hidden_lengths = []
+            self._view_starts = []
+            self._hidden_before = [0]
@@ -22,3 +22,15 @@ def module_path():
     if we_are_frozen():
         return os.path.dirname(unicode(sys.executable, encoding))
     return os.path.dirname(unicode(__file__, encoding))
+
+
+def data_path(*names):
+    """ Determine the location of the files jaidegui keeps between runs.
+
+    They are kept in a .jaidegui folder in the user's home folder, which is
+    created if needed, so they don't depend on where jaidegui is installed.
+    """
+    path = os.path.join(os.path.expanduser("~"), ".jaidegui", *names)
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    return path
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+""" OutputQueue Class.
+
+Purpose: This class is the queue the WorkerThread puts output on for the GUI.
+It behaves exactly like a Queue.Queue, but can also call a wakeup function
+whenever something is put on it, which the GUI uses to have the Tk main loop
+drain the queue straight away instead of waiting for its next poll. Only one
+wakeup is outstanding at a time, so a flood of results doesn't turn into a
+flood of Tk events; the GUI calls woken() once it has started draining.
+
+The wakeup is called from a dedicated thread rather than from whichever thread
+put the output, since a call into Tk from another thread waits for the main
+loop to service it, and the putting thread may be one the main loop is itself
+waiting on (such as the pool's result handler during a Stop).
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import threading
+import Queue
+
+
+class OutputQueue(Queue.Queue):
+
+    """ Queue.Queue that wakes up the GUI when output is put on it. """
+
+    def __init__(self):
+        """ Initialize the OutputQueue object, without a wakeup function. """
+        Queue.Queue.__init__(self)
+        self.wakeup = None
+        # Set while a wakeup is outstanding, and to kick the waker thread.
+        self._pending = threading.Event()
+        self._kick = threading.Event()
+
+    def set_wakeup(self, wakeup):
+        """ Start calling wakeup whenever output is put on the queue.
+
+        @param wakeup: Function taking no arguments, called from the waker
+                     | thread.
+        @type wakeup: function
+
+        @returns: None
+        """
+        self.wakeup = wakeup
+        waker = threading.Thread(target=self._wake)
+        waker.daemon = True
+        waker.start()
+
+    def put(self, item, block=True, timeout=None):
+        """ Put an item on the queue, and wake the GUI if it isn't already.
+
+        @returns: None
+        """
+        Queue.Queue.put(self, item, block, timeout)
+        if self.wakeup is not None and not self._pending.is_set():
+            self._pending.set()
+            self._kick.set()
+
+    def woken(self):
+        """ Note that the GUI has been woken, so the next put wakes it again.
+
+        @returns: None
+        """
+        self._pending.clear()
+
+    def _wake(self):
+        """ Call the wakeup function each time the queue is kicked. """
+        while True:
+            self._kick.wait()
+            self._kick.clear()
+            try:
+                self.wakeup()
+            except Exception:
+                # The GUI's fallback poll will pick the output up instead.
+                self._pending.clear()
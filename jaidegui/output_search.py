@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+""" OutputSearch Class.
+
+Purpose: This class searches the output of each device for a string or a
+regular expression, on its own thread so the GUI never waits on it. As each
+device's output arrives it is added to an index of the words it contains,
+which lets a plain search skip every host that can't possibly match without
+reading its output back from the LogStore. Each search also remembers which
+hosts it has already checked, so repeating it (or refining the filter while
+results are still coming in) only looks at hosts that are new since last time.
+
+Searches and new output are handed to the thread on a queue, and the hosts
+that matched are put on the 'results' queue for the GUI to pick up.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import threading
+import Queue
+import re
+
+# What counts as a word in the index.
+WORD = re.compile(r"\w+", re.UNICODE)
+# Most searches to remember the checked hosts of.
+CACHED_SEARCHES = 20
+
+
+class OutputSearch(threading.Thread):
+
+    """ Background, incrementally indexed search of each host's output. """
+
+    def __init__(self, store):
+        """ Initialize the OutputSearch object.
+
+        @param store: The store the output of each host is read back from.
+        @type store: jaidegui.log_store.LogStore
+
+        @returns: None
+        """
+        super(OutputSearch, self).__init__()
+        self.daemon = True
+        self.store = store
+        self.queue = Queue.Queue()
+        self.results = Queue.Queue()
+        # Incremented by each search, so a newer search cancels an older one.
+        self.generation = 0
+        self._reset()
+
+    def _reset(self):
+        """ Forget every indexed host and cached search. """
+        # Maps each word to the hosts whose output contains it.
+        self._postings = collections.defaultdict(set)
+        # Maps each host to the words in its output, in the order they came.
+        self._hosts = collections.OrderedDict()
+        # Maps (pattern, regex) to the sets of hosts matched and checked.
+        self._searches = collections.OrderedDict()
+
+    def add(self, host, output):
+        """ Index the output of a host. It must already be in the store.
+
+        @param host: The host the output came from.
+        @type host: str
+        @param output: The output of the host.
+        @type output: str or unicode
+
+        @returns: None
+        """
+        self.queue.put(("add", host, output))
+
+    def search(self, pattern, regex=False):
+        """ Start searching every host's output, cancelling any older search.
+
+        Purpose: Once done, a tuple of (generation, hosts, error) is put on
+               | the results queue, where hosts is a list of the hosts that
+               | matched, in the order they arrived, and error describes an
+               | invalid regex, if there was one.
+
+        @param pattern: The text, or regular expression, to search for. The
+                      | search ignores case.
+        @type pattern: str
+        @param regex: Whether the pattern is a regular expression.
+        @type regex: bool
+
+        @returns: The generation of this search.
+        @rtype: int
+        """
+        self.generation += 1
+        self.queue.put(("search", self.generation, pattern, regex))
+        return self.generation
+
+    def clear(self):
+        """ Drop the whole index, when the output area is cleared. """
+        self.queue.put(("clear",))
+
+    def run(self):
+        """ Overwrite threading.Thread run method.
+
+        Purpose: Indexes new output and runs searches, in the order they were
+               | handed over, forever.
+
+        @returns: None
+        """
+        while True:
+            job = self.queue.get()
+            if job[0] == "add":
+                self._index(job[1], job[2])
+            elif job[0] == "search":
+                if job[1] == self.generation:
+                    self._search(*job[1:])
+            elif job[0] == "clear":
+                self._reset()
+
+    def _index(self, host, output):
+        """ Add the words in a host's output to the index. """
+        if isinstance(output, str):
+            output = output.decode('utf-8', 'replace')
+        words = frozenset(WORD.findall(output.lower()))
+        old = self._hosts.pop(host, None)
+        if old is not None:
+            # The host was run against again, so its old output is replaced.
+            for word in old:
+                self._postings[word].discard(host)
+            for matched, checked in self._searches.values():
+                matched.discard(host)
+                checked.discard(host)
+        self._hosts[host] = words
+        for word in words:
+            self._postings[word].add(host)
+
+    def _search(self, generation, pattern, regex):
+        """ Search the hosts not yet checked for this pattern. """
+        try:
+            compiled = compile_pattern(pattern, regex)
+        except re.error as e:
+            self.results.put((generation, [], "Invalid regex: %s" % e))
+            return
+        key = (pattern, regex)
+        matched, checked = self._searches.pop(key, (set(), set()))
+        self._searches[key] = (matched, checked)
+        while len(self._searches) > CACHED_SEARCHES:
+            self._searches.popitem(last=False)
+        candidates = set(self._hosts) - checked
+        if not regex:
+            # Each word of the text has to be part of a word in the output.
+            for term in WORD.findall(pattern.lower()):
+                possible = set()
+                for word in self._postings:
+                    if term in word:
+                        possible |= self._postings[word]
+                checked |= candidates - possible
+                candidates &= possible
+        for host in candidates:
+            if generation != self.generation:
+                # A newer search is waiting, what was checked is still kept.
+                return
+            section = self.store.section(host)
+            if section is None:
+                continue
+            if compiled.search(self.store.lines(section.start,
+                                                section.stop)):
+                matched.add(host)
+            checked.add(host)
+        self.results.put((generation, [host for host in self._hosts
+                                       if host in matched], None))
+
+
+def compile_pattern(pattern, regex=False):
+    """ Compile the pattern of a search.
+
+    @param pattern: The text, or regular expression, to search for.
+    @type pattern: str
+    @param regex: Whether the pattern is a regular expression.
+    @type regex: bool
+
+    @returns: The compiled pattern, ignoring case, where ^ and $ match at
+            | the start and end of each line.
+    @rtype: re.RegexObject
+
+    @raises re.error: if the regular expression is invalid.
+    """
+    if not regex:
+        pattern = re.escape(pattern)
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.UNICODE)
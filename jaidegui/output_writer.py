@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+""" OutputWriter Class.
+
+Purpose: This class writes the script output to the file(s) the user asked
+for while the script is still running. Each device's output is handed to it
+as soon as it arrives, and appended to the output file(s) on its own thread,
+so nothing is held in memory waiting for the whole run to finish, and a crash
+or a Stop only loses what hadn't arrived yet. Writes are buffered, and flushed
+and synced to disk in batches rather than after every device.
+
+When writing one file per host, the file for each result is picked from the
+host the result came from, and the results are spread over a small
+WriterPool of OutputWriters, always sending the same host to the same writer
+so its output stays in order. Each writer keeps the files of the hosts it
+wrote to most recently open, up to OPEN_FILES of them, and flushes them in
+batches in the same way.
+
+The class inherits the class threading.Thread, with the purpose of overwriting
+the run() method of the standard Thread class.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import threading
+import Queue
+import time
+import os
+from os import path
+
+# Most outputs waiting to be written before the callers block, which keeps
+# memory flat even if the disk can't keep up with the devices.
+QUEUE_SIZE = 1000
+# Write buffer size for each output file.
+BUFFER_SIZE = 64 * 1024
+# Flush and fsync after this many outputs, or this many seconds.
+SYNC_EVERY = 50
+SYNC_SECONDS = 2.0
+# Number of writers used when writing one file per host.
+WRITER_THREADS = 4
+# Most per-host files each of those writers keeps open at once. Together they
+# stay well below the 256 open files macOS allows a process by default.
+OPEN_FILES = 32
+
+
+def open_writer(write_to_file, wtf_style, stdout):
+    """ Create and start the writer(s) for the wtf_style.
+
+    @param write_to_file: The filepath of the output file.
+    @type write_to_file: str
+    @param wtf_style: Either a single file or multiple files, one for each
+                    | host. Possible values are: ['s', 'single', 'm',
+                    | 'multiple']
+    @type wtf_style: str
+    @param stdout: The queue watched by the GUI.
+    @type stdout: Queue.Queue()
+
+    @returns: An OutputWriter, or a WriterPool for multiple files. Both have
+            | the same write() and close() methods.
+    @rtype: OutputWriter or WriterPool
+    """
+    if wtf_style in ["m", "multiple"]:
+        writer = WriterPool(write_to_file, wtf_style, stdout)
+    else:
+        writer = OutputWriter(write_to_file, wtf_style, stdout)
+    writer.start()
+    return writer
+
+
+class OutputWriter(threading.Thread):
+
+    """ Append the output of each device to file(s) as it arrives. """
+
+    def __init__(self, write_to_file, wtf_style, stdout):
+        """ Initialize the OutputWriter object.
+
+        @param write_to_file: The filepath of the output file. In multiple
+                            | mode, each file is named after the host with this
+                            | as a suffix.
+        @type write_to_file: str
+        @param wtf_style: How to dump the output, either to a single file or to
+                        | multiple, one for each host. Possible values are:
+                        | ['s', 'single', 'm', 'multiple']
+        @type wtf_style: str
+        @param stdout: The queue watched by the GUI, where messages about the
+                     | files written are put.
+        @type stdout: Queue.Queue()
+
+        @returns: None
+        """
+        super(OutputWriter, self).__init__()
+        self.daemon = True
+        self.write_to_file = write_to_file
+        self.wtf_style = wtf_style
+        self.stdout = stdout
+        self.queue = Queue.Queue(QUEUE_SIZE)
+        self.out_file = None
+        # The open per-host files, by filepath, least recently written first.
+        self.host_files = collections.OrderedDict()
+        self.failed = False
+        self.unsynced = 0
+        self.last_sync = time.time()
+
+    def write(self, result):
+        """ Hand the result of one device over to be written.
+
+        @param result: The result of a single device.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: None
+        """
+        self.queue.put(result)
+
+    def close(self):
+        """ Write everything still queued, close the file(s) and wait.
+
+        @returns: None
+        """
+        self.queue.put(None)
+        self.join()
+
+    def run(self):
+        """ Overwrite threading.Thread run method.
+
+        Purpose: Takes each result off the queue and appends it to the file
+               | for the wtf_style, until close() is called. Once writing
+               | has failed, such as when the disk is full, the queue is
+               | still drained, dropping the results, so the callers never
+               | block on it.
+
+        @returns: None
+        """
+        while True:
+            result = self.queue.get()
+            if result is None:
+                break
+            if self.failed:
+                continue
+            try:
+                if self.wtf_style in ["s", "single"]:
+                    self.write_single(result.output)
+                elif self.wtf_style in ["m", "multiple"]:
+                    self.write_multiple(result)
+            except (IOError, OSError) as e:
+                self.fail(e)
+        if self.failed:
+            return
+        try:
+            if self.out_file is not None:
+                self.sync()
+                self.out_file.close()
+                self.stdout.put("\nSuccessfully appended output to: "
+                                "%s\n" % self.write_to_file)
+            if self.host_files:
+                self.sync()
+                while self.host_files:
+                    self.close_file(*self.host_files.popitem(last=False))
+        except (IOError, OSError) as e:
+            self.fail(e)
+
+    def fail(self, error):
+        """ Give up writing, closing the files and reporting why once.
+
+        @param error: The error writing to the file(s).
+        @type error: IOError or OSError
+
+        @returns: None
+        """
+        self.failed = True
+        self.stdout.put("Could not save script output to file, the rest of "
+                        "it is dropped. Error:\n" + str(error))
+        out_files = self.host_files.values()
+        if self.out_file is not None:
+            out_files.append(self.out_file)
+        self.out_file = None
+        self.host_files.clear()
+        for out_file in out_files:
+            try:
+                out_file.close()
+            except (IOError, OSError):
+                pass
+
+    def write_single(self, output):
+        """ Append the output to the single output file, opening it first.
+
+        @returns: None
+        """
+        if self.out_file is None:
+            self.out_file = open(self.write_to_file, "a+b", BUFFER_SIZE)
+        self.out_file.write(output)
+        self.wrote()
+
+    def wrote(self):
+        """ Count an output written, syncing once a batch is due. """
+        self.unsynced += 1
+        if (self.unsynced >= SYNC_EVERY or
+                time.time() - self.last_sync >= SYNC_SECONDS):
+            self.sync()
+
+    def sync(self):
+        """ Flush the open output file(s) and sync them to disk. """
+        if self.out_file is not None:
+            out_files = [self.out_file]
+        else:
+            out_files = self.host_files.values()
+        for out_file in out_files:
+            out_file.flush()
+            os.fsync(out_file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.time()
+
+    def write_multiple(self, result):
+        """ Append the output to the file for the host it came from.
+
+        @returns: None
+        """
+        # inject the ip into the front of the filename
+        filepath = path.join(path.split(self.write_to_file)[0],
+                             result.host + "_" +
+                             path.split(self.write_to_file)[1])
+        out_file = self.host_files.pop(filepath, None)
+        if out_file is None:
+            if len(self.host_files) >= OPEN_FILES:
+                self.close_file(*self.host_files.popitem(last=False))
+            try:
+                out_file = open(filepath, 'a+b', BUFFER_SIZE)
+            except IOError as e:
+                self.stdout.put('Error opening output file \'%s\' for'
+                                ' writing. The Error was:\n%s' %
+                                (filepath, str(e)))
+                return
+        # Put back last, as the most recently written.
+        self.host_files[filepath] = out_file
+        out_file.write(result.output)
+        self.wrote()
+
+    def close_file(self, filepath, out_file):
+        """ Close a per-host file, letting the user know it was written.
+
+        @returns: None
+        """
+        out_file.close()
+        self.stdout.put('\nOutput written/appended to: ' + filepath)
+
+
+class WriterPool(object):
+
+    """ Spread per-host output files over several OutputWriters. """
+
+    def __init__(self, write_to_file, wtf_style, stdout):
+        """ Initialize the WriterPool, see OutputWriter.__init__. """
+        self.writers = [OutputWriter(write_to_file, wtf_style, stdout)
+                        for x in range(WRITER_THREADS)]
+
+    def start(self):
+        """ Start each of the writers. """
+        for writer in self.writers:
+            writer.start()
+
+    def write(self, result):
+        """ Hand the result to the writer responsible for its host. """
+        self.writers[hash(result.host) % len(self.writers)].write(result)
+
+    def close(self):
+        """ Close each of the writers, waiting for them to finish. """
+        for writer in self.writers:
+            writer.close()
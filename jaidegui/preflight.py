@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+""" Preflight Class.
+
+Purpose: This class checks which devices can be reached before the WorkerThread
+hands them to the pool, so that a dead device is reported straight away
+instead of holding a worker until its connection timeout runs out. Every
+device is swept at once with non-blocking TCP connects to the port the run
+will use, waiting on all of them together with select(), so the whole sweep
+takes at most one connection timeout however many devices there are. Only a
+TCP connection is made, with no SSH or NETCONF handshake, and it is closed
+straight away.
+
+A host that couldn't be checked, because a socket couldn't be opened for it
+(such as when the process runs out of file descriptors) or select() failed,
+is not reported as unreachable. It is handed to the pool like any other, and
+jaide finds out for itself whether it can connect.
+
+The result for each host and port is cached for SWEEP_TTL seconds, so running
+against the same devices again soon after doesn't sweep them a second time.
+The module level 'checker' object is shared by every run.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import errno
+import multiprocessing.pool
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+import select
+import socket
+import threading
+import time
+
+# Seconds a sweep result is reused for.
+SWEEP_TTL = 60
+# Most connects in flight at once, which keeps within the limit select() has
+# on the number of sockets (as low as 512 on Windows). It is lowered further
+# to fit in the open file limit of the process, see sweep_batch().
+SWEEP_BATCH = 500
+# Threads used to resolve hostnames, since resolving can block.
+RESOLVE_THREADS = 16
+# Errors from a non-blocking connect() that mean it is still in progress.
+IN_PROGRESS = (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY,
+               getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK))
+
+
+class Preflight(object):
+
+    """ Parallel TCP reachability sweep, with a short lived cache. """
+
+    def __init__(self, ttl=SWEEP_TTL):
+        """ Initialize the Preflight object.
+
+        @param ttl: Seconds to reuse the result for a host for.
+        @type ttl: int
+
+        @returns: None
+        """
+        self.ttl = ttl
+        # Maps (host, port) to (reason, time swept), where reason is None if
+        # the host was reachable.
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def sweep(self, hosts, port, timeout):
+        """ Find out which hosts accept a TCP connection on the port.
+
+        @param hosts: The IPs or hostnames to check.
+        @type hosts: list
+        @param port: The port to connect to.
+        @type port: int
+        @param timeout: Seconds to wait for the connections.
+        @type timeout: float
+
+        @returns: The hosts that could be reached, in the order given, and a
+                | dict of the ones that couldn't, to the reason why.
+        @rtype: tuple
+        """
+        port = int(port)
+        now = time.time()
+        results = {}
+        with self._lock:
+            for host in hosts:
+                cached = self._results.get((host, port))
+                if cached is not None and now - cached[1] <= self.ttl:
+                    results[host] = cached[0]
+        unknown = [host for host in set(hosts) if host not in results]
+        batch = sweep_batch()
+        for start in range(0, len(unknown), batch):
+            swept = _sweep(unknown[start:start + batch], port,
+                           float(timeout))
+            now = time.time()
+            with self._lock:
+                for host, reason in swept.iteritems():
+                    self._results[(host, port)] = (reason, now)
+            results.update(swept)
+        # The hosts that couldn't be checked aren't in results.
+        reachable = [host for host in hosts if results.get(host) is None]
+        unreachable = dict((host, results[host]) for host in hosts
+                           if results.get(host) is not None)
+        return reachable, unreachable
+
+    def clear(self):
+        """ Forget every cached result. """
+        with self._lock:
+            self._results.clear()
+
+
+def sweep_batch():
+    """ Return how many connects to have in flight at once.
+
+    Purpose: Each connect holds a file descriptor, and the default limit is
+           | only 256 on macOS. Half of the limit is left for the files and
+           | sessions the rest of jaidegui has open.
+
+    @rtype: int
+    """
+    if resource is None:
+        return SWEEP_BATCH
+    try:
+        soft = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    except (ValueError, resource.error):
+        return SWEEP_BATCH
+    if soft == resource.RLIM_INFINITY:
+        return SWEEP_BATCH
+    return max(1, min(SWEEP_BATCH, soft // 2))
+
+
+def _resolve(host_port):
+    """ Resolve a host to the address to connect to, or the error doing so.
+
+    @returns: A (family, address, error) tuple, with only the error set if it
+            | couldn't be resolved.
+    @rtype: tuple
+    """
+    host, port = host_port
+    try:
+        family, kind, proto, name, address = socket.getaddrinfo(
+            host, port, 0, socket.SOCK_STREAM)[0]
+    except socket.error as e:
+        return None, None, "could not resolve host: %s" % e
+    return family, address, None
+
+
+def _sweep(hosts, port, timeout):
+    """ Connect to each host at once, and wait for them all together.
+
+    @returns: A dict of each host to None if it was reachable, or the
+            | reason it wasn't. The hosts that couldn't be checked are left
+            | out.
+    @rtype: dict
+    """
+    results = {}
+    if len(hosts) > 1:
+        pool = multiprocessing.pool.ThreadPool(min(RESOLVE_THREADS,
+                                                   len(hosts)))
+        try:
+            addresses = pool.map(_resolve, [(host, port) for host in hosts])
+        finally:
+            pool.close()
+    else:
+        addresses = [_resolve((host, port)) for host in hosts]
+    # Maps each socket still connecting to its host.
+    pending = {}
+    for host, (family, address, error) in zip(hosts, addresses):
+        if error is not None:
+            results[host] = error
+            continue
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except socket.error:
+            continue  # Such as too many open files, so not checked.
+        sock.setblocking(0)
+        try:
+            code = sock.connect_ex(address)
+        except socket.error:
+            sock.close()
+            continue
+        if code == 0:
+            results[host] = None
+            sock.close()
+        elif code in IN_PROGRESS:
+            pending[sock] = host
+        else:
+            results[host] = "unable to connect to port %s: %s" % (
+                port, errno.errorcode.get(code, code))
+            sock.close()
+    deadline = time.time() + timeout
+    while pending and time.time() < deadline:
+        try:
+            ready = select.select([], pending.keys(), pending.keys(),
+                                  max(0, deadline - time.time()))
+        except (select.error, ValueError):
+            # The hosts still connecting are left not checked.
+            for sock in pending:
+                sock.close()
+            return results
+        for sock in set(ready[1]) | set(ready[2]):
+            host = pending.pop(sock)
+            code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            results[host] = (None if code == 0 else
+                             "unable to connect to port %s: %s" %
+                             (port, errno.errorcode.get(code, code)))
+            sock.close()
+    for sock, host in pending.iteritems():
+        results[host] = ("timed out connecting to port %s after %gs" %
+                         (port, timeout))
+        sock.close()
+    return results
+
+
+# The sweep and its cache for this process.
+checker = Preflight()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+""" ProgressTracker Class.
+
+Purpose: This class keeps count of how far along the running jobs are, for
+the progress bar and counters under the output area. The WorkerThread of each
+job puts a small event on its own progress queue as devices are queued,
+handed to a worker and finished, separate from the output on stdout, so the
+counters can be updated often without going near the output area. The GUI
+hands every event waiting on the queue to update() on a short timer, and
+shows describe(), such as '312/1500 done, 14 failed, 22.0 dev/s, ETA 54s'.
+
+The throughput is the number of devices finished over the last RATE_WINDOW
+seconds, so it follows the run as it speeds up or slows down, and the ETA is
+how long the devices left would take at that rate.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import time
+
+from device_result import DeviceResult
+
+# Kinds of progress event. Each event is a (kind, job id, value, time) tuple,
+# where the value is the number of devices for QUEUED, the host for STARTED,
+# and the jaidegui.device_result.DeviceResult status for FINISHED.
+QUEUED = "queued"
+STARTED = "started"
+FINISHED = "finished"
+# Seconds of finished devices the throughput is worked out over.
+RATE_WINDOW = 10.0
+
+
+def event(kind, job_id, value=None):
+    """ Create a progress event, stamped with the current time.
+
+    @param kind: One of QUEUED, STARTED or FINISHED.
+    @type kind: str
+    @param job_id: The id of the job the event belongs to.
+    @type job_id: int
+    @param value: The number of devices, host or status, see QUEUED.
+
+    @returns: The event, to put on a progress queue.
+    @rtype: tuple
+    """
+    return kind, job_id, value, time.time()
+
+
+class ProgressTracker(object):
+
+    """ Count the devices queued, in flight, finished and failed. """
+
+    def __init__(self):
+        """ Initialize the ProgressTracker object, with nothing counted.
+
+        @returns: None
+        """
+        self.reset()
+
+    def reset(self):
+        """ Start counting from zero, for a new run.
+
+        @returns: None
+        """
+        self.total = 0
+        self.started = 0
+        self.finished = 0
+        self.failed = 0
+        self.first = None
+        # The times of the devices finished within the last RATE_WINDOW.
+        self._recent = collections.deque()
+
+    def update(self, events):
+        """ Count some progress events.
+
+        @param events: The events, in the order they were put on the queue.
+        @type events: list
+
+        @returns: None
+        """
+        for kind, job_id, value, when in events:
+            if self.first is None:
+                self.first = when
+            if kind == QUEUED:
+                self.total += value
+            elif kind == STARTED:
+                self.started += 1
+            elif kind == FINISHED:
+                self.finished += 1
+                if value != DeviceResult.OK:
+                    self.failed += 1
+                self._recent.append(when)
+
+    @property
+    def in_flight(self):
+        """ Return how many devices have been started, but not finished. """
+        return max(self.started - self.finished, 0)
+
+    def rate(self, now=None):
+        """ Return the devices finished per second, over the last RATE_WINDOW
+            seconds (or since the run started, if sooner).
+        """
+        now = time.time() if now is None else now
+        while self._recent and self._recent[0] < now - RATE_WINDOW:
+            self._recent.popleft()
+        if self.first is None or not self._recent:
+            return 0.0
+        return len(self._recent) / max(min(RATE_WINDOW, now - self.first),
+                                       1.0)
+
+    def eta(self, now=None):
+        """ Return the seconds until every device is done at the current rate,
+            or None if nothing has finished lately.
+        """
+        rate = self.rate(now)
+        if not rate:
+            return None
+        return max(self.total - self.finished, 0) / rate
+
+    def describe(self, now=None):
+        """ Describe the progress, such as '312/1500 done, 14 failed, 22.0
+            dev/s, ETA 54s'.
+        """
+        text = "%d/%d done, %d failed, %.1f dev/s" % (
+            self.finished, self.total, self.failed, self.rate(now))
+        eta = self.eta(now)
+        if eta is not None and self.finished < self.total:
+            text += ", ETA %ds" % round(eta)
+        return text
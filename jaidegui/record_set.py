@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+""" RecordSet Class.
+
+Purpose: This class holds the records parsed from the results of a run, one
+dict per row, for the record tables of the GUI, such as the fleet summary of
+Health Check and Device Info. Records are added as their results arrive. With
+a key column, a record for a key already in the set is merged into its row,
+so running Device Info and then Health Check against a fleet fills in one row
+per device. The rows can be sorted by any column, filtered, and exported to
+CSV or JSON.
+
+A filter is made of terms separated by spaces, and a row is shown only if it
+matches every term. A term such as 'cpu>80' or 'model=mx480' compares a
+column with a value, using one of the operators in OPERATORS, numerically if
+both sides are numbers. Any other term matches rows with that text in any
+column, ignoring case.
+
+The sorted and filtered rows are only worked out again when something
+changes, so the table can redraw the few rows on screen as often as it likes.
+Nothing here imports Tkinter, see jaidegui.jgui_widgets.RecordTableWindow.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import csv
+import json
+import operator
+import re
+
+# Operators a filter term can compare a column with, longest first.
+OPERATORS = [(">=", operator.ge), ("<=", operator.le), ("!=", operator.ne),
+             (">", operator.gt), ("<", operator.lt), ("=", operator.eq)]
+COMPARISON = re.compile(r"^(\w+)(%s)(.*)$" %
+                        "|".join(re.escape(symbol) for symbol, op in
+                                 OPERATORS))
+
+
+def _number(value):
+    """ Return a value as a float if it is a number, otherwise None. """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(value):
+    """ Return a value as shown in the table. """
+    if value is None:
+        return u""
+    if isinstance(value, str):
+        return value.decode("utf-8", "replace")
+    return unicode(value)
+
+
+class RecordSet(object):
+
+    """ Records keyed by column, which can be merged, sorted and filtered. """
+
+    def __init__(self, columns, key=None):
+        """ Initialize the RecordSet object, with no records.
+
+        @param columns: The columns of the records, in the order shown.
+        @type columns: list
+        @param key: The column identifying a row, so records for the same
+                  | key are merged into one row, or None to add each record
+                  | as its own row.
+        @type key: str
+
+        @returns: None
+        """
+        self.columns = columns
+        self.key = key
+        self.sort_column = None
+        self.descending = False
+        # The parsed filter terms, see set_filter().
+        self.terms = []
+        # Counts the changes, so a table can tell when to redraw.
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        """ Remove every record, keeping the sort and filter. """
+        self.rows = []
+        self._keyed = {}
+        self._view = None
+        self.version += 1
+
+    def add(self, records):
+        """ Add records, merging those for a key already in the set.
+
+        @param records: The records, each a dict keyed by column.
+        @type records: list
+
+        @returns: None
+        """
+        for record in records:
+            key = record.get(self.key) if self.key is not None else None
+            if key is not None and key in self._keyed:
+                self._keyed[key].update(record)
+                continue
+            row = dict(record)
+            self.rows.append(row)
+            if key is not None:
+                self._keyed[key] = row
+        self._view = None
+        self.version += 1
+
+    def __len__(self):
+        """ Return the number of rows, before filtering. """
+        return len(self.rows)
+
+    def sort(self, column):
+        """ Sort by a column, reversing the order if already sorted by it.
+
+        @param column: The column to sort by.
+        @type column: str
+
+        @returns: None
+        """
+        self.descending = column == self.sort_column and not self.descending
+        self.sort_column = column
+        self._view = None
+        self.version += 1
+
+    def set_filter(self, text):
+        """ Only show the rows matching a filter, see the module docstring.
+
+        @param text: The filter, or an empty string to show every row.
+        @type text: str
+
+        @returns: None
+        """
+        self.terms = []
+        for term in text.split():
+            match = COMPARISON.match(term)
+            if match and match.group(1) in self.columns:
+                column, symbol, value = match.groups()
+                self.terms.append((column, dict(OPERATORS)[symbol],
+                                   value.lower()))
+            else:
+                self.terms.append((None, None, term.lower()))
+        self._view = None
+        self.version += 1
+
+    def matches(self, row):
+        """ Check whether a row matches every term of the filter. """
+        for column, op, value in self.terms:
+            if column is None:
+                if not any(value in _text(row.get(name)).lower()
+                           for name in self.columns):
+                    return False
+                continue
+            cell = row.get(column)
+            if cell is None:
+                return False
+            left, right = _number(cell), _number(value)
+            if left is None or right is None:
+                left, right = _text(cell).lower(), value
+            if not op(left, right):
+                return False
+        return True
+
+    def _sort_key(self, row):
+        """ Return the key a row is sorted by, numbers before text. """
+        value = row.get(self.sort_column)
+        number = _number(value) if not isinstance(value, basestring) else None
+        if number is not None:
+            return (0, number, u"")
+        return (1, 0, _text(value).lower())
+
+    def view(self):
+        """ Return the rows matching the filter, in the sorted order.
+
+        @rtype: list
+        """
+        if self._view is None:
+            rows = [row for row in self.rows if self.matches(row)]
+            if self.sort_column is not None:
+                rows.sort(key=self._sort_key, reverse=self.descending)
+            self._view = rows
+        return self._view
+
+    def cells(self, row):
+        """ Return the text of each column of a row, as shown. """
+        return [_text(row.get(column)) for column in self.columns]
+
+    def export(self, filepath):
+        """ Save the rows matching the filter, in the sorted order.
+
+        @param filepath: The file to write, as JSON if it ends in .json,
+                       | otherwise as CSV with a header row.
+        @type filepath: str
+
+        @returns: The number of rows written.
+        @rtype: int
+
+        @raises IOError: if the file couldn't be written.
+        """
+        rows = self.view()
+        if filepath.lower().endswith(".json"):
+            with open(filepath, "wb") as output_file:
+                json.dump([collections.OrderedDict(
+                    (column, row.get(column)) for column in self.columns)
+                    for row in rows],
+                          output_file, indent=2)
+        else:
+            with open(filepath, "wb") as output_file:
+                writer = csv.writer(output_file)
+                writer.writerow(self.columns)
+                for row in rows:
+                    writer.writerow([cell.encode("utf-8")
+                                     for cell in self.cells(row)])
+        return len(rows)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+""" ResultCache Class.
+
+Purpose: This class keeps the recent results of read only commands, so that
+running the same command against the same devices again within a few minutes,
+as often happens while troubleshooting, is answered straight away without
+connecting to the devices at all. Results are keyed by the host, port,
+username, the jaide.wrap function run and its arguments (which include the
+output format), and each is kept for the TTL of its function in TTLS. Only
+successful results are cached, and only of the functions in TTLS. Operational
+commands are only cached when every command is a 'show' command not piped to
+'save', since other commands can change the device, and a file of commands
+can't be checked ahead of time.
+
+The cache holds at most CACHE_LIMIT results and CACHE_BYTES of output, and
+the least recently used results are dropped first.
+
+The module level 'cache' object is shared by every run in the GUI process.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import json
+import threading
+import time
+
+from device_result import DeviceResult
+
+# Seconds a result is reused for, for each read only jaide.wrap function.
+TTLS = {
+    "device_info": 300,
+    "health_check": 60,
+    "interface_errors": 60,
+    "command": 60
+}
+# Most results kept at once.
+CACHE_LIMIT = 5000
+# Most bytes of output kept at once.
+CACHE_BYTES = 64 * 1024 * 1024
+
+
+def cacheable(function, args):
+    """ Check whether the results of a command may be cached.
+
+    @param function: The jaide.wrap function being run.
+    @type function: function
+    @param args: The arguments it is run with, after the connection.
+    @type args: list
+
+    @returns: True if the command only reads from the device.
+    @rtype: bool
+    """
+    name = getattr(function, "__name__", "")
+    if name not in TTLS:
+        return False
+    if name == "command":
+        commands = [command.strip() for command in
+                    args[0].replace("\n", ",").split(",") if command.strip()]
+        return bool(commands) and all(_read_only(command)
+                                      for command in commands)
+    return True
+
+
+def _read_only(command):
+    """ Check an operational command is a show command, not saved to file. """
+    pipes = [pipe.split()[:1] for pipe in command.split("|")]
+    return pipes[0] in (["show"], ["sh"]) and ["save"] not in pipes[1:]
+
+
+def cache_key(host, port, username, function, args):
+    """ Build the key a result is cached under.
+
+    @returns: The key, made of the host, port, username, function name and
+            | arguments.
+    @rtype: tuple
+    """
+    return (host, int(port), username, function.__name__,
+            json.dumps(args, default=str))
+
+
+class ResultCache(object):
+
+    """ LRU cache of recent read only results, with a TTL per function. """
+
+    def __init__(self, limit=CACHE_LIMIT, max_bytes=CACHE_BYTES):
+        """ Initialize the ResultCache object.
+
+        @param limit: The most results to keep at once.
+        @type limit: int
+        @param max_bytes: The most bytes of output to keep at once.
+        @type max_bytes: int
+
+        @returns: None
+        """
+        self.limit = limit
+        self.max_bytes = max_bytes
+        # Maps each key to (result, expiry), ordered from least to most
+        # recently used.
+        self._results = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """ Look up a result that hasn't expired.
+
+        @param key: The key, from cache_key().
+        @type key: tuple
+
+        @returns: A copy of the result, as finishing now, with a note saying
+                | when it is from, or None if there isn't one.
+        @rtype: jaidegui.device_result.DeviceResult
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._results.pop(key, None)
+            if entry is not None and entry[1] <= now:
+                self._bytes -= entry[0].size
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._results[key] = entry
+            self.hits += 1
+        result = entry[0]
+        copy = DeviceResult(
+            result.host, result.output + "(Cached result from %s, expiring "
+            "in %ds. Check 'Force refresh' to run again.)\n" %
+            (time.strftime("%H:%M:%S", time.localtime(result.finished)),
+             entry[1] - now), result.status, now, now)
+        copy.cached = True
+        return copy
+
+    def put(self, key, result, function_name):
+        """ Cache a successful result, dropping the least recently used
+            results if the cache is full.
+
+        @param key: The key, from cache_key().
+        @type key: tuple
+        @param result: The result to cache.
+        @type result: jaidegui.device_result.DeviceResult
+        @param function_name: The name of the jaide.wrap function run, to
+                            | look up its TTL.
+        @type function_name: str
+
+        @returns: None
+        """
+        if result.status != DeviceResult.OK or result.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._results.pop(key, None)
+            if old is not None:
+                self._bytes -= old[0].size
+            self._results[key] = (result, result.finished +
+                                  TTLS[function_name])
+            self._bytes += result.size
+            while (len(self._results) > self.limit or
+                   self._bytes > self.max_bytes):
+                dropped = self._results.popitem(last=False)[1]
+                self._bytes -= dropped[0].size
+
+    def clear(self):
+        """ Forget every cached result. """
+        with self._lock:
+            self._results.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        """ Return the number of results cached. """
+        return len(self._results)
+
+    def stats_summary(self):
+        """ Describe the use of the cache.
+
+        @returns: A human readable summary of the cache.
+        @rtype: str
+        """
+        return ("Result cache: %d result(s) cached, %d used, %d missed." %
+                (len(self), self.hits, self.misses))
+
+
+# The result cache for this process.
+cache = ResultCache()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+""" ResultStore Class.
+
+Purpose: This class records the result of every device of every run in a
+local SQLite database, so that questions like 'what did show chassis alarms
+return on these hosts last Tuesday' can be answered without searching through
+saved output files. Each result is stored with the host, the operation (the
+command option, such as 'Operational Command(s)'), its arguments, the status,
+the timings of its phases and its output, compressed with zlib. The host,
+operation and time are indexed, so looking up the results across runs stays
+fast however many runs have been recorded.
+
+Results are handed to add(), which only queues them. The store's own thread
+writes them in batches of up to BATCH_SIZE per transaction, so recording a
+large run never holds up the WorkerThread. The database is in WAL mode, so
+the GUI can query it while results are being written.
+
+The module level 'store' object is shared by the whole process, and opens
+results.db in jaidegui's data folder the first time it is used.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import Queue
+
+# Most results written in one transaction.
+BATCH_SIZE = 500
+# Most rows returned by query().
+QUERY_LIMIT = 1000
+# Formats accepted by parse_time(), most specific first.
+TIME_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"]
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run TEXT,
+    host TEXT,
+    operation TEXT,
+    arguments TEXT,
+    status TEXT,
+    started REAL,
+    finished REAL,
+    timings TEXT,
+    size INTEGER,
+    output BLOB
+);
+CREATE INDEX IF NOT EXISTS results_host ON results (host, started);
+CREATE INDEX IF NOT EXISTS results_operation ON results (operation, started);
+CREATE INDEX IF NOT EXISTS results_started ON results (started);
+"""
+# The columns returned by query(), all but the output.
+COLUMNS = ["id", "run", "host", "operation", "arguments", "status", "started",
+           "finished", "timings", "size"]
+
+
+def parse_time(value):
+    """ Convert a local date and time, such as '2015-06-30 14:00', to a
+        time.time().
+
+    @param value: A date, with an optional time, in one of TIME_FORMATS.
+    @type value: str
+
+    @returns: The time, or None if the value is blank.
+    @rtype: float
+
+    @raises ValueError: if the value isn't in one of TIME_FORMATS.
+    """
+    value = value.strip()
+    if not value:
+        return None
+    for time_format in TIME_FORMATS:
+        try:
+            return time.mktime(time.strptime(value, time_format))
+        except ValueError:
+            continue
+    raise ValueError("'%s' isn't a date, such as 2015-06-30 or 2015-06-30 "
+                     "14:00." % value)
+
+
+class ResultStore(threading.Thread):
+
+    """ Queue results, and write them to SQLite in batches. """
+
+    def __init__(self, filepath=None):
+        """ Initialize the ResultStore object, opening nothing yet.
+
+        @param filepath: The database file, defaults to results.db in
+                       | jaidegui's data folder.
+        @type filepath: str
+
+        @returns: None
+        """
+        super(ResultStore, self).__init__()
+        self.daemon = True
+        self.filepath = filepath
+        self._queue = Queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        # The last error writing to the database, if any.
+        self.error = None
+
+    def _connect(self):
+        """ Open a connection to the database, creating it if needed.
+
+        @returns: The connection.
+        @rtype: sqlite3.Connection
+        """
+        if self.filepath is None:
+            from module_locator import data_path
+            self.filepath = os.path.join(data_path(), "results.db")
+        connection = sqlite3.connect(self.filepath, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def add(self, result, operation, arguments, run):
+        """ Queue a device's result to be written.
+
+        @param result: The result of the device.
+        @type result: jaidegui.device_result.DeviceResult
+        @param operation: The command option that was run.
+        @type operation: str
+        @param arguments: The arguments it was run with.
+        @type arguments: list
+        @param run: Identifies the run the result belongs to.
+        @type run: str
+
+        @returns: None
+        """
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self.start()
+        output = result.output
+        if isinstance(output, unicode):
+            output = output.encode("utf-8")
+        self._queue.put((run, result.host, operation,
+                         json.dumps(arguments, default=str), result.status,
+                         result.started, result.finished,
+                         json.dumps(result.timings), result.size,
+                         sqlite3.Binary(zlib.compress(output))))
+
+    def run(self):
+        """ Write the queued results, a batch at a time.
+
+        @returns: None
+        """
+        try:
+            connection = self._connect()
+        except (sqlite3.Error, OSError) as e:
+            self.error = str(e)
+            connection = None
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < BATCH_SIZE:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except Queue.Empty:
+                    break
+            if connection is not None:
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO results (run, host, operation, "
+                            "arguments, status, started, finished, timings, "
+                            "size, output) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, "
+                            "?)", rows)
+                except sqlite3.Error as e:
+                    self.error = str(e)
+            for row in rows:
+                self._queue.task_done()
+
+    def flush(self):
+        """ Wait until every queued result has been written. """
+        if self._started:
+            self._queue.join()
+
+    def query(self, hosts=None, operation=None, status=None, since=None,
+              until=None, limit=QUERY_LIMIT):
+        """ Look up recorded results, newest first.
+
+        @param hosts: The hosts to include, each either an IP or hostname or
+                    | a pattern using * and ?, or None for every host.
+        @type hosts: list
+        @param operation: The command option to include, or None for all.
+        @type operation: str
+        @param status: The status to include, or None for all.
+        @type status: str
+        @param since: The earliest time.time() a device started, or None.
+        @type since: float
+        @param until: The latest time.time() a device started, or None.
+        @type until: float
+        @param limit: The most results to return.
+        @type limit: int
+
+        @returns: A dict of COLUMNS for each result, without the output.
+        @rtype: list
+
+        @raises sqlite3.Error: if the database couldn't be read.
+        """
+        clauses = []
+        params = []
+        if hosts:
+            exact = [host for host in hosts if not set("*?[") & set(host)]
+            patterns = [host for host in hosts if host not in exact]
+            matches = []
+            if exact:
+                matches.append("host IN (%s)" % ", ".join("?" * len(exact)))
+                params.extend(exact)
+            for pattern in patterns:
+                matches.append("host GLOB ?")
+                params.append(pattern)
+            clauses.append("(%s)" % " OR ".join(matches))
+        for column, value in (("operation", operation), ("status", status)):
+            if value:
+                clauses.append("%s = ?" % column)
+                params.append(value)
+        if since is not None:
+            clauses.append("started >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("started <= ?")
+            params.append(until)
+        sql = "SELECT %s FROM results" % ", ".join(COLUMNS)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY started DESC LIMIT ?"
+        params.append(limit)
+        connection = self._connect()
+        try:
+            return [dict(zip(COLUMNS, row))
+                    for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+
+    def output(self, result_id):
+        """ Read the output of a recorded result.
+
+        @param result_id: The id of the result, from query().
+        @type result_id: int
+
+        @returns: The output, or None if there is no such result.
+        @rtype: str
+
+        @raises sqlite3.Error: if the database couldn't be read.
+        """
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT output FROM results WHERE id = ?",
+                                     (result_id,)).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        return zlib.decompress(str(row[0])).decode("utf-8", "replace")
+
+
+# The result store for this process.
+store = ResultStore()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+""" RunStats Class.
+
+Purpose: This class gathers the timings of every device in a run, so that a
+slow run can be put down to the right thing: slow name lookups, slow
+connections, or slow commands on the devices themselves. Each DeviceResult
+brings back how long each phase took on its device, and how many bytes of
+output it returned. The summary gives the median, 95th percentile and
+slowest time of each phase, the slowest devices, and the throughput of the
+run as a whole. The same figures, along with the timings of every device, can
+be exported as JSON.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import json
+import math
+import time
+
+# The phases a device's time is split into, in the order they happen.
+PHASES = ["resolve", "connect", "execute", "close"]
+# Slowest devices listed in the summary.
+SLOWEST_DEVICES = 10
+
+
+def percentile(values, fraction):
+    """ Find a percentile of some values, using the nearest rank.
+
+    @param values: The values, sorted.
+    @type values: list
+    @param fraction: Which percentile, as a fraction, such as 0.95.
+    @type fraction: float
+
+    @returns: The value at that percentile, or 0 if there are no values.
+    @rtype: float
+    """
+    if not values:
+        return 0.0
+    rank = int(math.ceil(fraction * len(values)))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+class RunStats(object):
+
+    """ Collect the per phase timings of the devices in a run. """
+
+    def __init__(self):
+        """ Initialize the RunStats object, with no devices yet.
+
+        @returns: None
+        """
+        self.devices = []
+        self.first_started = None
+        self.last_finished = None
+
+    def add(self, result):
+        """ Add the timings of a device.
+
+        @param result: The result of the device.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: None
+        """
+        self.devices.append({
+            "host": result.host,
+            "status": result.status,
+            "started": result.started,
+            "duration": result.duration,
+            "bytes": result.size,
+            "phases": result.timings
+        })
+        if self.first_started is None or result.started < self.first_started:
+            self.first_started = result.started
+        if self.last_finished is None or result.finished > self.last_finished:
+            self.last_finished = result.finished
+
+    @property
+    def wall_time(self):
+        """ Return the seconds from the first device starting to the last
+            finishing.
+        """
+        if self.first_started is None:
+            return 0.0
+        return self.last_finished - self.first_started
+
+    def to_dict(self, top=SLOWEST_DEVICES):
+        """ Work out the summary figures for the run.
+
+        @param top: How many of the slowest devices to list.
+        @type top: int
+
+        @returns: The number of devices, the wall time, the devices finished
+                | per second, the total bytes of output, the median, 95th
+                | percentile and slowest seconds of each phase (and of the
+                | whole device), and the slowest devices.
+        @rtype: dict
+        """
+        phases = {}
+        for name in PHASES + ["total"]:
+            values = sorted(device["duration"] if name == "total" else
+                            device["phases"][name]
+                            for device in self.devices
+                            if name == "total" or name in device["phases"])
+            if values:
+                phases[name] = {"p50": percentile(values, 0.5),
+                                "p95": percentile(values, 0.95),
+                                "max": values[-1]}
+        wall_time = self.wall_time
+        slowest = sorted(self.devices, key=lambda device: device["duration"],
+                         reverse=True)[:top]
+        return {
+            "devices": len(self.devices),
+            "wall_time": wall_time,
+            "devices_per_second": (len(self.devices) / wall_time
+                                   if wall_time else 0.0),
+            "bytes": sum(device["bytes"] for device in self.devices),
+            "phases": phases,
+            "slowest": slowest
+        }
+
+    def summary(self, top=SLOWEST_DEVICES):
+        """ Describe the timings of the run, for the output area.
+
+        @param top: How many of the slowest devices to list.
+        @type top: int
+
+        @returns: A few lines of text, or an empty string if no devices have
+                | finished.
+        @rtype: str
+        """
+        if not self.devices:
+            return ""
+        stats = self.to_dict(top)
+        lines = ["Timings: %d device(s) in %.2fs, %.2f devices/s, %d bytes "
+                 "of output." % (stats["devices"], stats["wall_time"],
+                                 stats["devices_per_second"], stats["bytes"]),
+                 "%-8s %9s %9s %9s" % ("Phase", "p50", "p95", "max")]
+        for name in PHASES + ["total"]:
+            if name in stats["phases"]:
+                phase = stats["phases"][name]
+                lines.append("%-8s %8.3fs %8.3fs %8.3fs" %
+                             (name, phase["p50"], phase["p95"], phase["max"]))
+        lines.append("Slowest devices:")
+        for device in stats["slowest"]:
+            lines.append("  %-30s %8.3fs  %s" % (
+                device["host"], device["duration"],
+                ", ".join("%s %.3fs" % (name, device["phases"][name])
+                          for name in PHASES if name in device["phases"])))
+        return "\n".join(lines) + "\n"
+
+    def export(self, filepath):
+        """ Write the summary, and the timings of every device, as JSON.
+
+        @param filepath: The file to write.
+        @type filepath: str
+
+        @returns: None
+
+        @raises IOError: if the file couldn't be written.
+        """
+        stats = self.to_dict()
+        stats["exported"] = time.time()
+        stats["all_devices"] = self.devices
+        with open(filepath, "wb") as output_file:
+            json.dump(stats, output_file, indent=2, sort_keys=True)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+""" RunTrace Class.
+
+Purpose: This class records a timeline of a run, and writes it out in the
+Trace Event Format, which can be opened in chrome://tracing or the Perfetto
+UI (https://ui.perfetto.dev). Each worker of the pool gets a track of its
+own, showing the phases of each device it ran, so gaps between devices
+(idle workers), devices that take far longer than the rest, and devices left
+waiting for a worker stand out at a glance.
+
+Every device gets a 'queued' span, from being handed to the pool to a worker
+starting on it, shown on a track of its own as they overlap. The phases
+timed by run_jaide() are shown on the track of the worker that ran the
+device, and writing the output to the output file(s) is shown on the track of
+the thread that wrote it.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import json
+import os
+import threading
+
+
+class RunTrace(object):
+
+    """ Collect the spans of a run, and write them as a trace. """
+
+    def __init__(self):
+        """ Initialize the RunTrace object, with no spans yet.
+
+        @returns: None
+        """
+        self._lock = threading.Lock()
+        self._events = []
+        # Maps (pid, tid) to the name of its track.
+        self._tracks = {}
+        self._queued = 0
+        self.pid = os.getpid()
+
+    def span(self, name, start, end, worker, args=None):
+        """ Record something that happened on a worker.
+
+        @param name: What happened, such as the name of a phase.
+        @type name: str
+        @param start: The time.time() it started.
+        @type start: float
+        @param end: The time.time() it ended.
+        @type end: float
+        @param worker: The (pid, thread id, thread name) of the worker.
+        @type worker: tuple
+        @param args: Details shown when the span is selected.
+        @type args: dict
+
+        @returns: None
+        """
+        pid, tid, thread_name = worker
+        with self._lock:
+            self._tracks[(pid, tid)] = thread_name
+            self._events.append({"name": name, "cat": "device", "ph": "X",
+                                 "ts": start, "dur": end - start, "pid": pid,
+                                 "tid": tid, "args": args or {}})
+
+    def queued(self, host, start, end):
+        """ Record a device waiting for a worker.
+
+        @param host: The IP or hostname of the device.
+        @type host: str
+        @param start: The time.time() it was handed to the pool.
+        @type start: float
+        @param end: The time.time() a worker started on it.
+        @type end: float
+
+        @returns: None
+        """
+        with self._lock:
+            self._queued += 1
+            for phase, ts in (("b", start), ("e", end)):
+                self._events.append({"name": "queued", "cat": "queue",
+                                     "ph": phase, "ts": ts, "pid": self.pid,
+                                     "id": self._queued,
+                                     "args": {"host": host}})
+
+    def add(self, result, submitted=None):
+        """ Record the phases of a device.
+
+        @param result: The result of the device.
+        @type result: jaidegui.device_result.DeviceResult
+        @param submitted: The time.time() it was handed to the pool, if it
+                        | was.
+        @type submitted: float
+
+        @returns: None
+        """
+        if submitted is not None:
+            self.queued(result.host, submitted, result.started)
+        if result.worker is None:
+            return
+        args = {"host": result.host, "status": result.status}
+        for name, start, end in result.phases:
+            self.span(name, start, end, result.worker, args)
+
+    def write(self, filepath):
+        """ Write the trace in the Trace Event Format, as JSON.
+
+        @param filepath: The file to write.
+        @type filepath: str
+
+        @returns: None
+
+        @raises IOError: if the file couldn't be written.
+        """
+        with self._lock:
+            events = list(self._events)
+            tracks = dict(self._tracks)
+        # Timestamps are in microseconds from the start of the trace.
+        origin = min([event["ts"] for event in events] or [0])
+        trace = []
+        for event in events:
+            event = dict(event, ts=(event["ts"] - origin) * 1e6)
+            if "dur" in event:
+                event["dur"] *= 1e6
+            trace.append(event)
+        for pid in set([pid for pid, tid in tracks] + [self.pid]):
+            trace.append({"name": "process_name", "ph": "M", "pid": pid,
+                          "args": {"name": "jaidegui" if pid == self.pid
+                                   else "worker process %d" % pid}})
+        for (pid, tid), thread_name in tracks.iteritems():
+            trace.append({"name": "thread_name", "ph": "M", "pid": pid,
+                          "tid": tid, "args": {"name": thread_name}})
+        with open(filepath, "wb") as output_file:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"},
+                      output_file)
+
+
+def current_worker():
+    """ Identify the process and thread this is called from.
+
+    @returns: The (pid, thread id, thread name) of the caller, as used for
+            | the tracks of a RunTrace.
+    @rtype: tuple
+    """
+    thread = threading.current_thread()
+    return os.getpid(), thread.ident, thread.name
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+""" SessionCache Class.
+
+Purpose: This class keeps authenticated Jaide sessions alive between runs, so
+running against the same devices again doesn't pay for the TCP, SSH,
+authentication and NETCONF handshakes a second time. Sessions are keyed by
+host, port and username, checked out for exclusive use while a device is being
+run against, and checked back in afterwards. Idle sessions are closed once
+they pass SESSION_TTL, the least recently used ones are closed when there are
+more than SESSION_LIMIT, and SSH keepalives are sent on the ones being kept.
+
+Each process has its own cache, in the module level 'cache' object. With the
+thread engine that is the GUI process, so every run shares one cache. With the
+process engine each worker process would only keep the sessions it opened
+itself, and rarely be given the same device again, so sessions are only
+reused with the thread engine.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import collections
+import hashlib
+import threading
+import time
+
+# Seconds a session can sit unused before it is closed.
+SESSION_TTL = 300
+# Most sessions kept open at once, per process.
+SESSION_LIMIT = 200
+# Seconds between SSH keepalives, and between sweeps for expired sessions.
+KEEPALIVE_INTERVAL = 30
+
+
+class SessionCache(object):
+
+    """ LRU cache of open Jaide sessions with an idle timeout. """
+
+    def __init__(self, ttl=SESSION_TTL, limit=SESSION_LIMIT,
+                 keepalive=KEEPALIVE_INTERVAL):
+        """ Initialize the SessionCache object.
+
+        @param ttl: Seconds an idle session is kept for.
+        @type ttl: int
+        @param limit: The most sessions to keep at once.
+        @type limit: int
+        @param keepalive: Seconds between keepalives and expiry sweeps.
+        @type keepalive: int
+
+        @returns: None
+        """
+        self.ttl = ttl
+        self.limit = limit
+        self.keepalive = keepalive
+        # Maps (host, port, username) to (password digest, session, last use),
+        # ordered from least to most recently used.
+        self._sessions = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._sweeper = None
+        self.hits = 0
+        self.misses = 0
+
+    def checkout(self, host, port, username, password):
+        """ Take a live session out of the cache, if there is one.
+
+        Purpose: The session is removed from the cache while it is in use, so
+               | two threads can never run against the same session at once.
+               | It should be handed back with checkin() when done.
+
+        @returns: The Jaide session, or None if there wasn't a usable one.
+        @rtype: jaide.Jaide
+        """
+        key = (host, int(port), username)
+        with self._lock:
+            entry = self._sessions.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        digest, session, last_used = entry
+        if (digest != _digest(password) or
+                time.time() - last_used > self.ttl or not is_alive(session)):
+            close_session(session)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return session
+
+    def checkin(self, host, port, username, password, session):
+        """ Store a session for reuse, closing the oldest if over the limit.
+
+        @returns: None
+        """
+        key = (host, int(port), username)
+        _set_keepalive(session, self.keepalive)
+        evicted = []
+        with self._lock:
+            old = self._sessions.pop(key, None)
+            if old is not None and old[1] is not session:
+                evicted.append(old[1])
+            self._sessions[key] = (_digest(password), session, time.time())
+            while len(self._sessions) > self.limit:
+                evicted.append(self._sessions.popitem(last=False)[1][1])
+        for session in evicted:
+            close_session(session)
+        self._start_sweeper()
+
+    def expire(self):
+        """ Close every session that has been idle for longer than the TTL.
+
+        @returns: None
+        """
+        now = time.time()
+        expired = []
+        with self._lock:
+            for key, entry in self._sessions.items():
+                if now - entry[2] > self.ttl:
+                    expired.append(self._sessions.pop(key)[1])
+        for session in expired:
+            close_session(session)
+
+    def clear(self):
+        """ Close every cached session. """
+        with self._lock:
+            sessions = [entry[1] for entry in self._sessions.values()]
+            self._sessions.clear()
+        for session in sessions:
+            close_session(session)
+
+    def __len__(self):
+        """ Return the number of sessions currently cached. """
+        return len(self._sessions)
+
+    def _start_sweeper(self):
+        """ Start the background thread that expires idle sessions. """
+        if self._sweeper is not None:
+            return
+        self._sweeper = threading.Thread(target=self._sweep)
+        self._sweeper.daemon = True
+        self._sweeper.start()
+
+    def _sweep(self):
+        """ Expire idle sessions every keepalive interval, forever. """
+        while True:
+            time.sleep(self.keepalive)
+            self.expire()
+
+    def stats_summary(self):
+        """ Describe the use of the cache in this process.
+
+        @returns: A human readable summary of the cache.
+        @rtype: str
+        """
+        return ("Session cache: %d session(s) open, %d reused, %d opened." %
+                (len(self), self.hits, self.misses))
+
+
+def _digest(password):
+    """ Hash a password, so a changed one forces a fresh session. """
+    if isinstance(password, unicode):
+        password = password.encode("utf-8")
+    return hashlib.sha1(password).hexdigest()
+
+
+def _transport(session):
+    """ Dig the paramiko transport out of a Jaide session, if it has one.
+
+    @returns: The transport under the session's NETCONF connection, or None.
+    @rtype: paramiko.Transport
+    """
+    manager = getattr(session, '_session', None)
+    ssh_session = getattr(manager, '_session', None)
+    return getattr(ssh_session, '_transport', None)
+
+
+def is_alive(session):
+    """ Check whether a session's underlying connection is still up. """
+    transport = _transport(session)
+    if transport is None:
+        return True
+    return transport.is_active()
+
+
+def _set_keepalive(session, interval):
+    """ Have paramiko send SSH keepalives on the session, if possible. """
+    transport = _transport(session)
+    if transport is not None:
+        transport.set_keepalive(interval)
+
+
+def close_session(session):
+    """ Disconnect a session, ignoring any error doing so. """
+    try:
+        session.disconnect()
+    except Exception:
+        pass
+
+
+# The cache for this process.
+cache = SessionCache()
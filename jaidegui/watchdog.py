@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+""" Watchdog Class.
+
+Purpose: This class puts a wall clock deadline on each device of a run, so
+that one device hanging part way through a command can't hold up the rest of
+the run forever. The WorkerThread tells it when each device is handed to the
+pool and when its result comes back. Any device still going once its deadline
+has passed is handed to a callback, which records it as timed out and lets
+the run go on without it, and its result is dropped if it does turn up later.
+Devices are only handed to the pool once a worker is free to start them, see
+jaidegui.execution_pool, so the deadline isn't spent waiting for one.
+
+A task can't be taken back from a multiprocessing pool, and a thread can't be
+killed, so the stuck device is abandoned rather than stopped: its worker stays
+busy until jaide gives up on the device by itself, and the pool is given
+another worker in its place.
+
+This Class is part of the jaidegui project.
+It is free software for use in manipulating junos devices. More information can
+be found at the github page here:
+
+    https://github.com/NetworkAutomation/jaidegui
+"""
+
+import heapq
+import threading
+import time
+
+# Seconds between checks for devices past their deadline.
+CHECK_INTERVAL = 0.5
+# With an 'auto' deadline, how many session timeouts a device gets on top of
+# its connection timeout.
+SESSION_TIMEOUTS = 2
+
+
+def parse_deadline(value, conn_timeout, sess_timeout):
+    """ Work out the deadline of each device from the deadline setting.
+
+    @param value: The setting, either 'auto', a number of seconds, or 0 or
+                | 'off' for no deadline.
+    @type value: str
+    @param conn_timeout: The connection timeout, in seconds.
+    @type conn_timeout: int
+    @param sess_timeout: The session timeout, in seconds.
+    @type sess_timeout: int
+
+    @returns: The deadline in seconds, or None for no deadline.
+    @rtype: float
+
+    @raises ValueError: if the setting isn't valid.
+    """
+    value = str(value).strip().lower()
+    if value in ("", "auto"):
+        return float(conn_timeout) + float(sess_timeout) * SESSION_TIMEOUTS
+    if value in ("off", "none"):
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError("Device deadline must be 'auto', 'off' or a number "
+                         "of seconds, not '%s'." % value)
+    if seconds < 0:
+        raise ValueError("Device deadline can't be negative.")
+    return seconds or None
+
+
+class Watchdog(threading.Thread):
+
+    """ Call back for each watched task not done by its deadline. """
+
+    def __init__(self, on_expired):
+        """ Initialize the Watchdog object.
+
+        @param on_expired: Called with the key, the host and the time.time()
+                         | the task was started, for each task past its
+                         | deadline. It is called on the watchdog's own
+                         | thread.
+        @type on_expired: function
+
+        @returns: None
+        """
+        super(Watchdog, self).__init__()
+        self.daemon = True
+        self.on_expired = on_expired
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        # Maps each task being watched to its (host, started), and a heap of
+        # the (deadline, task) to check them in order.
+        self._tasks = {}
+        self._deadlines = []
+
+    def watch(self, key, host, seconds):
+        """ Start watching a task.
+
+        @param key: Identifies the task, unique within the run.
+        @param host: The IP or hostname the task is running against.
+        @type host: str
+        @param seconds: How long the task has.
+        @type seconds: float
+
+        @returns: None
+        """
+        started = time.time()
+        with self._lock:
+            self._tasks[key] = (host, started)
+            heapq.heappush(self._deadlines, (started + seconds, key))
+
+    def done(self, key):
+        """ Stop watching a task, as it has finished.
+
+        @param key: Identifies the task.
+
+        @returns: False if the task had already passed its deadline, and been
+                | handed to on_expired, otherwise True.
+        @rtype: bool
+        """
+        with self._lock:
+            return self._tasks.pop(key, None) is not None
+
+    def watching(self, key):
+        """ Check whether a task is finished or has passed its deadline. """
+        with self._lock:
+            return key in self._tasks
+
+    def run(self):
+        """ Check the deadlines until stopped.
+
+        @returns: None
+        """
+        while not self._stopped.wait(CHECK_INTERVAL):
+            now = time.time()
+            expired = []
+            with self._lock:
+                while self._deadlines and self._deadlines[0][0] <= now:
+                    deadline, key = heapq.heappop(self._deadlines)
+                    if key in self._tasks:
+                        expired.append((key,) + self._tasks.pop(key))
+            for key, host, started in expired:
+                self.on_expired(key, host, started)
+
+    def stop(self):
+        """ Stop checking the deadlines. """
+        self._stopped.set()
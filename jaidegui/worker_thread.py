@@ -2,10 +2,11 @@
 """ WorkerThread Class.
 
 Purpose: This class takes command and a queue during construction, runs the
-command with the run_jaide() function, in a mp pool for each ip. Any output is
-written to the jaidegui.gui.outputArea and potentially also to an output file,
-if the user specified so. It also provides functionality for ending the
-subprocess before completion.
+command with the run_jaide() function, in the shared ExecutionPool for each
+ip. Any output is written to the jaidegui.gui.outputArea and potentially also
+streamed to an output file by an OutputWriter, if the user specified so. It
+also provides functionality for ending the subprocess before completion, and,
+if asked to, recording a timeline of the run (see jaidegui.run_trace).
 
 The class inherits the class threading.Thread, with the purpose of overwriting
 the run() method of the standard Thread class.
@@ -17,13 +18,27 @@ be found at the github page here:
     https://github.com/NetworkAutomation/jaidegui
 """
 
+import os
 import threading
-import Queue
-import multiprocessing
-from jaide import wrap
-from jaide.color_utils import strip_color
-from jaide.utils import clean_lines
-from os import path
+import time
+import socket
+import sqlite3
+from concurrency import ConcurrencyLimiter
+import session_cache
+import preflight
+import progress
+from output_writer import open_writer
+from device_result import DeviceResult
+from run_trace import RunTrace, current_worker
+from watchdog import Watchdog, parse_deadline
+from checkpoint import Checkpoint
+import result_store
+import result_cache
+import interface_delta
+import fleet_records
+# jaide is imported where it is used, rather than here, so the GUI can import
+# this module without pulling in ncclient, paramiko and lxml before its window
+# is up. See jaidegui.jaide_loader.
 
 
 class WorkerThread(threading.Thread):
@@ -32,7 +47,11 @@ class WorkerThread(threading.Thread):
 
     def __init__(self, argsToPass, sess_timeout, conn_timeout, port, command,
                  stdout, ip, username, password, write_to_file,
-                 wtf_style):
+                 wtf_style, pool, concurrency="auto", engine="process",
+                 reuse_sessions=False, job_id=None, preflight=False,
+                 trace_file="", progress=None, deadline="auto",
+                 checkpoint_file="", record=False, operation="",
+                 use_cache=False, refresh=False, delta=False):
         """ Initialize the WorkerThread object.
 
         Purpose: The initialize function for the WorkerThread Class. The
@@ -86,6 +105,65 @@ class WorkerThread(threading.Thread):
                         | multiple, one for each host. Possible values are:
                         | ['s', 'single', 'm', 'multiple']
         @type wtf_style: str
+        @param pool: The long-lived pool owned by the GUI, which the
+                   | run_jaide() calls are submitted to. It is reused between
+                   | runs.
+        @type pool: jaidegui.execution_pool.ExecutionPool
+        @param concurrency: How many devices to have in flight at once. Either
+                          | a number, 'auto' or 'auto:<max>'. See
+                          | jaidegui.concurrency for the details.
+        @type concurrency: str
+        @param engine: Whether to run the devices on a pool of 'process'es
+                     | or 'thread's within the GUI process.
+        @type engine: str
+        @param reuse_sessions: Whether to keep device sessions open after
+                             | the run, and reuse any left open by previous
+                             | runs. Passed along to run_jaide(). Only used
+                             | with the thread engine, as each worker process
+                             | would have a session cache of its own.
+        @type reuse_sessions: bool
+        @param job_id: The id of the queued job this run is, if any. Each
+                     | result is tagged with it before it is put on stdout.
+        @type job_id: int
+        @param preflight: Whether to sweep the devices for a TCP connection
+                        | to the port first, and only run against the ones
+                        | that answered. See jaidegui.preflight.
+        @type preflight: bool
+        @param trace_file: Either an empty string, or a filepath to write a
+                         | timeline of the run to once it is done, in the
+                         | Trace Event Format. See jaidegui.run_trace.
+        @type trace_file: str
+        @param progress: A queue to put progress events on, as devices are
+                       | queued, handed to the pool and finished, if any.
+                       | See jaidegui.progress.
+        @type progress: Queue.Queue()
+        @param deadline: How long each device has, from being handed to the
+                       | pool, before it is abandoned and recorded as timed
+                       | out. Either 'auto', a number of seconds, or 'off'.
+                       | See jaidegui.watchdog.
+        @type deadline: str
+        @param checkpoint_file: Either an empty string, or the filepath of a
+                              | journal, already started, to append the
+                              | outcome of each device to. See
+                              | jaidegui.checkpoint.
+        @type checkpoint_file: str
+        @param record: Whether to record each result in the result store.
+                     | See jaidegui.result_store.
+        @type record: bool
+        @param operation: The command option being run, such as 'Device
+                        | Info', recorded with each result.
+        @type operation: str
+        @param use_cache: Whether to answer from, and add to, the cache of
+                        | recent results, if the command only reads from the
+                        | devices. See jaidegui.result_cache.
+        @type use_cache: bool
+        @param refresh: Whether to run against every device even if it has
+                      | a cached result, caching the new results.
+        @type refresh: bool
+        @param delta: Whether to report only the interface error counters
+                    | that went up since the last run, if running Interface
+                    | Errors. See jaidegui.interface_delta.
+        @type delta: bool
 
         @returns: None
         """
@@ -100,13 +178,45 @@ class WorkerThread(threading.Thread):
         self.username = username
         self.password = password
         self.write_to_file = write_to_file
-        # Set number of threads to 2x number of cores. Usually cpu_count
-        # returns twice the physical cores due to hyperthreading.
-        self.mp_pool = multiprocessing.Pool(multiprocessing.cpu_count() * 2)
-        self.wtfQueue = Queue.Queue()
+        self.mp_pool = pool
+        self.engine = engine
+        self.reuse_sessions = reuse_sessions and engine == "thread"
+        self.job_id = job_id
+        self.preflight = preflight
+        self.trace_file = trace_file
+        # The timeline of the run, and when each device was handed to the
+        # pool, if recording one.
+        self.trace = RunTrace() if trace_file else None
+        self.submitted = {}
+        self.progress = progress
+        self.deadline = parse_deadline(deadline, conn_timeout, sess_timeout)
+        self.watchdog = None
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint = None
+        self.record = record
+        self.operation = operation
+        # Groups the results of this run in the result store.
+        self.run_id = "%s-%d-%s" % (time.strftime("%Y%m%d-%H%M%S"),
+                                    os.getpid(), job_id)
+        self.delta = (delta and
+                      getattr(command, "__name__", "") == "interface_errors")
+        # A cached result would be compared with the baseline it set.
+        self.use_cache = (use_cache and not self.delta and
+                          result_cache.cacheable(command, argsToPass))
+        self.refresh = refresh
+        self.limiter = ConcurrencyLimiter(concurrency, engine)
+        # Set by kill_proc() so run() stops waiting on terminated tasks.
+        self.killed = threading.Event()
+        # Every task handed to the pool, which the JobScheduler checks have
+        # all stopped before starting a job that conflicts with this one,
+        # and the ones being watched by their watchdog key.
+        self.tasks = []
+        self.watched = {}
         self.wtf_style = wtf_style
+        # Streams the output to the file(s) during the run, if writing to file
+        self.writer = None
 
-    def write_to_queue(self, results):
+    def write_to_queue(self, result):
         """ Write script output to the queue.
 
         Purpose: This function is used for callback from pressing the 'Run
@@ -115,98 +225,312 @@ class WorkerThread(threading.Thread):
                | be showed to the user within the output area at the bottom
                | of the application.
                |
-               | The if statement will also put the outputs into the queue
-               | being watched by the 'run' function, which will output the
-               | results to the output file they specified.
+               | The if statement will also hand the result to the output
+               | writer, which appends it to the output file(s) they
+               | specified straight away.
 
-        @param results: the results that will be dropped into the output area,
-                      | and possibly also the output file, if write_to_file is
-                      | true/checked.
-        @type results: tuple, with the output string in index 1
+        @param result: the result that will be dropped into the output area,
+                     | and possibly also the output file, if write_to_file is
+                     | true/checked.
+        @type result: jaidegui.device_result.DeviceResult
 
         @returns: None
         """
-        # jaide.wrap.open_connection returns a tuple, with the second index
-        # being the output, but we strip the ANSI color codes.
-        results = strip_color(results[1])
-        self.stdout.put(results)
-        if self.write_to_file:
-            self.wtfQueue.put(results)
+        result.job = self.job_id
+        if result.records is None and result.status == DeviceResult.OK:
+            result.records = fleet_records.parse(self.command.__name__,
+                                                 result.host, result.output)
+        self.stdout.put(result)
+        self.publish(progress.FINISHED, result.status)
+        if self.checkpoint is not None:
+            self.checkpoint.record(result)
+        if self.record and not result.cached:
+            result_store.store.add(result, self.operation, self.argsToPass,
+                                   self.run_id)
+        started = time.time()
+        # run() sets the writer to None once it has closed it.
+        writer = self.writer
+        if writer is not None:
+            writer.write(result)
+        if self.trace is not None:
+            self.trace.add(result, self.submitted.get(result.host))
+            if writer is not None:
+                self.trace.span("write", started, time.time(),
+                                current_worker(), {"host": result.host})
+
+    def publish(self, kind, value=None):
+        """ Put a progress event on the progress queue, if there is one.
+
+        @param kind: One of the jaidegui.progress event kinds.
+        @type kind: str
+        @param value: The value of the event, see jaidegui.progress.
+
+        @returns: None
+        """
+        if self.progress is not None:
+            self.progress.put(progress.event(kind, self.job_id, value))
+
+    def task_done(self, result, key=None):
+        """ Callback for a single run_jaide() task.
+
+        Purpose: Hands the device back to the concurrency limiter, along with
+               | how long it took and whether it failed to connect, before
+               | writing the result out with write_to_queue(). A result
+               | arriving after the device was abandoned by the watchdog
+               | has already been recorded as timed out, and is dropped.
+
+        @param result: The result returned by run_jaide().
+        @type result: jaidegui.device_result.DeviceResult
+        @param key: The key the task was watched under, if it was.
+        @type key: int
+
+        @returns: None
+        """
+        if key is not None and not self.watchdog.done(key):
+            return
+        self.limiter.release(result.duration,
+                             result.status == DeviceResult.CONN_ERROR)
+        # This runs on the pool's result handler thread, which an exception
+        # would kill for every run sharing the pool.
+        try:
+            if self.delta and result.status == DeviceResult.OK:
+                self.compare_counters(result)
+            if self.use_cache:
+                result_cache.cache.put(self.cache_key(result.host), result,
+                                       self.command.__name__)
+            # Once stopped, results still arriving from a pool shared with
+            # other runs are dropped, as if the pool had been terminated.
+            if not self.killed.is_set():
+                self.write_to_queue(result)
+        except Exception as e:
+            self.stdout.put("Could not handle the result of %s. Error:\n%s"
+                            % (result.host, str(e)))
+
+    def compare_counters(self, result):
+        """ Replace the interface errors of a result with the counters that
+            went up since the device's baseline.
+
+        Purpose: The counters in the output become the device's new
+               | baseline, and the ones that went up are also set as the
+               | result's records. The first time, when there is no baseline
+               | to compare with, the counters are shown as they are. Output
+               | that isn't interface errors is left alone.
+
+        @param result: The result of the device.
+        @type result: jaidegui.device_result.DeviceResult
+
+        @returns: None
+        """
+        interfaces = interface_delta.parse_counters(result.output)
+        if interfaces is None:
+            return
+        try:
+            taken, rows = interface_delta.baselines.compare(
+                result.host, interfaces, result.finished)
+        except sqlite3.Error as e:
+            result.output += ("Could not compare with the baseline of the "
+                              "counters. Error:\n%s\n" % str(e))
+            return
+        header, body = interface_delta.split_header(result.output)
+        result.output = header + interface_delta.delta_report(
+            interfaces, taken, rows, result.finished)
+        if taken is None:
+            result.output += body
+        result.records = rows
+
+    def cache_key(self, ip):
+        """ Return the key of a device's result in the result cache. """
+        return result_cache.cache_key(ip, self.port, self.username,
+                                      self.command, self.argsToPass)
+
+    def task_expired(self, key, ip, started):
+        """ Record a device the watchdog gave up on as timed out.
+
+        Purpose: Called on the watchdog's thread. The device's concurrency
+               | slot is handed back, and the pool is given a worker in place
+               | of the one the device is stuck on, so the run carries on
+               | without it.
+
+        @param key: The key the task was watched under.
+        @type key: int
+        @param ip: The IP or hostname of the device.
+        @type ip: str
+        @param started: The time.time() the device was handed to the pool.
+        @type started: float
+
+        @returns: None
+        """
+        now = time.time()
+        task = self.watched.get(key)
+        if task is not None:
+            self.mp_pool.abandon(task)
+        self.limiter.release(now - started)
+        if self.killed.is_set():
+            return
+        # An exception would end the watchdog, and with it the deadline of
+        # every other device of the run.
+        try:
+            self.write_to_queue(DeviceResult(
+                ip, "=" * 50 + "\nResults from device: %s\nTimed out: no "
+                "result after %ds, the device was abandoned.\n" %
+                (ip, now - started), DeviceResult.TIMEOUT, started, now))
+        except Exception as e:
+            self.stdout.put("Could not record the timeout of %s. Error:\n%s"
+                            % (ip, str(e)))
 
     def run(self):
         """ Overwrite threading.Thread run method.
 
         Purpose: This overwrites threading.Thread's run() method. It is called
                | by doing WorkerThread.start(). The overaching goal is to
-               | open a multiprocessing pool and execute the run_jaide()
+               | reserve the shared pool and execute the run_jaide()
                | function against each IP supplied to us.
                |
                | We callback to write_to_queue() for a list of IP addresses.
-               | Once we have executed the script, we check the write_to_file
-               | parameter to see if we need to output to a file.
+               | If we are writing to a file, the writer(s) are started first
+               | so each output is written as it arrives, and it is closed
+               | once every device has finished or the script was stopped.
+               | The outcome of each device is journalled to the checkpoint
+               | in the same way, if there is one.
+               |
+               | With preflight, the devices that don't accept a connection
+               | are reported as connection errors straight away, and only
+               | the rest are handed to the pool.
+               |
+               | With a deadline, a watchdog abandons any device that is
+               | still going once it has passed, so a hung device can't
+               | keep the run from finishing.
+               |
+               | With the result cache, devices with a recent result for
+               | the same command get it straight away, without using the
+               | pool at all.
 
         @returns: None
         """
+        from jaide.utils import clean_lines
         # build the list of IPs
-        iplist = [ip for ip in clean_lines(self.ip)]
-        for ip in iplist:
-            # TODO: set back to mp_pool before finishing release. This is only set as is to receive errors.
-            # self.write_to_queue(run_jaide(ip.strip(), self.username,
-            #                               self.password, self.command,
-            #                               self.sess_timeout, self.argsToPass,
-            #                               self.conn_timeout, self.port))
-            self.mp_pool.apply_async(run_jaide, args=(ip.strip(),
-                                                      self.username,
-                                                      self.password,
-                                                      self.command,
-                                                      self.sess_timeout,
-                                                      self.argsToPass,
-                                                      self.conn_timeout,
-                                                      self.port),
-                                     callback=self.write_to_queue)
-        self.mp_pool.close()
-        self.mp_pool.join()
-
+        iplist = [ip.strip() for ip in clean_lines(self.ip)]
+        self.publish(progress.QUEUED, len(iplist))
         if self.write_to_file:
-            # Just dumping all output to a single file.
-            if self.wtf_style in ["s", "single"]:
-                try:
-                    out_file = open(self.write_to_file, "a+b")
-                except IOError as e:
-                    self.stdout.put("Could not save script output to file."
-                                    " Error:\n" + str(e))
+            self.writer = open_writer(self.write_to_file, self.wtf_style,
+                                      self.stdout)
+        if self.checkpoint_file:
+            try:
+                self.checkpoint = Checkpoint(self.checkpoint_file)
+            except IOError as e:
+                self.stdout.put("Could not open the checkpoint %s, the run "
+                                "can't be resumed. Error:\n%s" %
+                                (self.checkpoint_file, str(e)))
+        if self.preflight:
+            iplist = self.sweep(iplist)
+        try:
+            try:
+                self.mp_pool.acquire(self.limiter.limit, self.engine, self)
+            except Exception as e:
+                self.stdout.put("Could not start the workers to run the "
+                                "script. Error:\n%s" % str(e))
+                return
+            if self.deadline is not None:
+                self.watchdog = Watchdog(self.task_expired)
+                self.watchdog.start()
+            results = []
+            for key, ip in enumerate(iplist):
+                # A recent result of a read only command is used as is.
+                if self.use_cache and not self.refresh:
+                    cached = result_cache.cache.get(self.cache_key(ip))
+                    if cached is not None:
+                        self.publish(progress.STARTED, ip)
+                        self.write_to_queue(cached)
+                        continue
+                # Wait for the limiter to allow another device in flight.
+                if not self.limiter.acquire():
+                    break
+                # An adaptive limit may have gone up since the last device.
+                self.mp_pool.grow(self.limiter.limit)
+                # Hand the device over once a worker can start it, so its
+                # deadline isn't spent queued behind other runs' devices.
+                if not self.mp_pool.claim(self.killed):
+                    break
+                if self.trace is not None:
+                    self.submitted[ip] = time.time()
+                self.publish(progress.STARTED, ip)
+                if self.watchdog is not None:
+                    self.watchdog.watch(key, ip, self.deadline)
                 else:
-                    while not self.wtfQueue.empty():
-                        out_file.write(self.wtfQueue.get())
-                    self.stdout.put("\nSuccessfully appended output to: "
-                                    "%s\n" % self.write_to_file)
-            # Dump output to one file for each IP touched.
-            elif self.wtf_style in ["m", 'multiple']:
-                temp_output = ""
-                while not self.wtfQueue.empty():
-                    temp_output += self.wtfQueue.get()
-                temp_output = temp_output.split("=" * 50)
-                for x in range(1, len(temp_output)):
-                    # get each of the IP/hostnames we touched
-                    ip = temp_output[x].split('Results from device: ')[1].split('\n')[0].strip()
-                    # inject the ip into the front of the filename
-                    filepath = path.join(path.split(self.write_to_file)[0],
-                                         ip + "_" +
-                                         path.split(self.write_to_file)[1])
-                    try:
-                        out_file = open(filepath, 'a+b')
-                    # use stdout.put here instead of write_to_queue since it is
-                    # not usable after we've already written everything
-                    # to the file.
-                    except IOError as e:
-                        self.stdout.put('Error opening output file \'%s\' for'
-                                        ' writing. The Error was:\n%s' %
-                                        (filepath, str(e)))
-                    else:
-                        out_file.write(temp_output[x])
-                        self.stdout.put('\nOutput written/appended to: ' +
-                                        filepath)
-                        out_file.close()
+                    key = None
+                result = self.mp_pool.apply_async(
+                    run_jaide, args=(ip, self.username, self.password,
+                                     self.command, self.sess_timeout,
+                                     self.argsToPass, self.conn_timeout,
+                                     self.port, self.reuse_sessions),
+                    callback=lambda result, key=key:
+                    self.task_done(result, key))
+                # The pool was terminated by a Stop of this run.
+                if result is None:
+                    break
+                self.tasks.append(result)
+                if key is not None:
+                    self.watched[key] = result
+                results.append((key, result))
+            # The pool outlives this run, so instead of closing and joining it
+            # we wait on our own tasks. A Stop terminates the pool, in which
+            # case these would never become ready, and an abandoned device
+            # may never finish.
+            for key, result in results:
+                while (not result.ready() and not self.killed.is_set() and
+                       (key is None or self.watchdog.watching(key))):
+                    result.wait(0.5)
+        finally:
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            self.mp_pool.release(self)
+            # Late results from abandoned devices mustn't reach the writer
+            # once it has been closed.
+            writer, self.writer = self.writer, None
+            if writer is not None:
+                writer.close()
+            checkpoint, self.checkpoint = self.checkpoint, None
+            if checkpoint is not None:
+                checkpoint.close()
+            if self.trace is not None:
+                self.write_trace()
+
+    def write_trace(self):
+        """ Write the timeline of the run to the trace file.
+
+        @returns: None
+        """
+        try:
+            self.trace.write(self.trace_file)
+        except IOError as e:
+            self.stdout.put("Could not write the trace to %s. Error:\n%s" %
+                            (self.trace_file, str(e)))
+        else:
+            self.stdout.put("Trace of the run written to %s" %
+                            self.trace_file)
+
+    def sweep(self, iplist):
+        """ Report the devices that can't be reached, and drop them.
+
+        Purpose: The skipped devices never hold a worker or a concurrency
+               | slot, and don't count against the concurrency limiter.
+
+        @param iplist: The IPs or hostnames to sweep.
+        @type iplist: list
+
+        @returns: The IPs or hostnames that can be reached.
+        @rtype: list
+        """
+        reachable, unreachable = preflight.checker.sweep(
+            iplist, self.port, self.conn_timeout)
+        for ip in iplist:
+            if ip in unreachable:
+                now = time.time()
+                self.write_to_queue(DeviceResult(
+                    ip, "=" * 50 + "\nResults from device: %s\nSkipped by "
+                    "pre-flight check, %s\n" % (ip, unreachable[ip]),
+                    DeviceResult.CONN_ERROR, now, now))
+        return reachable
 
     def join(self, timeout=None):
         """ Join the multiprocessing pool.
@@ -223,20 +547,61 @@ class WorkerThread(threading.Thread):
         """
         super(WorkerThread, self).join(timeout)
 
-    def kill_proc(self):
+    def kill_proc(self, cancel_pool=True):
         """ Terminate the multiprocessing pool.
 
         Purpose: Provide a way to kill the subprocess from outside of the
                | thread. Terminating the pool leaves nothing left blocking
-               | self.run() so it completes and exits normally.
+               | self.run() so it completes and exits normally. The GUI's
+               | ExecutionPool will spawn a fresh pool on the next run. If
+               | other runs are using the pool it is left running, and this
+               | run simply stops waiting on its devices.
+
+        @param cancel_pool: Whether to terminate the pool if this run is
+                          | alone on it. False when every run is being
+                          | stopped, and the caller terminates the pool once
+                          | they all have been.
+        @type cancel_pool: bool
 
         @returns: None
         """
-        self.mp_pool.terminate()
+        self.killed.set()
+        self.limiter.cancel()
+        if cancel_pool:
+            self.mp_pool.cancel(self)
+
+
+# Messages jaide.wrap.open_connection() puts in the output when it couldn't
+# connect to or authenticate against a device.
+CONNECT_ERRORS = ("Unable to connect to port", "Authentication failed",
+                  "Error connecting to device", "Timeout exceeded connecting",
+                  "No route to host", "refused the connection")
+
+
+def is_connect_error(output):
+    """ Check whether the output shows a failure to connect.
+
+    Purpose: Only the line straight after the 'Results from device' header
+           | is checked, where jaide puts the error. The same words can be in
+           | the output of a command that did run, such as a ping or a
+           | traceroute reporting 'No route to host'.
+
+    @param output: The output of a run_jaide() call.
+    @type output: str
+
+    @returns: True if the device couldn't be connected to or authenticated
+            | against.
+    @rtype: bool
+    """
+    lines = output.splitlines()
+    for index, line in enumerate(lines[:-1]):
+        if "Results from device:" in line:
+            return any(error in lines[index + 1] for error in CONNECT_ERRORS)
+    return False
 
 
 def run_jaide(ip, username, password, function, sess_timeout, argsToPass,
-              conn_timeout, port):
+              conn_timeout, port, reuse_sessions=False):
     """ Run the jaide_cli script to retrieve the device output.
 
     Purpose: This function is created outside of the WorkerThread class due
@@ -267,11 +632,107 @@ def run_jaide(ip, username, password, function, sess_timeout, argsToPass,
     @type conn_timeout: int
     @param port: the port number on which to connect to the device.
     @type port: int
-
-    @returns: the output from the jaide command. It will have ANSI color
-            | in the string. These are stripped out later.
-    @rtype: str
+    @param reuse_sessions: Whether to run on a session cached by a previous
+                         | run, and cache the session afterwards.
+    @type reuse_sessions: bool
+
+    @returns: the result of the jaide command, with the ANSI color codes
+            | stripped from the output, and the time taken by each phase:
+            | 'resolve' for the DNS lookup, 'connect' for the TCP
+            | connection, SSH authentication and NETCONF hello (which jaide
+            | does all at once), 'execute' for the command itself, and
+            | 'close' for closing the session and formatting the output.
+    @rtype: jaidegui.device_result.DeviceResult
+    """
+    from jaide import wrap
+    from jaide.color_utils import strip_color
+    started = time.time()
+    status = DeviceResult.OK
+    phases = []
+
+    def phase(name):
+        """ End the current phase, which started where the last one ended. """
+        start = phases[-1][2] if phases else started
+        phases.append((name, start, time.time()))
+
+    def timed(conn, *args):
+        """ Run the jaide function, marking when it starts and ends. """
+        phase("connect")
+        try:
+            return function(conn, *args)
+        finally:
+            phase("execute")
+    try:
+        # Resolving here means jaide then gets the address from the cache.
+        try:
+            socket.getaddrinfo(ip, port, 0, socket.SOCK_STREAM)
+        except socket.error:
+            pass  # jaide will report it.
+        phase("resolve")
+        if reuse_sessions:
+            output = run_cached(ip, username, password, timed,
+                                sess_timeout, argsToPass, conn_timeout,
+                                port)[1]
+        else:
+            output = wrap.open_connection(ip, username, password, timed,
+                                          argsToPass, "", conn_timeout,
+                                          sess_timeout, port)[1]
+    # An exception raised in a pool worker never reaches the callback, which
+    # would leave the device's concurrency slot taken for the rest of the run.
+    except Exception as e:
+        status = DeviceResult.ERROR
+        output = ("=" * 50 + "\nResults from device: %s\nError running "
+                  "command: %s\n" % (ip, str(e)))
+    else:
+        # jaide only runs the function once it has connected.
+        if len(phases) < 2 and is_connect_error(output):
+            status = DeviceResult.CONN_ERROR
+    # If the function never ran, the connection is where the time went.
+    phase("close" if len(phases) > 2 else "connect")
+    return DeviceResult(ip, strip_color(output), status, started, time.time(),
+                        phases, current_worker())
+
+
+def run_cached(ip, username, password, function, sess_timeout, argsToPass,
+               conn_timeout, port):
+    """ Run the jaide command on a cached session, opening one if needed.
+
+    Purpose: If the session cache holds a live session for the device, the
+           | command is run on it directly. Otherwise the connection is
+           | opened by jaide.wrap.open_connection() as usual, and the session
+           | it opened is captured and put in the cache for the next run. The
+           | parameters are the same as run_jaide().
+
+    @returns: the output from the jaide command, in the same form as
+            | jaide.wrap.open_connection().
+    @rtype: tuple
     """
-    return wrap.open_connection(ip, username, password, function,
-                                argsToPass, "", conn_timeout,
-                                sess_timeout, port)
+    from jaide import wrap
+    cache = session_cache.cache
+    session = cache.checkout(ip, port, username, password)
+    if session is not None:
+        try:
+            output = function(session, *argsToPass)
+        except Exception:
+            # Only retry on a fresh session if this one had died, so we
+            # never run something like a commit twice.
+            alive = session_cache.is_alive(session)
+            session_cache.close_session(session)
+            if alive:
+                raise
+        else:
+            cache.checkin(ip, port, username, password, session)
+            return "", ("=" * 50 + "\nResults from device: %s\n" % ip +
+                        output)
+    opened = []
+
+    def capture(conn, *args):
+        """ Remember the session open_connection() made, then run. """
+        opened.append(conn)
+        return function(conn, *args)
+    results = wrap.open_connection(ip, username, password, capture,
+                                   argsToPass, "", conn_timeout,
+                                   sess_timeout, port)
+    if opened:
+        cache.checkin(ip, port, username, password, opened[0])
+    return results
@@ -7,7 +7,7 @@ setup(
         "py2exe": {
             "bundle_files": 3,
             #"includes": ['jaidegui\jgui_widgets.py', 'jaidegui\module_locator.py', 'jaidegui\worker_thread.py'],
-            "packages": ["Pmw", "Crypto", "lxml", "jaide", 'ncclient', 'paramiko', 'scp'],
+            "packages": ["Crypto", "lxml", "jaide", 'ncclient', 'paramiko', 'scp'],
             "compressed": True
         }
     }
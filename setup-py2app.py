@@ -7,7 +7,7 @@ Usage:
 
 
 # The command we've used to compile this application is:
-# python setup-py2app.py py2app -p "jaide,Pmw,paramiko,ncclient" -i "scp"
+# python setup-py2app.py py2app -p "jaide,paramiko,ncclient" -i "scp"
 
 from setuptools import setup
 
@@ -22,6 +22,5 @@ setup(
     setup_requires=['py2app'],
     install_requires=[
         # 'jaide>=2.0.0',
-        'Pmw>=1.3.3'
     ],
 )
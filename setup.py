@@ -66,8 +66,7 @@ setup(
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
-        'jaide>=2.0.0',
-        'Pmw>=1.3.3'
+        'jaide>=2.0.0'
     ],
 
     # List additional groups of dependencies here (e.g. development dependencies).
@@ -97,6 +96,7 @@ setup(
     entry_points={
         'console_scripts': [
             'jaidegui=jaidegui.gui:main',
+            'jaidegui-run=jaidegui.batch:main',
         ],
     },
 )